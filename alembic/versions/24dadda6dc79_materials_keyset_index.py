@@ -0,0 +1,46 @@
+"""Add material_id to the materials created_at index for keyset pagination
+
+Revision ID: 24dadda6dc79
+Revises: ae7e2a22d30c
+Create Date: 2026-10-16 11:05:39.127804
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '24dadda6dc79'
+down_revision = 'ae7e2a22d30c'
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_materials_created_at"
+
+
+def _replace_index(*columns: str) -> None:
+    # CONCURRENTLY on PostgreSQL: materials keep taking writes while the index builds
+    with op.get_context().autocommit_block():
+        op.drop_index(INDEX_NAME, table_name="materials", if_exists=True, postgresql_concurrently=True)
+        op.create_index(
+            INDEX_NAME,
+            "materials",
+            [sa.text(column) for column in columns],
+            postgresql_concurrently=True
+        )
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("materials"):
+        return
+    indexes = {index["name"]: index for index in inspector.get_indexes("materials")}
+    if INDEX_NAME in indexes and indexes[INDEX_NAME]["column_names"] == ["created_at", "material_id"]:
+        return
+
+    # material_id is the tie-breaker of list_after's (created_at, material_id) keyset
+    _replace_index("created_at DESC", "material_id DESC")
+
+
+def downgrade() -> None:
+    _replace_index("created_at DESC")
@@ -0,0 +1,54 @@
+"""Unique lower(name) indexes on constructions and materials
+
+Revision ID: 26161712b4b7
+Revises: 58d112131567
+Create Date: 2026-10-16 10:31:47.902216
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '26161712b4b7'
+down_revision = '58d112131567'
+branch_labels = None
+depends_on = None
+
+NAME_INDEXES = (
+    ("ix_constructions_name_lower", "constructions"),
+    ("ix_materials_name_lower", "materials"),
+)
+
+
+def _case_insensitive_duplicates(bind, table_name: str) -> list:
+    """Names that differ only in case; the unique index cannot be built while they exist."""
+    result = bind.execute(sa.text(
+        f"SELECT lower(name) AS name, count(*) AS row_count FROM {table_name} "
+        "GROUP BY lower(name) HAVING count(*) > 1 ORDER BY lower(name)"
+    ))
+    return [f"{row.name!r} x{row.row_count}" for row in result]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    tables = [table_name for _, table_name in NAME_INDEXES if inspector.has_table(table_name)]
+
+    # Merging or deleting rows would also touch their storage items - leave that to a person
+    duplicates = {table_name: _case_insensitive_duplicates(bind, table_name) for table_name in tables}
+    duplicates = {table_name: names for table_name, names in duplicates.items() if names}
+    if duplicates:
+        report = "; ".join(f"{table_name}: {', '.join(names)}" for table_name, names in duplicates.items())
+        raise RuntimeError(
+            f"Cannot create unique lower(name) indexes, rename or merge these rows first - {report}"
+        )
+
+    for index_name, table_name in NAME_INDEXES:
+        if table_name in tables:
+            op.create_index(index_name, table_name, [sa.text("lower(name)")], unique=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    for index_name, table_name in NAME_INDEXES:
+        op.drop_index(index_name, table_name=table_name, if_exists=True)
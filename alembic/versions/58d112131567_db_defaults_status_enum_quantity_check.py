@@ -0,0 +1,95 @@
+"""DB-side defaults, construction status enum and storage item quantity check
+
+Revision ID: 58d112131567
+Revises:
+Create Date: 2026-10-16 10:12:04.318455
+
+Tables are created by init_database (Base.metadata.create_all) with the current
+models, so on an empty database or one already created with this schema the
+steps below find nothing to do.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '58d112131567'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+STATUSES = ("active", "in_progress", "inactive", "archived", "deleted", "completed", "planned")
+construction_status = sa.Enum(*STATUSES, name="construction_status")
+
+CREATED_AT_TABLES = ("categories", "constructions", "materials", "storage_items")
+QUANTITY_CHECK = "ck_storage_items_qty_nonneg"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if not inspector.has_table("constructions"):
+        return
+
+    status_column = next(c for c in inspector.get_columns("constructions") if c["name"] == "status")
+    if not isinstance(status_column["type"], sa.Enum):
+        # Older rows were stored upper-case ("INACTIVE" was the default); anything
+        # that still is not a valid status would fail the enum cast
+        op.execute("UPDATE constructions SET status = lower(trim(status))")
+        op.execute(
+            "UPDATE constructions SET status = 'inactive' WHERE status NOT IN ({})".format(
+                ", ".join(f"'{status}'" for status in STATUSES)
+            )
+        )
+        construction_status.create(bind, checkfirst=True)
+        with op.batch_alter_table("constructions") as batch_op:
+            batch_op.alter_column(
+                "status",
+                existing_type=sa.String(20),
+                type_=construction_status,
+                existing_nullable=False,
+                server_default="inactive",
+                postgresql_using="status::construction_status"
+            )
+
+    for table_name in CREATED_AT_TABLES:
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.alter_column(
+                "created_at",
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+                server_default=sa.func.now()
+            )
+
+    check_names = {check["name"] for check in inspector.get_check_constraints("storage_items")}
+    if QUANTITY_CHECK not in check_names:
+        op.execute("UPDATE storage_items SET quantity_value = 0 WHERE quantity_value < 0")
+        with op.batch_alter_table("storage_items") as batch_op:
+            batch_op.create_check_constraint(QUANTITY_CHECK, "quantity_value >= 0")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+
+    with op.batch_alter_table("storage_items") as batch_op:
+        batch_op.drop_constraint(QUANTITY_CHECK, type_="check")
+
+    for table_name in CREATED_AT_TABLES:
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.alter_column(
+                "created_at",
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+                server_default=None
+            )
+
+    with op.batch_alter_table("constructions") as batch_op:
+        batch_op.alter_column(
+            "status",
+            existing_type=construction_status,
+            type_=sa.String(20),
+            existing_nullable=False,
+            server_default=None,
+            postgresql_using="status::text"
+        )
+    construction_status.drop(bind, checkfirst=True)
@@ -0,0 +1,46 @@
+"""created_at DESC indexes for newest-first list pages
+
+Revision ID: ae7e2a22d30c
+Revises: 26161712b4b7
+Create Date: 2026-10-16 10:48:22.550193
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'ae7e2a22d30c'
+down_revision = '26161712b4b7'
+branch_labels = None
+depends_on = None
+
+LIST_INDEXES = (
+    ("ix_categories_created_at", "categories"),
+    ("ix_constructions_created_at", "constructions"),
+    ("ix_materials_created_at", "materials"),
+)
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    tables = {table_name for _, table_name in LIST_INDEXES if inspector.has_table(table_name)}
+
+    # CONCURRENTLY on PostgreSQL: the tables keep taking writes while the indexes build.
+    # It cannot run inside a transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        for index_name, table_name in LIST_INDEXES:
+            if table_name in tables:
+                op.create_index(
+                    index_name,
+                    table_name,
+                    [sa.text("created_at DESC")],
+                    if_not_exists=True,
+                    postgresql_concurrently=True
+                )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table_name in LIST_INDEXES:
+            op.drop_index(index_name, table_name=table_name, if_exists=True, postgresql_concurrently=True)
@@ -0,0 +1,23 @@
+"""
+Konfiguracja Gunicorn dla produkcji.
+Uruchom: gunicorn main:app -c gunicorn_conf.py
+
+Każdy worker to osobny proces z własną pętlą uvloop (UvicornWorker wybiera ją
+automatycznie, gdy uvloop i httptools są zainstalowane) i własną pulą połączeń.
+Łączna liczba połączeń to workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) - musi
+zmieścić się w max_connections PostgreSQL (domyślnie 100), więc przy wielu
+workerach zmniejsz DB_POOL_SIZE.
+"""
+
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+
+# 2 * CPU + 1, chyba że podano WEB_CONCURRENCY
+workers = int(os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+worker_connections = 1000
+
+keepalive = 5
+timeout = 120
+graceful_timeout = 30
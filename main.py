@@ -4,12 +4,23 @@ Recipe AI Extractor - Main Application Entry Point
 FastAPI application with Hexagonal Architecture for recipe extraction using AI.
 """
 
+import mimetypes
+
+import httpx
+import orjson
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 
-from src.infrastructure.database.connection import init_database
+from src.infrastructure.database.connection import AsyncSessionLocal, async_engine, init_database, close_database
+from src.infrastructure.database.warmup import warm_prepared_statements
+from src.shared.config import settings, CONSTRUCTIONS_IMAGES_DIR
 from src.infrastructure.api.routes import api_router
+from src.infrastructure.api.middleware import DBSessionMiddleware, UploadSizeLimitMiddleware
+from src.application.use_cases.document_analysis_use_cases import DocumentAnalysisUseCases
 from src.infrastructure.api.error_handlers import (
     recipe_extractor_exception_handler,
     validation_exception_handler,
@@ -21,14 +32,45 @@ from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 
+# Typy MIME dla zdjęć budów - nie polegamy na systemowej bazie mimetypes
+# (np. rejestr Windows potrafi zwracać złe typy lub nie znać .webp)
+IMAGE_MEDIA_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+}
+for _ext, _media_type in IMAGE_MEDIA_TYPES.items():
+    mimetypes.add_type(_media_type, _ext)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
     await init_database()
+    # Fabryka sesji tworzona raz przy imporcie modułu - tu tylko udostępniana
+    app.state.session_factory = AsyncSessionLocal
+    if async_engine.dialect.name == "postgresql" and not settings.is_lambda:
+        # asyncpg przygotowuje zapytania per połączenie - rozgrzej pulę najczęstszymi zapytaniami
+        await warm_prepared_statements(AsyncSessionLocal, settings.db_pool_size)
+    CONSTRUCTIONS_IMAGES_DIR.mkdir(parents=True, exist_ok=True)
+    # Jeden klient HTTP (pula połączeń keep-alive) na czas życia aplikacji
+    app.state.http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        timeout=httpx.Timeout(settings.http_client_timeout_seconds, connect=5.0)
+    )
+    # Use case'y bez stanu per-request tworzone raz na czas życia aplikacji
+    app.state.document_analysis_use_cases = (
+        DocumentAnalysisUseCases(http_client=app.state.http_client)
+        if settings.openai_api_key else None
+    )
     yield
     # Shutdown
-    pass
+    app.state.document_analysis_use_cases = None
+    await app.state.http_client.aclose()
+    await close_database()
 
 
 def create_app() -> FastAPI:
@@ -38,7 +80,18 @@ def create_app() -> FastAPI:
         title="Construction Manager",
         description="Backend API for managing construction projects with Hexagonal Architecture",
         version="1.0.0",
-        lifespan=lifespan
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse
+    )
+    
+    # Jedna sesja bazy na żądanie API (udostępniana przez ContextVar)
+    app.add_middleware(DBSessionMiddleware, path_prefix="/api/")
+    
+    # Limit rozmiaru uploadów zdjęć (base64 jest ~4/3 większy, plus narzut formularza)
+    app.add_middleware(
+        UploadSizeLimitMiddleware,
+        max_body_size=settings.max_upload_size_mb * 1024 * 1024 * 4 // 3 + 64 * 1024,
+        path_suffixes=("/with-image", "/upload-image")
     )
     
     # CORS Configuration
@@ -53,6 +106,13 @@ def create_app() -> FastAPI:
     # Include API routes
     app.include_router(api_router, prefix="/api/v1")
     
+    # Static construction images (katalog tworzony w lifespan, stąd check_dir=False)
+    app.mount(
+        "/api/v1/constructions/images",
+        StaticFiles(directory=CONSTRUCTIONS_IMAGES_DIR, check_dir=False),
+        name="construction-images"
+    )
+    
     # Add exception handlers
     app.add_exception_handler(RecipeExtractorException, recipe_extractor_exception_handler)
     app.add_exception_handler(RequestValidationError, validation_exception_handler)
@@ -76,10 +136,13 @@ async def root():
     }
 
 
+_HEALTH_BYTES = orjson.dumps({"status": "healthy"})
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 if __name__ == "__main__":
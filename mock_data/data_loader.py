@@ -18,7 +18,6 @@ from src.infrastructure.database.models import (
     CategoryModel,
     ConstructionModel,
     MaterialModel,
-    StorageModel,
     StorageItemModel,
     ConstructionStatus,
     UnitEnum
@@ -43,7 +42,6 @@ class MockDataLoader:
         self._load_categories()
         self._load_constructions()
         self._load_materials()
-        self._load_storages()
         self._load_storage_items()
         
         print("✅ Mock data załadowane pomyślnie!")
@@ -97,36 +95,30 @@ class MockDataLoader:
         self.db_session.commit()
         print(f"✅ Załadowano {len(materials_data)} materiałów")
     
-    def _load_storages(self) -> None:
-        """Load storages from JSON."""
-        storages_data = self._load_json_file("storages.json")
-        
-        for storage_data in storages_data:
-            storage = StorageModel(
-                storage_id=UUID(storage_data["id"]),
-                construction_id=UUID(storage_data["construction_id"]),
-                name=storage_data["name"],
-                created_at=datetime.fromisoformat(storage_data["created_at"].replace("Z", "+00:00"))
-            )
-            self.db_session.add(storage)
-        
-        self.db_session.commit()
-        print(f"✅ Załadowano {len(storages_data)} magazynów")
-    
     def _load_storage_items(self) -> None:
-        """Load storage items from JSON."""
+        """Load storage items from JSON (storages.json maps each storage to its construction)."""
+        construction_by_storage = {
+            storage_data["id"]: UUID(storage_data["construction_id"])
+            for storage_data in self._load_json_file("storages.json")
+        }
         storage_items_data = self._load_json_file("storage_items.json")
         
+        # Stany magazynowe są per budowa - ten sam materiał z kilku magazynów jednej budowy sumujemy
+        quantities: Dict[tuple, Decimal] = {}
         for item_data in storage_items_data:
+            key = (construction_by_storage[item_data["storage_id"]], UUID(item_data["material_id"]))
+            quantities[key] = quantities.get(key, Decimal("0")) + Decimal(str(item_data["quantity_value"]))
+        
+        for (construction_id, material_id), quantity_value in quantities.items():
             storage_item = StorageItemModel(
-                storage_id=UUID(item_data["storage_id"]),
-                material_id=UUID(item_data["material_id"]),
-                quantity_value=Decimal(str(item_data["quantity_value"]))
+                construction_id=construction_id,
+                material_id=material_id,
+                quantity_value=quantity_value
             )
             self.db_session.add(storage_item)
         
         self.db_session.commit()
-        print(f"✅ Załadowano {len(storage_items_data)} pozycji magazynowych")
+        print(f"✅ Załadowano {len(quantities)} pozycji magazynowych")
     
     def _load_json_file(self, filename: str) -> List[Dict[str, Any]]:
         """Load JSON data from file."""
@@ -141,7 +133,6 @@ class MockDataLoader:
         
         # Delete in reverse order (respecting foreign keys)
         self.db_session.query(StorageItemModel).delete()
-        self.db_session.query(StorageModel).delete()
         self.db_session.query(MaterialModel).delete()
         self.db_session.query(ConstructionModel).delete()
         self.db_session.query(CategoryModel).delete()
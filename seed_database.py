@@ -12,7 +12,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from mock_data.data_loader import load_mock_data, reset_mock_data
-from src.infrastructure.database.connection import init_database
+from src.infrastructure.database.connection import init_database, close_database
 import asyncio
 
 
@@ -20,6 +20,7 @@ async def setup_database():
     """Initialize database tables."""
     print("🔧 Inicjalizacja bazy danych...")
     await init_database()
+    await close_database()
     print("✅ Baza danych zainicjalizowana")
 
 
@@ -5,7 +5,7 @@ Category DTOs for Application Layer.
 from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CategoryCreateDTO(BaseModel):
@@ -24,9 +24,8 @@ class CategoryResponseDTO(BaseModel):
     name: str = Field(..., description="Category name")
     created_at: datetime = Field(..., description="Creation timestamp")
     
-    class Config:
-        """Enables to create instances from SQLAlchemy models."""
-        from_attributes = True 
+    # Enables to create instances from SQLAlchemy models
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CategoryListResponseDTO(BaseModel):
@@ -5,7 +5,7 @@ Construction DTOs for Application Layer.
 from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from src.domain.value_objects.construction_status import ConstructionStatus
 
 
@@ -43,9 +43,8 @@ class ConstructionResponseDTO(BaseModel):
     img_url: Optional[str] = Field(None, description="Construction image URL")
     created_at: datetime = Field(..., description="Creation timestamp")
     
-    class Config:
-        """Enables to create instances from SQLAlchemy models."""
-        from_attributes = True 
+    # Enables to create instances from SQLAlchemy models
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ConstructionListResponseDTO(BaseModel):
@@ -73,7 +72,6 @@ class ConstructionStatisticsDTO(BaseModel):
     measured_at: datetime = Field(..., description="Measurement timestamp")
     last_sync_at: datetime = Field(..., description="Last synchronization timestamp")
 
-    class Config:
-        """Enables to create instances from SQLAlchemy models."""
-        from_attributes = True
+    # Enables to create instances from SQLAlchemy models
+    model_config = ConfigDict(from_attributes=True)
 
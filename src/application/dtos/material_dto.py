@@ -5,7 +5,7 @@ Material DTOs for Application Layer.
 from datetime import datetime
 from typing import Optional, List, Union
 from uuid import UUID
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from src.domain.value_objects.unit_enum import UnitEnum
 
 
@@ -59,9 +59,8 @@ class MaterialResponseDTO(BaseModel):
     unit: UnitEnum = Field(..., description="Material unit")
     created_at: datetime = Field(..., description="Creation timestamp")
     
-    class Config:
-        """Enables to create instances from SQLAlchemy models."""
-        from_attributes = True
+    # Enables to create instances from SQLAlchemy models
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MaterialListResponseDTO(BaseModel):
@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
 from decimal import Decimal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class StorageItemCreateDTO(BaseModel):
@@ -28,9 +28,8 @@ class StorageItemResponseDTO(BaseModel):
     quantity_value: Decimal = Field(..., description="Quantity value")
     created_at: datetime = Field(..., description="Creation timestamp")
     
-    class Config:
-        """Enables to create instances from SQLAlchemy models."""
-        from_attributes = True 
+    # Enables to create instances from SQLAlchemy models
+    model_config = ConfigDict(from_attributes=True)
 
 
 class StorageItemListResponseDTO(BaseModel):
@@ -52,9 +51,8 @@ class StorageItemMaterialDTO(BaseModel):
     quantity_value: Decimal = Field(..., description="Quantity value in storage")
     created_at: datetime = Field(..., description="Creation timestamp")
     
-    class Config:
-        """Enables to create instances from SQLAlchemy models."""
-        from_attributes = True
+    # Enables to create instances from SQLAlchemy models
+    model_config = ConfigDict(from_attributes=True)
 
 
 class StorageItemMaterialListResponseDTO(BaseModel):
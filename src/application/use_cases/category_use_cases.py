@@ -20,6 +20,8 @@ from src.shared.exceptions import EntityNotFoundError, ValidationError
 class CategoryUseCases:
     """Category use cases implementation."""
     
+    __slots__ = ("_category_repository",)
+    
     def __init__(self, category_repository: CategoryRepository):
         self._category_repository = category_repository
     
@@ -80,8 +82,7 @@ class CategoryUseCases:
     
     async def list_all_categories(self, limit: int = 100, offset: int = 0) -> CategoryListResponseDTO:
         """List all categories."""
-        categories = await self._category_repository.list_all(limit=limit, offset=offset)
-        total = await self._category_repository.count_all()
+        categories, total = await self._category_repository.list_with_count(limit=limit, offset=offset)
         
         return CategoryListResponseDTO(
             categories=[
@@ -99,14 +100,12 @@ class CategoryUseCases:
     
     async def search_categories(self, search_dto: CategorySearchDTO) -> CategoryListResponseDTO:
         """Search categories by name."""
-        categories = await self._category_repository.search_by_name(
+        categories, total = await self._category_repository.search_by_name_with_count(
             name=search_dto.query,
             limit=search_dto.size,
             offset=(search_dto.page - 1) * search_dto.size
         )
         
-        total = len(categories)
-        
         return CategoryListResponseDTO(
             categories=[
                 CategoryResponseDTO(
@@ -23,14 +23,15 @@ from src.shared.exceptions import EntityNotFoundError, ValidationError
 class ConstructionUseCases:
     """Construction use cases implementation."""
     
+    __slots__ = ("_construction_repository",)
+    
     def __init__(self, construction_repository: ConstructionRepository):
         self._construction_repository = construction_repository
     
     async def create_construction(self, construction_dto: ConstructionCreateDTO) -> ConstructionResponseDTO:
         """Create a new construction."""
         # Check if construction with this name already exists
-        existing_construction = await self._construction_repository.get_by_name(construction_dto.name)
-        if existing_construction:
+        if await self._construction_repository.exists_by_name(construction_dto.name):
             raise ValidationError(f"Construction with name '{construction_dto.name}' already exists in the database")
         
         # Create domain entity
@@ -75,6 +76,10 @@ class ConstructionUseCases:
             created_at=construction.created_at
         )
     
+    async def construction_exists(self, construction_id: UUID) -> bool:
+        """Check whether construction exists (without loading it)."""
+        return await self._construction_repository.exists(construction_id)
+    
     async def update_construction(self, construction_id: UUID, construction_dto: ConstructionUpdateDTO) -> ConstructionResponseDTO:
         """Update construction."""
         construction = await self._construction_repository.get_by_id(construction_id)
@@ -84,8 +89,7 @@ class ConstructionUseCases:
         # Update fields if provided
         if construction_dto.name is not None:
             # Check if another construction with this name already exists
-            existing_construction = await self._construction_repository.get_by_name(construction_dto.name)
-            if existing_construction and existing_construction.id != construction_id:
+            if await self._construction_repository.exists_by_name(construction_dto.name, exclude_id=construction_id):
                 raise ValidationError(f"Construction with name '{construction_dto.name}' already exists in the database")
             construction._name = construction_dto.name.strip()
         
@@ -128,8 +132,7 @@ class ConstructionUseCases:
     
     async def list_all_constructions(self, limit: int = 100, offset: int = 0) -> ConstructionListResponseDTO:
         """List all constructions."""
-        constructions = await self._construction_repository.list_all(limit=limit, offset=offset)
-        total = await self._construction_repository.count_all()
+        constructions, total = await self._construction_repository.list_with_count(limit=limit, offset=offset)
         
         return ConstructionListResponseDTO(
             constructions=[
@@ -152,22 +155,14 @@ class ConstructionUseCases:
     
     async def search_constructions(self, search_dto: ConstructionSearchDTO) -> ConstructionListResponseDTO:
         """Search constructions by name and optionally filter by status."""
-        # Search by name
-        constructions = await self._construction_repository.search_by_name(
+        # Search by name (status filter and total are handled by the repository)
+        constructions, total = await self._construction_repository.search_by_name_with_count(
             name=search_dto.query,
             limit=search_dto.size,
-            offset=(search_dto.page - 1) * search_dto.size
+            offset=(search_dto.page - 1) * search_dto.size,
+            status=search_dto.status
         )
         
-        # Filter by status if provided
-        if search_dto.status:
-            constructions = [
-                c for c in constructions 
-                if ConstructionStatus(c.status) == search_dto.status
-            ]
-        
-        total = len(constructions)
-        
         return ConstructionListResponseDTO(
             constructions=[
                 ConstructionResponseDTO(
@@ -187,9 +182,18 @@ class ConstructionUseCases:
             size=search_dto.size
         )
     
-    async def get_statistics(self, from_date: Optional[datetime] = None) -> List[ConstructionStatisticsDTO]:
-        """Get statistics for all constructions."""
-        statistics = await self._construction_repository.get_statistics(from_date=from_date)
+    async def get_statistics(
+        self,
+        from_date: Optional[datetime] = None,
+        limit: int = 1000,
+        offset: int = 0
+    ) -> List[ConstructionStatisticsDTO]:
+        """Get statistics for constructions (paginated, ordered by name)."""
+        statistics = await self._construction_repository.get_statistics(
+            from_date=from_date,
+            limit=limit,
+            offset=offset
+        )
         
         return [
             ConstructionStatisticsDTO(
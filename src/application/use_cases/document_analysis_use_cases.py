@@ -2,13 +2,15 @@
 Document Analysis Use Cases for Application Layer.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from uuid import UUID
+import asyncio
 import base64
 import json
 
 import fitz  # PyMuPDF
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI
 from src.shared.config import settings
 from src.shared.exceptions import ValidationError
 
@@ -79,10 +81,16 @@ Ważne - interpretacja kolumn i danych:
 
 Odpowiedź powinna być wyłącznie w formacie JSON, bez dodatkowych komentarzy."""
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        """
+        Initialize the OpenAI client.
+        
+        Args:
+            http_client: Shared HTTP client (connection pool) owned by the application
+        """
         if not settings.openai_api_key:
             raise ValueError("OpenAI API key is not configured")
-        self._client = OpenAI(api_key=settings.openai_api_key)
+        self._client = AsyncOpenAI(api_key=settings.openai_api_key, http_client=http_client)
     
     async def analyze_document(
         self, 
@@ -164,23 +172,26 @@ Odpowiedź powinna być wyłącznie w formacie JSON, bez dodatkowych komentarzy.
             total_pages = len(pdf_document)
             all_materials = []
             
-            # Process each page
-            for page_num in range(total_pages):
-                page = pdf_document[page_num]
-                
-                # Convert page to image (PNG format)
-                # Using zoom factor of 2.0 for better quality
-                mat = fitz.Matrix(2.0, 2.0)
-                pix = page.get_pixmap(matrix=mat)
-                img_bytes = pix.tobytes("png")
-                
-                # Analyze this page
-                page_result = await self._analyze_image_page(
-                    img_bytes,
-                    page_num + 1,
-                    total_pages
-                )
-                
+            # Render pages first; fitz is synchronous and not safe to share across tasks
+            mat = fitz.Matrix(2.0, 2.0)  # Zoom factor of 2.0 for better quality
+            page_images = [
+                pdf_document[page_num].get_pixmap(matrix=mat).tobytes("png")
+                for page_num in range(total_pages)
+            ]
+            
+            # Pages are independent, so Vision API calls overlap (bounded by a semaphore)
+            semaphore = asyncio.Semaphore(max(1, settings.pdf_page_concurrency))
+            
+            async def analyze_page(page_num: int, img_bytes: bytes) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self._analyze_image_page(img_bytes, page_num + 1, total_pages)
+            
+            # gather keeps page order, so materials stay in document order
+            page_results = await asyncio.gather(
+                *(analyze_page(page_num, img_bytes) for page_num, img_bytes in enumerate(page_images))
+            )
+            
+            for page_result in page_results:
                 # Collect materials from this page
                 if "materials" in page_result:
                     all_materials.extend(page_result["materials"])
@@ -221,7 +232,7 @@ Odpowiedź powinna być wyłącznie w formacie JSON, bez dodatkowych komentarzy.
         """
         try:
             # Call OpenAI Vision API
-            response = self._client.chat.completions.create(
+            response = await self._client.chat.completions.create(
                 model="gpt-4o",  # Using gpt-4o which supports vision
                 messages=[
                     {
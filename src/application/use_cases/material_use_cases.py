@@ -2,8 +2,10 @@
 Material Use Cases for Application Layer.
 """
 
-from typing import List
+from collections import Counter
+from typing import List, Optional
 from uuid import UUID
+from datetime import datetime
 
 from src.domain.entities.materials import Materials
 from src.domain.repositories.material_repository import MaterialRepository
@@ -21,14 +23,15 @@ from src.shared.exceptions import EntityNotFoundError, ValidationError
 class MaterialUseCases:
     """Material use cases implementation."""
     
+    __slots__ = ("_material_repository",)
+    
     def __init__(self, material_repository: MaterialRepository):
         self._material_repository = material_repository
     
     async def create_material(self, material_dto: MaterialCreateDTO) -> MaterialResponseDTO:
         """Create a new material."""
         # Check if material with this name already exists
-        existing_material = await self._material_repository.get_by_name(material_dto.name)
-        if existing_material:
+        if await self._material_repository.exists_by_name(material_dto.name):
             raise ValidationError(f"Material with name '{material_dto.name}' already exists in the database")
         
         # Create domain entity
@@ -53,18 +56,19 @@ class MaterialUseCases:
     
     async def create_materials_bulk(self, material_dtos: List[MaterialCreateDTO]) -> List[MaterialResponseDTO]:
         """Create multiple materials at once."""
-        # Check for duplicates in the list
+        # Check for duplicates in the list (names are unique case-insensitively)
         names = [dto.name for dto in material_dtos]
-        duplicates = [name for name in names if names.count(name) > 1]
+        lowered = [name.lower() for name in names]
+        # One counting pass - payloads can be large enough for the COPY path
+        counts = Counter(lowered)
+        duplicates = dict.fromkeys(name for name, key in zip(names, lowered) if counts[key] > 1)
         if duplicates:
-            raise ValidationError(f"Duplicate names in materials list: {', '.join(set(duplicates))}")
+            raise ValidationError(f"Duplicate names in materials list: {', '.join(duplicates)}")
         
-        # Check if any of the materials already exist in the database
-        existing_names = []
-        for material_dto in material_dtos:
-            existing_material = await self._material_repository.get_by_name(material_dto.name)
-            if existing_material:
-                existing_names.append(material_dto.name)
+        # Check if any of the materials already exist in the database (single query)
+        existing_materials = await self._material_repository.get_by_names(names)
+        existing_lower = {material.name.lower() for material in existing_materials}
+        existing_names = [name for name in names if name.lower() in existing_lower]
         
         if existing_names:
             raise ValidationError(f"Materials with the following names already exist in the database: {', '.join(existing_names)}")
@@ -95,6 +99,22 @@ class MaterialUseCases:
             for material in created_materials
         ]
     
+    async def get_materials_by_names(self, names: List[str]) -> List[MaterialResponseDTO]:
+        """Get materials matching any of the given names (case-insensitive)."""
+        materials = await self._material_repository.get_by_names(names)
+        
+        return [
+            MaterialResponseDTO(
+                material_id=material.id,
+                category_id=material.category_id,
+                name=material.name,
+                description=material.description,
+                unit=material.unit,
+                created_at=material.created_at
+            )
+            for material in materials
+        ]
+    
     async def get_material_by_id(self, material_id: UUID) -> MaterialResponseDTO:
         """Get material by ID."""
         material = await self._material_repository.get_by_id(material_id)
@@ -121,6 +141,9 @@ class MaterialUseCases:
             material._category_id = material_dto.category_id
         
         if material_dto.name is not None:
+            # Check if another material with this name already exists
+            if await self._material_repository.exists_by_name(material_dto.name, exclude_id=material_id):
+                raise ValidationError(f"Material with name '{material_dto.name}' already exists in the database")
             material._name = material_dto.name.strip()
         
         if material_dto.description is not None:
@@ -151,8 +174,7 @@ class MaterialUseCases:
     
     async def list_all_materials(self, limit: int = 100, offset: int = 0) -> MaterialListResponseDTO:
         """List all materials."""
-        materials = await self._material_repository.list_all(limit=limit, offset=offset)
-        total = await self._material_repository.count_all()
+        materials, total = await self._material_repository.list_with_count(limit=limit, offset=offset)
         
         return MaterialListResponseDTO(
             materials=[
@@ -171,10 +193,33 @@ class MaterialUseCases:
             size=limit
         )
     
+    async def list_materials_after(
+        self,
+        after_created_at: Optional[datetime] = None,
+        after_id: Optional[UUID] = None,
+        limit: int = 100
+    ) -> List[MaterialResponseDTO]:
+        """List materials newest first, after the given cursor (keyset pagination)."""
+        if (after_created_at is None) != (after_id is None):
+            raise ValidationError("Cursor requires both after_created_at and after_id")
+        cursor = (after_created_at, after_id) if after_id is not None else None
+        materials = await self._material_repository.list_after(cursor, limit=limit)
+        
+        return [
+            MaterialResponseDTO(
+                material_id=material.id,
+                category_id=material.category_id,
+                name=material.name,
+                description=material.description,
+                unit=material.unit,
+                created_at=material.created_at
+            )
+            for material in materials
+        ]
+    
     async def get_materials_by_category(self, category_id: UUID, limit: int = 100, offset: int = 0) -> MaterialListResponseDTO:
         """Get materials by category."""
-        materials = await self._material_repository.get_by_category_id(category_id, limit=limit, offset=offset)
-        total = len(materials)  # Można dodać count_by_category_id jeśli potrzebne
+        materials, total = await self._material_repository.get_by_category_id_with_count(category_id, limit=limit, offset=offset)
         
         return MaterialListResponseDTO(
             materials=[
@@ -195,22 +240,14 @@ class MaterialUseCases:
     
     async def search_materials(self, search_dto: MaterialSearchDTO) -> MaterialListResponseDTO:
         """Search materials by name and optionally filter by category."""
-        # Search by name
-        materials = await self._material_repository.search_by_name(
+        # Search by name (category filter and total are handled by the repository)
+        materials, total = await self._material_repository.search_by_name_with_count(
             name=search_dto.query,
             limit=search_dto.size,
-            offset=(search_dto.page - 1) * search_dto.size
+            offset=(search_dto.page - 1) * search_dto.size,
+            category_id=search_dto.category_id
         )
         
-        # Filter by category if provided
-        if search_dto.category_id:
-            materials = [
-                m for m in materials 
-                if m.category_id == search_dto.category_id
-            ]
-        
-        total = len(materials)
-        
         return MaterialListResponseDTO(
             materials=[
                 MaterialResponseDTO(
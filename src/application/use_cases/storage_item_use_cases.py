@@ -22,6 +22,8 @@ from src.shared.exceptions import EntityNotFoundError, ValidationError
 class StorageItemUseCases:
     """StorageItem use cases implementation."""
     
+    __slots__ = ("_storage_item_repository",)
+    
     def __init__(self, storage_item_repository: StorageItemRepository):
         self._storage_item_repository = storage_item_repository
     
@@ -114,7 +116,7 @@ class StorageItemUseCases:
         offset: int = 0
     ) -> StorageItemListResponseDTO:
         """Get storage items by construction ID."""
-        storage_items = await self._storage_item_repository.get_by_construction_id(
+        storage_items, total = await self._storage_item_repository.get_by_construction_id_with_count(
             construction_id=construction_id,
             limit=limit,
             offset=offset
@@ -130,7 +132,7 @@ class StorageItemUseCases:
                 )
                 for storage_item in storage_items
             ],
-            total=len(storage_items),
+            total=total,
             page=(offset // limit) + 1 if limit > 0 else 1,
             size=limit
         )
@@ -142,7 +144,7 @@ class StorageItemUseCases:
         offset: int = 0
     ) -> StorageItemListResponseDTO:
         """Get storage items by material ID."""
-        storage_items = await self._storage_item_repository.get_by_material_id(
+        storage_items, total = await self._storage_item_repository.get_by_material_id_with_count(
             material_id=material_id,
             limit=limit,
             offset=offset
@@ -158,7 +160,7 @@ class StorageItemUseCases:
                 )
                 for storage_item in storage_items
             ],
-            total=len(storage_items),
+            total=total,
             page=(offset // limit) + 1 if limit > 0 else 1,
             size=limit
         )
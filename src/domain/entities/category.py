@@ -11,6 +11,8 @@ from src.shared.exceptions import ValidationError
 class Category:
     """Category domain entity."""
     
+    __slots__ = ("_id", "_name", "_created_at")
+    
     def __init__(
         self,
         category_id: Optional[UUID] = None,
@@ -13,6 +13,8 @@ from src.domain.value_objects.construction_status import ConstructionStatus
 class Construction:
     """Construction domain entity."""
     
+    __slots__ = ("_id", "_name", "_description", "_address", "_start_date", "_status", "_img_url", "_created_at")
+    
     def __init__(
         self,
         construction_id: Optional[UUID] = None,
@@ -12,6 +12,8 @@ from src.domain.value_objects.unit_enum import UnitEnum
 class Materials:
     """Materials domain entity."""
     
+    __slots__ = ("_id", "_category_id", "_name", "_description", "_unit", "_created_at")
+    
     def __init__(
         self,
         material_id: Optional[UUID] = None,
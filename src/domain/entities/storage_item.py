@@ -13,6 +13,8 @@ from src.shared.exceptions import ValidationError
 class StorageItem:
     """StorageItem domain entity."""
     
+    __slots__ = ("_construction_id", "_material_id", "_quantity_value", "_created_at")
+    
     def __init__(
         self,
         construction_id: UUID,
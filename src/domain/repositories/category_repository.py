@@ -3,7 +3,7 @@ Category Repository Interface (Port).
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 from src.domain.entities.category import Category
@@ -12,6 +12,8 @@ from src.domain.entities.category import Category
 class CategoryRepository(ABC):
     """Category repository interface."""
     
+    __slots__ = ()
+    
     @abstractmethod
     async def create(self, category: Category) -> Category:
         """Create a new category."""
@@ -22,6 +24,11 @@ class CategoryRepository(ABC):
         """Get category by ID."""
         pass
     
+    @abstractmethod
+    async def get_many_by_ids(self, category_ids: List[UUID]) -> Dict[UUID, Category]:
+        """Get categories by IDs in one query; missing IDs are absent from the result."""
+        pass
+    
     @abstractmethod
     async def update(self, category: Category) -> Category:
         """Update existing category."""
@@ -37,11 +44,21 @@ class CategoryRepository(ABC):
         """List all categories with pagination."""
         pass
     
+    @abstractmethod
+    async def list_with_count(self, limit: int = 100, offset: int = 0) -> Tuple[List[Category], int]:
+        """List categories with pagination and return the page with the total count."""
+        pass
+    
     @abstractmethod
     async def search_by_name(self, name: str, limit: int = 100, offset: int = 0) -> List[Category]:
         """Search categories by name."""
         pass
     
+    @abstractmethod
+    async def search_by_name_with_count(self, name: str, limit: int = 100, offset: int = 0) -> Tuple[List[Category], int]:
+        """Search categories by name and return the page with the total number of matches."""
+        pass
+    
     @abstractmethod
     async def count_all(self) -> int:
         """Count total number of categories."""
@@ -3,17 +3,20 @@ Construction Repository Interface (Port).
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 from datetime import datetime
 
 from src.domain.entities.construction import Construction
+from src.domain.value_objects.construction_status import ConstructionStatus
 
 
 
 class ConstructionRepository(ABC):
     """Construction repository interface."""
     
+    __slots__ = ()
+    
     @abstractmethod
     async def create(self, construction: Construction) -> Construction:
         """Create a new construction."""
@@ -24,6 +27,16 @@ class ConstructionRepository(ABC):
         """Get construction by ID."""
         pass
     
+    @abstractmethod
+    async def get_many_by_ids(self, construction_ids: List[UUID]) -> Dict[UUID, Construction]:
+        """Get constructions by IDs in one query; missing IDs are absent from the result."""
+        pass
+    
+    @abstractmethod
+    async def exists(self, construction_id: UUID) -> bool:
+        """Check whether construction with given ID exists."""
+        pass
+    
     @abstractmethod
     async def update(self, construction: Construction) -> Construction:
         """Update existing construction."""
@@ -39,11 +52,32 @@ class ConstructionRepository(ABC):
         """List all constructions with pagination."""
         pass
     
+    @abstractmethod
+    async def list_with_count(self, limit: int = 100, offset: int = 0) -> Tuple[List[Construction], int]:
+        """List constructions with pagination and return the page with the total count."""
+        pass
+    
     @abstractmethod
     async def search_by_name(self, name: str, limit: int = 100, offset: int = 0) -> List[Construction]:
         """Search constructions by name."""
         pass
     
+    @abstractmethod
+    async def search_by_name_with_count(
+        self,
+        name: str,
+        limit: int = 100,
+        offset: int = 0,
+        status: Optional[ConstructionStatus] = None
+    ) -> Tuple[List[Construction], int]:
+        """Search constructions by name (optionally by status) and return the page with the total number of matches."""
+        pass
+    
+    @abstractmethod
+    async def exists_by_name(self, name: str, exclude_id: Optional[UUID] = None) -> bool:
+        """Check whether a construction with given name exists (case-insensitive)."""
+        pass
+    
     @abstractmethod
     async def get_by_name(self, name: str) -> Optional[Construction]:
         """Get construction by exact name match (case-insensitive)."""
@@ -55,6 +89,11 @@ class ConstructionRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_statistics(self, from_date: Optional[datetime] = None) -> List[dict]:
-        """Get statistics for all constructions."""
+    async def get_statistics(
+        self,
+        from_date: Optional[datetime] = None,
+        limit: int = 1000,
+        offset: int = 0
+    ) -> List[dict]:
+        """Get statistics for constructions (paginated, ordered by name)."""
         pass
\ No newline at end of file
@@ -3,8 +3,9 @@ Material Repository Interface (Port).
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
+from datetime import datetime
 
 from src.domain.entities.materials import Materials
 
@@ -12,6 +13,8 @@ from src.domain.entities.materials import Materials
 class MaterialRepository(ABC):
     """Material repository interface."""
     
+    __slots__ = ()
+    
     @abstractmethod
     async def create(self, material: Materials) -> Materials:
         """Create a new material."""
@@ -27,6 +30,11 @@ class MaterialRepository(ABC):
         """Get material by ID."""
         pass
     
+    @abstractmethod
+    async def get_many_by_ids(self, material_ids: List[UUID]) -> Dict[UUID, Materials]:
+        """Get materials by IDs in one query; missing IDs are absent from the result."""
+        pass
+    
     @abstractmethod
     async def update(self, material: Materials) -> Materials:
         """Update existing material."""
@@ -42,16 +50,42 @@ class MaterialRepository(ABC):
         """List all materials with pagination."""
         pass
     
+    @abstractmethod
+    async def list_with_count(self, limit: int = 100, offset: int = 0) -> Tuple[List[Materials], int]:
+        """List materials with pagination and return the page with the total count."""
+        pass
+    
+    @abstractmethod
+    async def list_after(self, cursor: Optional[Tuple[datetime, UUID]], limit: int = 100) -> List[Materials]:
+        """List materials newest first, starting after the (created_at, material_id) cursor."""
+        pass
+    
     @abstractmethod
     async def get_by_category_id(self, category_id: UUID, limit: int = 100, offset: int = 0) -> List[Materials]:
         """Get materials by category ID."""
         pass
     
+    @abstractmethod
+    async def get_by_category_id_with_count(self, category_id: UUID, limit: int = 100, offset: int = 0) -> Tuple[List[Materials], int]:
+        """Get materials by category ID and return the page with the total count."""
+        pass
+    
     @abstractmethod
     async def search_by_name(self, name: str, limit: int = 100, offset: int = 0) -> List[Materials]:
         """Search materials by name."""
         pass
     
+    @abstractmethod
+    async def search_by_name_with_count(
+        self,
+        name: str,
+        limit: int = 100,
+        offset: int = 0,
+        category_id: Optional[UUID] = None
+    ) -> Tuple[List[Materials], int]:
+        """Search materials by name (optionally within a category) and return the page with the total number of matches."""
+        pass
+    
     @abstractmethod
     async def count_all(self) -> int:
         """Count total number of materials."""
@@ -62,8 +96,18 @@ class MaterialRepository(ABC):
         """Get materials by construction ID (through storages)."""
         pass
     
+    @abstractmethod
+    async def exists_by_name(self, name: str, exclude_id: Optional[UUID] = None) -> bool:
+        """Check whether a material with given name exists (case-insensitive)."""
+        pass
+    
     @abstractmethod
     async def get_by_name(self, name: str) -> Optional[Materials]:
         """Get material by exact name match (case-insensitive)."""
         pass
+    
+    @abstractmethod
+    async def get_by_names(self, names: List[str]) -> List[Materials]:
+        """Get materials matching any of the given names (case-insensitive)."""
+        pass
 
@@ -3,7 +3,7 @@ StorageItem Repository Interface (Port).
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from src.domain.entities.storage_item import StorageItem
@@ -12,6 +12,8 @@ from src.domain.entities.storage_item import StorageItem
 class StorageItemRepository(ABC):
     """StorageItem repository interface."""
     
+    __slots__ = ()
+    
     @abstractmethod
     async def create(self, storage_item: StorageItem) -> StorageItem:
         """Create a new storage item."""
@@ -42,11 +44,21 @@ class StorageItemRepository(ABC):
         """Get storage items by construction ID."""
         pass
     
+    @abstractmethod
+    async def get_by_construction_id_with_count(self, construction_id: UUID, limit: int = 100, offset: int = 0) -> Tuple[List[StorageItem], int]:
+        """Get storage items by construction ID and return the page with the total count."""
+        pass
+    
     @abstractmethod
     async def get_by_material_id(self, material_id: UUID, limit: int = 100, offset: int = 0) -> List[StorageItem]:
         """Get storage items by material ID."""
         pass
     
+    @abstractmethod
+    async def get_by_material_id_with_count(self, material_id: UUID, limit: int = 100, offset: int = 0) -> Tuple[List[StorageItem], int]:
+        """Get storage items by material ID and return the page with the total count."""
+        pass
+    
     @abstractmethod
     async def count_all(self) -> int:
         """Count total number of storage items."""
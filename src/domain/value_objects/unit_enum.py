@@ -35,122 +35,114 @@ class UnitEnum(str, Enum):
         
         unit_lower = unit.lower().strip()
         
-        # Map common variations to enum values
-        unit_mapping = {
-            # Meters
-            "m": cls.METERS,
-            "meter": cls.METERS,
-            "metr": cls.METERS,
-            "meters": cls.METERS,
-            "metrów": cls.METERS,
-            "metrow": cls.METERS,
-            "km": cls.METERS,  # kilometers -> meters
-            "kilometer": cls.METERS,
-            "kilometr": cls.METERS,
-            "kilometers": cls.METERS,
-            "kilometrów": cls.METERS,
-            "cm": cls.METERS,  # centimeters -> meters
-            "centimeter": cls.METERS,
-            "centymetr": cls.METERS,
-            "centimeters": cls.METERS,
-            "centymetrów": cls.METERS,
-            "mm": cls.METERS,  # millimeters -> meters
-            "millimeter": cls.METERS,
-            "milimetr": cls.METERS,
-            "millimeters": cls.METERS,
-            "milimetrów": cls.METERS,
-            
-            # Kilograms
-            "kg": cls.KILOGRAMS,
-            "kilogram": cls.KILOGRAMS,
-            "kilograms": cls.KILOGRAMS,
-            "kilogramów": cls.KILOGRAMS,
-            "kilogramow": cls.KILOGRAMS,
-            "g": cls.KILOGRAMS,  # grams -> kilograms
-            "gram": cls.KILOGRAMS,
-            "grams": cls.KILOGRAMS,
-            "gramów": cls.KILOGRAMS,
-            "gramow": cls.KILOGRAMS,
-            "t": cls.KILOGRAMS,  # tons -> kilograms
-            "ton": cls.KILOGRAMS,
-            "tona": cls.KILOGRAMS,
-            "tons": cls.KILOGRAMS,
-            "tony": cls.KILOGRAMS,
-            
-            # Cubic meters
-            "m3": cls.CUBIC_METERS,
-            "m³": cls.CUBIC_METERS,
-            "cubic_meter": cls.CUBIC_METERS,
-            "cubic_meters": cls.CUBIC_METERS,
-            "metr_sześcienny": cls.CUBIC_METERS,
-            "metr_szescienny": cls.CUBIC_METERS,
-            "metry_sześcienne": cls.CUBIC_METERS,
-            "metry_szescienne": cls.CUBIC_METERS,
-            
-            # Cubic centimeters
-            "cm3": cls.CUBIC_CENTIMETERS,
-            "cm³": cls.CUBIC_CENTIMETERS,
-            "cubic_centimeter": cls.CUBIC_CENTIMETERS,
-            "cubic_centimeters": cls.CUBIC_CENTIMETERS,
-            "centymetr_sześcienny": cls.CUBIC_CENTIMETERS,
-            "centymetr_szescienny": cls.CUBIC_CENTIMETERS,
-            
-            # Cubic millimeters
-            "mm3": cls.CUBIC_MILLIMETERS,
-            "mm³": cls.CUBIC_MILLIMETERS,
-            "cubic_millimeter": cls.CUBIC_MILLIMETERS,
-            "cubic_millimeters": cls.CUBIC_MILLIMETERS,
-            "milimetr_sześcienny": cls.CUBIC_MILLIMETERS,
-            "milimetr_szescienny": cls.CUBIC_MILLIMETERS,
-            
-            # Liters
-            "l": cls.LITERS,
-            "litre": cls.LITERS,
-            "liter": cls.LITERS,
-            "liters": cls.LITERS,
-            "litrów": cls.LITERS,
-            "litrow": cls.LITERS,
-            "l.": cls.LITERS,
-            "l ": cls.LITERS,
-            # Milliliters -> liters
-            "ml": cls.LITERS,
-            "ml.": cls.LITERS,
-            "ml ": cls.LITERS,
-            "milliliter": cls.LITERS,
-            "milliliters": cls.LITERS,
-            "mililitr": cls.LITERS,
-            "mililitrów": cls.LITERS,
-            "mililitrow": cls.LITERS,
-            "mililitry": cls.LITERS,
-            "ml³": cls.LITERS,
-            "ml3": cls.LITERS,
-            "millilitre": cls.LITERS,
-            "millilitres": cls.LITERS,
-            
-            # Pieces
-            "szt": cls.PIECES,
-            "szt.": cls.PIECES,
-            "sztuk": cls.PIECES,
-            "sztuka": cls.PIECES,
-            "sztuki": cls.PIECES,
-            "piece": cls.PIECES,
-            "pieces": cls.PIECES,
-            "pcs": cls.PIECES,
-            "pcs.": cls.PIECES,
-            "pc": cls.PIECES,
-            "pc.": cls.PIECES,
-        }
-        
-        # Try exact match first
-        if unit_lower in unit_mapping:
-            return unit_mapping[unit_lower]
-        
-        # Try to match enum value directly
-        try:
-            return cls(unit_lower)
-        except ValueError:
-            pass
-        
-        # If no match found, return OTHER
-        return cls.OTHER
+        # Alias lookup first, then the enum values themselves (both in one dict)
+        return _UNIT_LOOKUP.get(unit_lower, cls.OTHER)
+
+
+# Map common variations to enum values (built once at import)
+_UNIT_ALIASES = {
+    # Meters
+    "m": UnitEnum.METERS,
+    "meter": UnitEnum.METERS,
+    "metr": UnitEnum.METERS,
+    "meters": UnitEnum.METERS,
+    "metrów": UnitEnum.METERS,
+    "metrow": UnitEnum.METERS,
+    "km": UnitEnum.METERS,  # kilometers -> meters
+    "kilometer": UnitEnum.METERS,
+    "kilometr": UnitEnum.METERS,
+    "kilometers": UnitEnum.METERS,
+    "kilometrów": UnitEnum.METERS,
+    "cm": UnitEnum.METERS,  # centimeters -> meters
+    "centimeter": UnitEnum.METERS,
+    "centymetr": UnitEnum.METERS,
+    "centimeters": UnitEnum.METERS,
+    "centymetrów": UnitEnum.METERS,
+    "mm": UnitEnum.METERS,  # millimeters -> meters
+    "millimeter": UnitEnum.METERS,
+    "milimetr": UnitEnum.METERS,
+    "millimeters": UnitEnum.METERS,
+    "milimetrów": UnitEnum.METERS,
+    
+    # Kilograms
+    "kg": UnitEnum.KILOGRAMS,
+    "kilogram": UnitEnum.KILOGRAMS,
+    "kilograms": UnitEnum.KILOGRAMS,
+    "kilogramów": UnitEnum.KILOGRAMS,
+    "kilogramow": UnitEnum.KILOGRAMS,
+    "g": UnitEnum.KILOGRAMS,  # grams -> kilograms
+    "gram": UnitEnum.KILOGRAMS,
+    "grams": UnitEnum.KILOGRAMS,
+    "gramów": UnitEnum.KILOGRAMS,
+    "gramow": UnitEnum.KILOGRAMS,
+    "t": UnitEnum.KILOGRAMS,  # tons -> kilograms
+    "ton": UnitEnum.KILOGRAMS,
+    "tona": UnitEnum.KILOGRAMS,
+    "tons": UnitEnum.KILOGRAMS,
+    "tony": UnitEnum.KILOGRAMS,
+    
+    # Cubic meters
+    "m3": UnitEnum.CUBIC_METERS,
+    "m³": UnitEnum.CUBIC_METERS,
+    "cubic_meter": UnitEnum.CUBIC_METERS,
+    "cubic_meters": UnitEnum.CUBIC_METERS,
+    "metr_sześcienny": UnitEnum.CUBIC_METERS,
+    "metr_szescienny": UnitEnum.CUBIC_METERS,
+    "metry_sześcienne": UnitEnum.CUBIC_METERS,
+    "metry_szescienne": UnitEnum.CUBIC_METERS,
+    
+    # Cubic centimeters
+    "cm3": UnitEnum.CUBIC_CENTIMETERS,
+    "cm³": UnitEnum.CUBIC_CENTIMETERS,
+    "cubic_centimeter": UnitEnum.CUBIC_CENTIMETERS,
+    "cubic_centimeters": UnitEnum.CUBIC_CENTIMETERS,
+    "centymetr_sześcienny": UnitEnum.CUBIC_CENTIMETERS,
+    "centymetr_szescienny": UnitEnum.CUBIC_CENTIMETERS,
+    
+    # Cubic millimeters
+    "mm3": UnitEnum.CUBIC_MILLIMETERS,
+    "mm³": UnitEnum.CUBIC_MILLIMETERS,
+    "cubic_millimeter": UnitEnum.CUBIC_MILLIMETERS,
+    "cubic_millimeters": UnitEnum.CUBIC_MILLIMETERS,
+    "milimetr_sześcienny": UnitEnum.CUBIC_MILLIMETERS,
+    "milimetr_szescienny": UnitEnum.CUBIC_MILLIMETERS,
+    
+    # Liters
+    "l": UnitEnum.LITERS,
+    "litre": UnitEnum.LITERS,
+    "liter": UnitEnum.LITERS,
+    "liters": UnitEnum.LITERS,
+    "litrów": UnitEnum.LITERS,
+    "litrow": UnitEnum.LITERS,
+    "l.": UnitEnum.LITERS,
+    "l ": UnitEnum.LITERS,
+    # Milliliters -> liters
+    "ml": UnitEnum.LITERS,
+    "ml.": UnitEnum.LITERS,
+    "ml ": UnitEnum.LITERS,
+    "milliliter": UnitEnum.LITERS,
+    "milliliters": UnitEnum.LITERS,
+    "mililitr": UnitEnum.LITERS,
+    "mililitrów": UnitEnum.LITERS,
+    "mililitrow": UnitEnum.LITERS,
+    "mililitry": UnitEnum.LITERS,
+    "ml³": UnitEnum.LITERS,
+    "ml3": UnitEnum.LITERS,
+    "millilitre": UnitEnum.LITERS,
+    "millilitres": UnitEnum.LITERS,
+    
+    # Pieces
+    "szt": UnitEnum.PIECES,
+    "szt.": UnitEnum.PIECES,
+    "sztuk": UnitEnum.PIECES,
+    "sztuka": UnitEnum.PIECES,
+    "sztuki": UnitEnum.PIECES,
+    "piece": UnitEnum.PIECES,
+    "pieces": UnitEnum.PIECES,
+    "pcs": UnitEnum.PIECES,
+    "pcs.": UnitEnum.PIECES,
+    "pc": UnitEnum.PIECES,
+    "pc.": UnitEnum.PIECES,
+}
 
+_UNIT_LOOKUP = {**{unit.value: unit for unit in UnitEnum}, **_UNIT_ALIASES}
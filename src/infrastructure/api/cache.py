@@ -0,0 +1,179 @@
+"""
+In-process TTL cache for list endpoints.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set, Tuple
+
+from cachetools import LRUCache, TTLCache
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.connection import current_session
+from src.shared.config import settings
+from src.shared.exceptions import DatabaseError
+
+
+class ListCache:
+    """
+    Cache wyników endpointów listujących, podzielony na przestrzenie nazw.
+
+    Każda przestrzeń nazw (np. "materials") ma własny TTLCache, dzięki czemu
+    zapis do danego zasobu czyści tylko jego wpisy. Cache jest lokalny dla
+    procesu - przy wielu workerach nieaktualność jest ograniczona przez TTL.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._namespaces: Dict[str, TTLCache] = {}
+
+    def get(self, namespace: str, key: Hashable) -> Optional[Any]:
+        """Return the cached value or None."""
+        cache = self._namespaces.get(namespace)
+        if cache is None:
+            return None
+        return cache.get(key)
+
+    def set(self, namespace: str, key: Hashable, value: Any) -> None:
+        """Store a value under the given namespace."""
+        cache = self._namespaces.get(namespace)
+        if cache is None:
+            cache = self._namespaces[namespace] = TTLCache(maxsize=self._maxsize, ttl=self._ttl)
+        cache[key] = value
+
+    def clear(self, namespace: str) -> None:
+        """Drop all entries of a namespace (call after writes)."""
+        cache = self._namespaces.get(namespace)
+        if cache is not None:
+            cache.clear()
+
+
+class _SWREntry:
+    __slots__ = ("value", "stale_at", "expires_at")
+
+    def __init__(self, value: Any, stale_at: float, expires_at: float):
+        self.value = value
+        self.stale_at = stale_at
+        self.expires_at = expires_at
+
+
+class StaleWhileRevalidateCache:
+    """
+    Cache stale-while-revalidate z fallbackiem na ostatnią znaną odpowiedź.
+
+    Świeży wpis jest zwracany od razu. Nieświeży (ale przed twardym wygaśnięciem)
+    też jest zwracany od razu, a odświeżenie startuje w tle. Gdy baza nie odpowiada
+    (DatabaseError), zwracana jest ostatnia znana wartość, a jej ważność przedłużana.
+    Czas świeżości to max(min_ttl, 3 * czas generowania odpowiedzi).
+
+    Loader musi otwierać własną sesję - odświeżenie w tle trwa dłużej niż żądanie.
+    """
+
+    def __init__(self, maxsize: int, min_ttl: float, max_stale: float):
+        self._maxsize = maxsize
+        self._min_ttl = min_ttl
+        self._max_stale = max_stale
+        self._namespaces: Dict[str, LRUCache] = {}
+        # Zwiększana przy clear(), żeby odświeżenie sprzed zapisu nie nadpisało cache
+        self._generations: Dict[str, int] = {}
+        self._refreshing: Set[Tuple[str, Hashable]] = set()
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def get_or_load(
+        self,
+        namespace: str,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached value (possibly stale) or load it."""
+        entry = self._entries(namespace).get(key)
+        now = time.monotonic()
+
+        if entry is not None and now < entry.stale_at:
+            return entry.value
+        if entry is not None and now < entry.expires_at:
+            self._schedule_refresh(namespace, key, loader)
+            return entry.value
+
+        try:
+            return await self._load(namespace, key, loader)
+        except DatabaseError:
+            if entry is None:
+                raise
+            entry.expires_at = now + self._max_stale
+            return entry.value
+
+    def clear(self, namespace: str) -> None:
+        """Drop all entries of a namespace (call after writes)."""
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+        entries = self._namespaces.get(namespace)
+        if entries is not None:
+            entries.clear()
+
+    def _entries(self, namespace: str) -> LRUCache:
+        entries = self._namespaces.get(namespace)
+        if entries is None:
+            entries = self._namespaces[namespace] = LRUCache(maxsize=self._maxsize)
+        return entries
+
+    async def _load(self, namespace: str, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        generation = self._generations.get(namespace, 0)
+        started = time.monotonic()
+        value = await loader()
+        finished = time.monotonic()
+
+        if self._generations.get(namespace, 0) == generation:
+            stale_at = finished + max(self._min_ttl, (finished - started) * 3)
+            self._entries(namespace)[key] = _SWREntry(value, stale_at, stale_at + self._max_stale)
+        return value
+
+    def _schedule_refresh(self, namespace: str, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> None:
+        refresh_key = (namespace, key)
+        if refresh_key in self._refreshing:
+            return
+        self._refreshing.add(refresh_key)
+        task = asyncio.create_task(self._refresh(namespace, key, loader))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh(self, namespace: str, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            await self._load(namespace, key, loader)
+        except DatabaseError:
+            entry = self._entries(namespace).get(key)
+            if entry is not None:
+                entry.expires_at = time.monotonic() + self._max_stale
+        finally:
+            self._refreshing.discard((namespace, key))
+
+
+list_cache = ListCache(maxsize=settings.list_cache_maxsize, ttl=settings.list_cache_ttl_seconds)
+
+public_cache = StaleWhileRevalidateCache(
+    maxsize=settings.list_cache_maxsize,
+    min_ttl=settings.public_cache_min_ttl_seconds,
+    max_stale=settings.public_cache_max_stale_seconds
+)
+
+
+_PENDING_INVALIDATIONS = "pending_cache_invalidations"
+
+
+def invalidate(namespace: str) -> None:
+    """Clear every cache layer of a resource after a write."""
+    list_cache.clear(namespace)
+    public_cache.clear(namespace)
+    # Zapis jest widoczny dla innych sesji dopiero po commicie w DBSessionMiddleware;
+    # odczyt w tym oknie mógłby ponownie zapisać w cache stare dane, więc czyścimy
+    # przestrzeń nazw jeszcze raz po commicie.
+    session = current_session.get()
+    if session is not None:
+        session.info.setdefault(_PENDING_INVALIDATIONS, set()).add(namespace)
+
+
+def invalidate_committed(session: AsyncSession) -> None:
+    """Clear again the namespaces written in this session (call right after commit)."""
+    for namespace in session.info.pop(_PENDING_INVALIDATIONS, ()):
+        list_cache.clear(namespace)
+        public_cache.clear(namespace)
@@ -2,8 +2,9 @@
 Category API endpoints.
 """
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from functools import partial
+from typing import List, Tuple
+from fastapi import APIRouter, FastAPI, Depends, HTTPException, status, Query, Request
 from uuid import UUID
 
 from src.application.dtos.category_dto import (
@@ -14,20 +15,40 @@ from src.application.dtos.category_dto import (
     CategorySearchDTO
 )
 from src.application.use_cases.category_use_cases import CategoryUseCases
+from src.infrastructure.api.cache import invalidate, public_cache
 from src.infrastructure.api.dependencies import get_category_use_cases
+from src.infrastructure.api.responses import dto_response, etag_body_response, etag_json_response, json_array_with_etag
 
 router = APIRouter()
 
+_CACHE_NAMESPACE = "categories"
+
+# OFFSET kosztuje O(offset) - głębsze strony publicznej listy są odrzucane
+_PUBLIC_MAX_OFFSET = 10_000
+
+
+async def _load_public_categories(app: FastAPI, limit: int, offset: int) -> Tuple[bytes, str]:
+    """Load a /public page in its own session (also used by background revalidation)."""
+    async with app.state.session_factory() as session:
+        category_use_cases = await get_category_use_cases(session)
+        result = await category_use_cases.list_all_categories(limit=limit, offset=offset)
+    return json_array_with_etag(result.categories)
+
 
 @router.get("/public", response_model=List[CategoryResponseDTO])
 async def list_categories_public(
-    limit: int = 100,
-    offset: int = 0,
-    category_use_cases: CategoryUseCases = Depends(get_category_use_cases)
+    request: Request,
+    limit: int = Query(default=100, ge=1, le=200),
+    offset: int = Query(default=0, ge=0, le=_PUBLIC_MAX_OFFSET)
 ):
     """List all categories (public endpoint for testing)."""
-    result = await category_use_cases.list_all_categories(limit=limit, offset=offset)
-    return result.categories
+    # Cache trzyma gotowe body z ETagiem - powtórne odpytanie bez zmian kończy się 304
+    body, etag = await public_cache.get_or_load(
+        _CACHE_NAMESPACE,
+        (limit, offset),
+        partial(_load_public_categories, request.app, limit, offset)
+    )
+    return etag_body_response(request, body, etag)
 
 
 @router.post("/", response_model=CategoryResponseDTO, status_code=status.HTTP_201_CREATED)
@@ -36,16 +57,37 @@ async def create_category(
     category_use_cases: CategoryUseCases = Depends(get_category_use_cases)
 ):
     """Create a new category."""
-    return await category_use_cases.create_category(category_dto)
+    category = await category_use_cases.create_category(category_dto)
+    invalidate(_CACHE_NAMESPACE)
+    return category
+
+
+@router.get("/search", response_model=CategoryListResponseDTO)
+async def search_categories(
+    query: str = Query(..., min_length=1),
+    page: int = Query(default=1, ge=1),
+    size: int = Query(default=20, ge=1, le=100),
+    category_use_cases: CategoryUseCases = Depends(get_category_use_cases)
+):
+    """Search categories by name."""
+    search_dto = CategorySearchDTO(
+        query=query, 
+        page=page, 
+        size=size
+    )
+    result = await category_use_cases.search_categories(search_dto)
+    return dto_response(result)
 
 
 @router.get("/{category_id}", response_model=CategoryResponseDTO)
 async def get_category(
     category_id: UUID,
+    request: Request,
     category_use_cases: CategoryUseCases = Depends(get_category_use_cases)
 ):
     """Get category by ID."""
-    return await category_use_cases.get_category_by_id(category_id)
+    category = await category_use_cases.get_category_by_id(category_id)
+    return etag_json_response(request, category)
 
 
 @router.put("/{category_id}", response_model=CategoryResponseDTO)
@@ -55,7 +97,9 @@ async def update_category(
     category_use_cases: CategoryUseCases = Depends(get_category_use_cases)
 ):
     """Update category."""
-    return await category_use_cases.update_category(category_id, category_dto)
+    category = await category_use_cases.update_category(category_id, category_dto)
+    invalidate(_CACHE_NAMESPACE)
+    return category
 
 
 @router.delete("/{category_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -65,6 +109,7 @@ async def delete_category(
 ):
     """Delete category."""
     await category_use_cases.delete_category(category_id)
+    invalidate(_CACHE_NAMESPACE)
 
 
 @router.get("/", response_model=CategoryListResponseDTO)
@@ -74,21 +119,5 @@ async def list_categories(
     category_use_cases: CategoryUseCases = Depends(get_category_use_cases)
 ):
     """List all categories."""
-    return await category_use_cases.list_all_categories(limit=limit, offset=offset)
-
-
-@router.get("/search", response_model=CategoryListResponseDTO)
-async def search_categories(
-    query: str = Query(..., min_length=1),
-    page: int = Query(default=1, ge=1),
-    size: int = Query(default=20, ge=1, le=100),
-    category_use_cases: CategoryUseCases = Depends(get_category_use_cases)
-):
-    """Search categories by name."""
-    search_dto = CategorySearchDTO(
-        query=query, 
-        page=page, 
-        size=size
-    )
-    return await category_use_cases.search_categories(search_dto)
-
+    result = await category_use_cases.list_all_categories(limit=limit, offset=offset)
+    return dto_response(result)
@@ -3,16 +3,19 @@ Construction API endpoints.
 """
 
 import os
-import shutil
+import re
+import asyncio
 import base64
-from pathlib import Path
-from typing import List, Optional
+from functools import partial
+from typing import List, Optional, Tuple
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form, Request
-from uuid import UUID
+from types import MappingProxyType
+from fastapi import APIRouter, FastAPI, Depends, HTTPException, status, Query, UploadFile, File, Form, Request
+from uuid import UUID, uuid4
+from anyio import Path as AsyncPath
 from rapidfuzz import fuzz
 
-from src.shared.config import settings
+from src.shared.config import settings, CONSTRUCTIONS_IMAGES_DIR
 
 from src.application.dtos.construction_dto import (
     ConstructionCreateDTO,
@@ -20,255 +23,236 @@ from src.application.dtos.construction_dto import (
     ConstructionResponseDTO,
     ConstructionListResponseDTO,
     ConstructionSearchDTO,
-    ConstructionStatisticsDTO
+    ConstructionStatisticsDTO,
+    ConstructionStatus
 )
 from src.application.dtos.material_dto import MaterialSearchDTO
 from src.application.use_cases.construction_use_cases import ConstructionUseCases
 from src.application.use_cases.document_analysis_use_cases import DocumentAnalysisUseCases
 from src.application.use_cases.material_use_cases import MaterialUseCases
+from src.infrastructure.api.cache import invalidate, public_cache
 from src.infrastructure.api.dependencies import get_construction_use_cases, get_document_analysis_use_cases, get_material_use_cases
+from src.infrastructure.api.middleware import on_rollback
+from src.infrastructure.api.responses import dto_response, etag_body_response, etag_json_response, json_array_with_etag
 
 router = APIRouter()
 
+_CACHE_NAMESPACE = "constructions"
+
+# OFFSET kosztuje O(offset) - głębsze strony publicznej listy są odrzucane
+_PUBLIC_MAX_OFFSET = 10_000
+
+_STATUS_MAP = {s.value: s for s in ConstructionStatus}
+_STATUS_VALUES_STR = ", ".join(_STATUS_MAP)
+
+_ALLOWED_IMG_EXTS = frozenset({"jpg", "jpeg", "png", "gif", "webp"})
+_ALLOWED_IMG_EXTS_STR = "jpg, jpeg, png, gif, webp"
+_MIME_TO_EXT = MappingProxyType({
+    "image/jpeg": "jpg",
+    "image/jpg": "jpg",
+    "image/png": "png",
+    "image/gif": "gif",
+    "image/webp": "webp"
+})
+_DATA_URI_RE = re.compile(r"^data:(image/[a-z0-9+.-]+);base64,")
+_MAX_UPLOAD_SIZE = settings.max_upload_size_mb * 1024 * 1024
+
+
+def _score_suggestions(query: str, candidates: List[str]) -> List[Tuple[int, float]]:
+    """
+    Policz podobieństwo nazwy do kandydatów (najlepszy z kilku algorytmów fuzzy matching).
+    
+    Zwraca pary (indeks kandydata, score) tylko dla kandydatów z score >= 50.
+    """
+    scores = []
+    for index, candidate in enumerate(candidates):
+        max_score = max(
+            fuzz.ratio(query, candidate),
+            fuzz.partial_ratio(query, candidate),
+            fuzz.token_sort_ratio(query, candidate),
+            fuzz.token_set_ratio(query, candidate)
+        )
+        if max_score >= 50:
+            scores.append((index, max_score))
+    return scores
+
+
+def _image_url(request: Request, file_name: str) -> str:
+    """Zbuduj (względny) URL zdjęcia na podstawie zamontowanego katalogu StaticFiles."""
+    return str(request.app.url_path_for("construction-images", path=file_name))
+
+
+async def _load_public_constructions(app: FastAPI, limit: int, offset: int) -> Tuple[bytes, str]:
+    """Load a /public page in its own session (also used by background revalidation)."""
+    async with app.state.session_factory() as session:
+        construction_use_cases = await get_construction_use_cases(session)
+        result = await construction_use_cases.list_all_constructions(limit=limit, offset=offset)
+    return json_array_with_etag(result.constructions)
+
 
 @router.get("/public", response_model=List[ConstructionResponseDTO])
 async def list_constructions_public(
-    limit: int = 100,
-    offset: int = 0,
-    construction_use_cases: ConstructionUseCases = Depends(get_construction_use_cases)
+    request: Request,
+    limit: int = Query(default=100, ge=1, le=200),
+    offset: int = Query(default=0, ge=0, le=_PUBLIC_MAX_OFFSET)
 ):
     """List all constructions (public endpoint for testing)."""
-    result = await construction_use_cases.list_all_constructions(limit=limit, offset=offset)
-    return result.constructions
+    # Cache trzyma gotowe body z ETagiem - powtórne odpytanie bez zmian kończy się 304
+    body, etag = await public_cache.get_or_load(
+        _CACHE_NAMESPACE,
+        (limit, offset),
+        partial(_load_public_constructions, request.app, limit, offset)
+    )
+    return etag_body_response(request, body, etag)
 
 
 @router.post("/", response_model=ConstructionResponseDTO, status_code=status.HTTP_201_CREATED)
 async def create_construction(
+    construction_dto: ConstructionCreateDTO,
+    construction_use_cases: ConstructionUseCases = Depends(get_construction_use_cases)
+):
+    """Utwórz nową construction (JSON)."""
+    construction = await construction_use_cases.create_construction(construction_dto)
+    invalidate(_CACHE_NAMESPACE)
+    return construction
+
+
+@router.post("/with-image", response_model=ConstructionResponseDTO, status_code=status.HTTP_201_CREATED)
+async def create_construction_with_image(
     request: Request,
+    name: str = Form(..., min_length=1),
+    description: str = Form(""),
+    address: str = Form(""),
+    start_date: Optional[str] = Form(None),
+    status_str: str = Form("inactive", alias="status"),
+    img_url: Optional[str] = Form(None),
+    file: Optional[UploadFile] = File(None),
     construction_use_cases: ConstructionUseCases = Depends(get_construction_use_cases)
 ):
     """
-    Utwórz nową construction.
+    Utwórz nową construction z opcjonalnym zdjęciem (multipart/form-data).
     
-    Obsługuje dwa formaty:
-    1. JSON (Content-Type: application/json) - standardowy ConstructionCreateDTO
-    2. Multipart/form-data - z opcjonalnym plikiem zdjęcia
-    
-    Jeśli przesłasz plik w multipart/form-data, zostanie on zapisany i img_url zostanie ustawiony automatycznie.
+    Zdjęcie można przesłać jako plik (pole 'file') albo jako base64 w polu 'img_url'
+    (format: data:image/jpeg;base64,...). Plik zostanie zapisany, a img_url ustawiony automatycznie.
     """
-    content_type = request.headers.get("content-type", "")
+    # Parsuj start_date jeśli podano
+    parsed_start_date = None
+    if start_date:
+        try:
+            parsed_start_date = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Nieprawidłowy format start_date. Użyj formatu ISO (np. 2024-01-01T00:00:00)"
+            )
     
-    if "multipart/form-data" in content_type:
-        # Obsługa multipart/form-data z plikiem
-        form = await request.form()
-        
-        name = form.get("name")
-        if not name:
+    # Parsuj status
+    try:
+        status_enum = _STATUS_MAP[status_str]
+    except KeyError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Nieprawidłowy status: {status_str}. Dozwolone wartości: {_STATUS_VALUES_STR}"
+        )
+    
+    # Zdjęcie (plik lub base64) zapisujemy od razu pod docelową nazwą,
+    # dzięki czemu construction powstaje jednym zapisem z gotowym img_url
+    image_content = None
+    image_name = None
+    
+    # Sprawdź czy img_url zawiera base64 image
+    if img_url and img_url.startswith("data:image/"):
+        # Parsuj base64 (format: data:image/jpeg;base64,/9j/4AAQ...)
+        data_uri_match = _DATA_URI_RE.match(img_url)
+        if not data_uri_match:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Pole 'name' jest wymagane"
+                detail="Nieprawidłowy format base64 image: oczekiwano data:image/<typ>;base64,<dane>"
             )
+        file_extension = _MIME_TO_EXT.get(data_uri_match.group(1), "jpg")
         
-        description = form.get("description", "")
-        address = form.get("address", "")
-        start_date_str = form.get("start_date")
-        status_str = form.get("status", "inactive")
-        img_url = form.get("img_url")
-        file = form.get("file")
-        
-        from src.application.dtos.construction_dto import ConstructionStatus
-        
-        # Parsuj start_date jeśli podano
-        parsed_start_date = None
-        if start_date_str:
-            try:
-                parsed_start_date = datetime.fromisoformat(start_date_str.replace('Z', '+00:00'))
-            except ValueError:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Nieprawidłowy format start_date. Użyj formatu ISO (np. 2024-01-01T00:00:00)"
-                )
-        
-        # Parsuj status
         try:
-            status_enum = ConstructionStatus(status_str)
-        except ValueError:
+            # Dekoduj base64 (ścisła walidacja alfabetu)
+            image_content = base64.b64decode(img_url[data_uri_match.end():], validate=True)
+        except ValueError as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Nieprawidłowy status: {status_str}. Dozwolone wartości: {[s.value for s in ConstructionStatus]}"
+                detail=f"Nieprawidłowy format base64 image: {str(e)}"
             )
         
-        # Jeśli przesłano plik, zapisz go
-        final_img_url = img_url
-        temp_file_path = None
-        upload_dir = None
-        is_base64_image = False
-        
-        # Sprawdź czy img_url zawiera base64 image
-        if img_url and isinstance(img_url, str) and img_url.startswith("data:image/"):
-            is_base64_image = True
-            try:
-                # Parsuj base64 (format: data:image/jpeg;base64,/9j/4AAQ...)
-                header, encoded = img_url.split(",", 1)
-                # Wyciągnij typ obrazu z headera
-                mime_type = header.split(";")[0].split(":")[1]  # image/jpeg
-                file_extension_map = {
-                    "image/jpeg": "jpg",
-                    "image/jpg": "jpg",
-                    "image/png": "png",
-                    "image/gif": "gif",
-                    "image/webp": "webp"
-                }
-                file_extension = file_extension_map.get(mime_type, "jpg")
-                
-                # Dekoduj base64
-                file_content = base64.b64decode(encoded)
-                
-                # Sprawdź rozmiar
-                max_size = settings.max_upload_size_mb * 1024 * 1024
-                if len(file_content) > max_size:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail=f"Obraz base64 jest za duży. Maksymalny rozmiar: {settings.max_upload_size_mb}MB"
-                    )
-                
-                # Utwórz katalog jeśli nie istnieje
-                upload_dir = Path(settings.constructions_images_dir)
-                upload_dir.mkdir(parents=True, exist_ok=True)
-                
-                # Generuj tymczasową nazwę pliku
-                temp_file_name = f"temp_base64.{file_extension}"
-                temp_file_path = upload_dir / temp_file_name
-                
-                # Zapisz plik tymczasowo
-                with open(temp_file_path, "wb") as buffer:
-                    buffer.write(file_content)
-                
-                # Ustaw final_img_url na None, bo będzie ustawiony później
-                final_img_url = None
-            except ValueError as e:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Nieprawidłowy format base64 image: {str(e)}"
-                )
-            except Exception as e:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Błąd podczas przetwarzania base64 image: {str(e)}"
-                )
-        
-        if file and hasattr(file, 'filename') and file.filename:
-            # Walidacja typu pliku
-            allowed_extensions = ['jpg', 'jpeg', 'png', 'gif', 'webp']
-            file_extension = file.filename.lower().split('.')[-1] if '.' in file.filename else ''
-            
-            if file_extension not in allowed_extensions:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Nieobsługiwany typ pliku: {file_extension}. Dozwolone typy: {', '.join(allowed_extensions)}"
-                )
-            
-            # Sprawdź rozmiar pliku
-            max_size = settings.max_upload_size_mb * 1024 * 1024
-            file_content = await file.read()
-            
-            if len(file_content) > max_size:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Plik jest za duży. Maksymalny rozmiar: {settings.max_upload_size_mb}MB"
-                )
-            
-            # Utwórz katalog jeśli nie istnieje
-            upload_dir = Path(settings.constructions_images_dir)
-            upload_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Generuj tymczasową nazwę pliku
-            temp_file_name = f"temp_{file.filename}"
-            temp_file_path = upload_dir / temp_file_name
-            
-            # Zapisz plik tymczasowo
-            try:
-                with open(temp_file_path, "wb") as buffer:
-                    buffer.write(file_content)
-            except Exception as e:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Błąd podczas zapisywania pliku: {str(e)}"
-                )
+        # Sprawdź rozmiar
+        if len(image_content) > _MAX_UPLOAD_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Obraz base64 jest za duży. Maksymalny rozmiar: {settings.max_upload_size_mb}MB"
+            )
         
-        # Utwórz DTO
-        construction_dto = ConstructionCreateDTO(
-            name=name,
-            description=description,
-            address=address,
-            start_date=parsed_start_date,
-            status=status_enum,
-            img_url=final_img_url
-        )
+        image_name = f"{uuid4()}.{file_extension}"
+    
+    if file and file.filename:
+        # Walidacja typu pliku
+        file_extension = os.path.splitext(file.filename)[1].lower().lstrip(".")
         
-        # Utwórz construction
-        created_construction = await construction_use_cases.create_construction(construction_dto)
+        if file_extension not in _ALLOWED_IMG_EXTS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Nieobsługiwany typ pliku: {file_extension}. Dozwolone typy: {_ALLOWED_IMG_EXTS_STR}"
+            )
         
-        # Jeśli był plik lub base64 image, zmień nazwę na właściwą i zaktualizuj img_url
-        if (file and hasattr(file, 'filename') and file.filename and temp_file_path) or (is_base64_image and temp_file_path):
-            final_file_name = f"{created_construction.construction_id}_{file.filename}"
-            final_file_path = upload_dir / final_file_name
-            
-            try:
-                # Określ nazwę pliku
-                if is_base64_image:
-                    # Dla base64 użyj construction_id i rozszerzenia z pliku
-                    file_extension = temp_file_path.suffix
-                    final_file_name = f"{created_construction.construction_id}{file_extension}"
-                else:
-                    final_file_name = f"{created_construction.construction_id}_{file.filename}"
-                
-                final_file_path = upload_dir / final_file_name
-                
-                # Zmień nazwę pliku
-                if temp_file_path.exists():
-                    temp_file_path.rename(final_file_path)
-                
-                # Generuj URL
-                image_url = f"/api/v1/constructions/images/{final_file_name}"
-                
-                # Zaktualizuj construction z img_url
-                update_dto = ConstructionUpdateDTO(img_url=image_url)
-                created_construction = await construction_use_cases.update_construction(
-                    created_construction.construction_id,
-                    update_dto
-                )
-            except Exception as e:
-                # Jeśli błąd, usuń tymczasowy plik
-                if temp_file_path and temp_file_path.exists():
-                    temp_file_path.unlink()
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Błąd podczas aktualizacji img_url: {str(e)}"
-                )
+        # Sprawdź rozmiar pliku (czytamy najwyżej limit + 1 bajt)
+        image_content = await file.read(_MAX_UPLOAD_SIZE + 1)
         
-        return created_construction
-    else:
-        # Obsługa JSON (standardowy ConstructionCreateDTO)
-        try:
-            body = await request.json()
-            construction_dto = ConstructionCreateDTO(**body)
-            return await construction_use_cases.create_construction(construction_dto)
-        except ValueError as e:
+        if len(image_content) > _MAX_UPLOAD_SIZE:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"{str(e)}"
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Plik jest za duży. Maksymalny rozmiar: {settings.max_upload_size_mb}MB"
             )
+        
+        image_name = f"{uuid4()}.{file_extension}"
+    
+    # Utwórz DTO
+    construction_dto = ConstructionCreateDTO(
+        name=name,
+        description=description,
+        address=address,
+        start_date=parsed_start_date,
+        status=status_enum,
+        img_url=None if image_name else img_url
+    )
+    
+    # Zapisz zdjęcie pod docelową nazwą
+    image_path = None
+    if image_name:
+        image_path = CONSTRUCTIONS_IMAGES_DIR / image_name
+        try:
+            await AsyncPath(image_path).write_bytes(image_content)
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"{str(e)}"
+                detail=f"Błąd podczas zapisywania pliku: {str(e)}"
             )
+        # Commit jest w DBSessionMiddleware, już po powrocie z handlera - jeśli się nie
+        # powiedzie, plik bez wiersza w bazie usuwamy przy wycofaniu transakcji
+        on_rollback(partial(AsyncPath(image_path).unlink, missing_ok=True))
+        construction_dto.img_url = _image_url(request, image_name)
+    
+    # Utwórz construction (jeden zapis w bazie)
+    try:
+        construction = await construction_use_cases.create_construction(construction_dto)
+    except Exception:
+        # Jeśli zapis w bazie się nie powiódł, usuń zapisany plik
+        if image_path:
+            await AsyncPath(image_path).unlink(missing_ok=True)
+        raise
+    invalidate(_CACHE_NAMESPACE)
+    return construction
 
 
 @router.get("/statistics", response_model=List[ConstructionStatisticsDTO])
 async def get_construction_statistics(
     from_date: Optional[datetime] = Query(None, description="Data od której mają być zbierane statystyki (format ISO 8601)"),
+    limit: int = Query(default=1000, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
     construction_use_cases: ConstructionUseCases = Depends(get_construction_use_cases)
 ):
     """
@@ -286,10 +270,11 @@ async def get_construction_statistics(
     - from_date: Opcjonalna data od której mają być zbierane statystyki. 
                  Jeśli podano, uwzględniane są tylko materiały dodane od tej daty.
                  Format: ISO 8601 (np. 2024-01-01T00:00:00)
+    - limit, offset: Paginacja (budowy posortowane po nazwie, domyślnie pierwsze 1000)
     """
     try:
-        result = await construction_use_cases.get_statistics(from_date=from_date)
-        return result
+        result = await construction_use_cases.get_statistics(from_date=from_date, limit=limit, offset=offset)
+        return dto_response(result)
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -299,13 +284,39 @@ async def get_construction_statistics(
         )
 
 
+@router.get("/search", response_model=ConstructionListResponseDTO)
+async def search_constructions(
+    query: str = Query(..., min_length=1),
+    page: int = Query(default=1, ge=1),
+    size: int = Query(default=20, ge=1, le=100),
+    status_filter: Optional[str] = Query(None, alias="status", description="Filter by status (active, in_progress, inactive, archived, deleted)"),
+    construction_use_cases: ConstructionUseCases = Depends(get_construction_use_cases)
+):
+    """Search constructions by name and optionally filter by status."""
+    status_enum = None
+    if status_filter:
+        try:
+            status_enum = _STATUS_MAP[status_filter]
+        except KeyError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid status: {status_filter}. Valid values: {_STATUS_VALUES_STR}"
+            )
+    
+    search_dto = ConstructionSearchDTO(query=query, page=page, size=size, status=status_enum)
+    result = await construction_use_cases.search_constructions(search_dto)
+    return dto_response(result)
+
+
 @router.get("/{construction_id}", response_model=ConstructionResponseDTO)
 async def get_construction(
     construction_id: UUID,
+    request: Request,
     construction_use_cases: ConstructionUseCases = Depends(get_construction_use_cases)
 ):
     """Get construction by ID."""
-    return await construction_use_cases.get_construction_by_id(construction_id)
+    construction = await construction_use_cases.get_construction_by_id(construction_id)
+    return etag_json_response(request, construction)
 
 
 @router.put("/{construction_id}", response_model=ConstructionResponseDTO)
@@ -315,7 +326,9 @@ async def update_construction(
     construction_use_cases: ConstructionUseCases = Depends(get_construction_use_cases)
 ):
     """Update construction."""
-    return await construction_use_cases.update_construction(construction_id, construction_dto)
+    construction = await construction_use_cases.update_construction(construction_id, construction_dto)
+    invalidate(_CACHE_NAMESPACE)
+    return construction
 
 
 @router.delete("/{construction_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -325,6 +338,7 @@ async def delete_construction(
 ):
     """Delete construction."""
     await construction_use_cases.delete_construction(construction_id)
+    invalidate(_CACHE_NAMESPACE)
 
 
 @router.get("/", response_model=ConstructionListResponseDTO)
@@ -334,32 +348,8 @@ async def list_constructions(
     construction_use_cases: ConstructionUseCases = Depends(get_construction_use_cases)
 ):
     """List all constructions."""
-    return await construction_use_cases.list_all_constructions(limit=limit, offset=offset)
-
-
-@router.get("/search", response_model=ConstructionListResponseDTO)
-async def search_constructions(
-    query: str = Query(..., min_length=1),
-    page: int = Query(default=1, ge=1),
-    size: int = Query(default=20, ge=1, le=100),
-    status: str = Query(None, description="Filter by status (active, in_progress, inactive, archived, deleted)"),
-    construction_use_cases: ConstructionUseCases = Depends(get_construction_use_cases)
-):
-    """Search constructions by name and optionally filter by status."""
-    from src.application.dtos.construction_dto import ConstructionStatus
-    
-    status_enum = None
-    if status:
-        try:
-            status_enum = ConstructionStatus(status)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid status: {status}. Valid values: {[s.value for s in ConstructionStatus]}"
-            )
-    
-    search_dto = ConstructionSearchDTO(query=query, page=page, size=size, status=status_enum)
-    return await construction_use_cases.search_constructions(search_dto)
+    result = await construction_use_cases.list_all_constructions(limit=limit, offset=offset)
+    return dto_response(result)
 
 
 @router.post("/{construction_id}/analyze-document", status_code=status.HTTP_200_OK)
@@ -378,9 +368,7 @@ async def analyze_document(
     Jeśli jednostka się nie zgadza, użytkownik będzie musiał ręcznie wpisać ilość.
     """
     # Sprawdź czy construction istnieje
-    try:
-        await construction_use_cases.get_construction_by_id(construction_id)
-    except Exception as e:
+    if not await construction_use_cases.construction_exists(construction_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Construction o ID {construction_id} nie został znaleziony"
@@ -401,6 +389,12 @@ async def analyze_document(
         materials = result["extracted_data"]["materials"]
         enriched_materials = []
         
+        # Jedno zapytanie o wszystkie dokładne dopasowania nazw zamiast listy materiałów per pozycja
+        existing_materials = await material_use_cases.get_materials_by_names(
+            [material.get("name", "") for material in materials]
+        )
+        materials_by_name = {db_material.name.lower(): db_material for db_material in existing_materials}
+        
         for material in materials:
             material_name = material.get("name", "")
             document_unit = material.get("unit", "")
@@ -409,13 +403,7 @@ async def analyze_document(
             # Szukaj materiału w bazie po nazwie
             try:
                 # Najpierw sprawdź czy jest idealny match (dokładna nazwa)
-                all_materials = await material_use_cases.list_all_materials(limit=1000, offset=0)
-                matching_material = None
-                
-                for db_material in all_materials.materials:
-                    if db_material.name.lower() == material_name.lower():
-                        matching_material = db_material
-                        break
+                matching_material = materials_by_name.get(material_name.lower())
                 
                 if matching_material:
                     # Materiał istnieje w bazie - idealny match
@@ -438,31 +426,25 @@ async def analyze_document(
                     similar_materials_result = await material_use_cases.search_materials(search_dto)
                     
                     # Przygotuj listę sugerowanych materiałów z filtrowaniem po score
-                    suggested_materials = []
-                    material_name_lower = material_name.lower()
+                    # (scoring poza event loopem)
+                    candidates = similar_materials_result.materials[:5]  # Top 5
+                    scores = await asyncio.to_thread(
+                        _score_suggestions,
+                        material_name.lower(),
+                        [candidate.name.lower() for candidate in candidates]
+                    )
                     
-                    for suggested in similar_materials_result.materials[:5]:  # Top 5
-                        suggested_name_lower = suggested.name.lower()
-                        
-                        # Oblicz score podobieństwa używając różnych metod fuzzy matching
-                        ratio_score = fuzz.ratio(material_name_lower, suggested_name_lower)
-                        partial_score = fuzz.partial_ratio(material_name_lower, suggested_name_lower)
-                        token_sort_score = fuzz.token_sort_ratio(material_name_lower, suggested_name_lower)
-                        token_set_score = fuzz.token_set_ratio(material_name_lower, suggested_name_lower)
-                        
-                        # Użyj najwyższego wyniku
-                        max_score = max(ratio_score, partial_score, token_sort_score, token_set_score)
-                        
-                        # Filtruj tylko materiały z score >= 50 (0.5 = 50%)
-                        if max_score >= 50:
-                            suggested_unit = suggested.unit.value if hasattr(suggested.unit, 'value') else str(suggested.unit)
-                            suggested_materials.append({
-                                "material_id": str(suggested.material_id),
-                                "name": suggested.name,
-                                "unit": suggested_unit,
-                                "description": suggested.description,
-                                "similarity_score": max_score  # Dodaj score dla informacji
-                            })
+                    suggested_materials = []
+                    for index, max_score in scores:
+                        suggested = candidates[index]
+                        suggested_unit = suggested.unit.value if hasattr(suggested.unit, 'value') else str(suggested.unit)
+                        suggested_materials.append({
+                            "material_id": str(suggested.material_id),
+                            "name": suggested.name,
+                            "unit": suggested_unit,
+                            "description": suggested.description,
+                            "similarity_score": max_score  # Dodaj score dla informacji
+                        })
                     
                     enriched_material = {
                         **material,
@@ -496,6 +478,7 @@ async def analyze_document(
 @router.post("/{construction_id}/upload-image", response_model=ConstructionResponseDTO)
 async def upload_construction_image(
     construction_id: UUID,
+    request: Request,
     file: UploadFile = File(..., description="Zdjęcie construction (JPG, PNG, GIF, WEBP)"),
     construction_use_cases: ConstructionUseCases = Depends(get_construction_use_cases)
 ):
@@ -506,78 +489,56 @@ async def upload_construction_image(
     Automatycznie aktualizuje pole img_url w construction.
     """
     # Sprawdź czy construction istnieje
-    try:
-        construction = await construction_use_cases.get_construction_by_id(construction_id)
-    except Exception as e:
+    if not await construction_use_cases.construction_exists(construction_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Construction o ID {construction_id} nie został znaleziony"
         )
     
     # Walidacja typu pliku
-    allowed_extensions = ['jpg', 'jpeg', 'png', 'gif', 'webp']
-    file_extension = file.filename.lower().split('.')[-1] if '.' in file.filename else ''
+    file_extension = os.path.splitext(file.filename or "")[1].lower().lstrip(".")
     
-    if file_extension not in allowed_extensions:
+    if file_extension not in _ALLOWED_IMG_EXTS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Nieobsługiwany typ pliku: {file_extension}. Dozwolone typy: {', '.join(allowed_extensions)}"
+            detail=f"Nieobsługiwany typ pliku: {file_extension}. Dozwolone typy: {_ALLOWED_IMG_EXTS_STR}"
         )
     
-    # Sprawdź rozmiar pliku (max 10MB)
-    max_size = settings.max_upload_size_mb * 1024 * 1024
-    file_content = await file.read()
+    # Sprawdź rozmiar pliku (czytamy najwyżej limit + 1 bajt)
+    file_content = await file.read(_MAX_UPLOAD_SIZE + 1)
     
-    if len(file_content) > max_size:
+    if len(file_content) > _MAX_UPLOAD_SIZE:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
             detail=f"Plik jest za duży. Maksymalny rozmiar: {settings.max_upload_size_mb}MB"
         )
     
-    # Utwórz katalog jeśli nie istnieje
-    upload_dir = Path(settings.constructions_images_dir)
-    upload_dir.mkdir(parents=True, exist_ok=True)
-    
     # Generuj unikalną nazwę pliku
     file_name = f"{construction_id}_{file.filename}"
-    file_path = upload_dir / file_name
+    file_path = CONSTRUCTIONS_IMAGES_DIR / file_name
+    
+    # Nadpisanie istniejącego pliku (ta sama nazwa) nie jest cofane - usuwamy tylko nowy plik
+    file_is_new = not await AsyncPath(file_path).exists()
     
     # Zapisz plik na dysku
     try:
-        with open(file_path, "wb") as buffer:
-            buffer.write(file_content)
+        await AsyncPath(file_path).write_bytes(file_content)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Błąd podczas zapisywania pliku: {str(e)}"
         )
     
+    if file_is_new:
+        # Gdy aktualizacja albo commit się nie powiedzie, wiersz dalej wskazuje stary plik
+        on_rollback(partial(AsyncPath(file_path).unlink, missing_ok=True))
+    
     # Generuj URL do pliku (względny URL)
-    image_url = f"/api/v1/constructions/images/{file_name}"
+    image_url = _image_url(request, file_name)
     
     # Zaktualizuj construction z nowym img_url
     update_dto = ConstructionUpdateDTO(img_url=image_url)
     updated_construction = await construction_use_cases.update_construction(construction_id, update_dto)
+    invalidate(_CACHE_NAMESPACE)
     
     return updated_construction
-
-
-@router.get("/images/{filename}")
-async def get_construction_image(filename: str):
-    """
-    Pobierz zdjęcie construction z dysku.
-    """
-    file_path = Path(settings.constructions_images_dir) / filename
-    
-    if not file_path.exists():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Zdjęcie nie zostało znalezione"
-        )
-    
-    from fastapi.responses import FileResponse
-    return FileResponse(
-        path=str(file_path),
-        media_type="image/jpeg"  # FastAPI automatycznie wykryje typ na podstawie rozszerzenia
-    )
-
@@ -2,11 +2,9 @@
 FastAPI dependencies for Recipe AI Extractor.
 """
 
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Annotated
-from uuid import UUID
 
 from src.infrastructure.database.connection import get_async_db
 from src.infrastructure.database.repositories.construction_repository_impl import ConstructionRepositoryImpl
@@ -18,62 +16,36 @@ from src.application.use_cases.material_use_cases import MaterialUseCases
 from src.application.use_cases.storage_item_use_cases import StorageItemUseCases
 from src.application.use_cases.category_use_cases import CategoryUseCases
 from src.application.use_cases.document_analysis_use_cases import DocumentAnalysisUseCases
+from src.shared.exceptions import ExternalServiceError
 
-from src.shared.exceptions import EntityNotFoundError
+# Single request-scoped session shared by every repository resolved in a request
+# (FastAPI caches get_async_db once per request, so all repositories use one connection).
+SessionDep = Annotated[AsyncSession, Depends(get_async_db)]
 
-# Security
-security = HTTPBearer()
 
-
-def get_construction_repository(db: Annotated[AsyncSession, Depends(get_async_db)]) -> ConstructionRepositoryImpl:
-    """Get construction repository."""
-    return ConstructionRepositoryImpl(db)
-
-
-def get_construction_use_cases(
-    construction_repo: Annotated[ConstructionRepositoryImpl, Depends(get_construction_repository)]
-) -> ConstructionUseCases:
+async def get_construction_use_cases(db: SessionDep) -> ConstructionUseCases:
     """Get construction use cases."""
-    return ConstructionUseCases(construction_repo)
-
-
-def get_material_repository(db: Annotated[AsyncSession, Depends(get_async_db)]) -> MaterialRepositoryImpl:
-    """Get material repository."""
-    return MaterialRepositoryImpl(db)
+    return ConstructionUseCases(ConstructionRepositoryImpl(db))
 
 
-def get_material_use_cases(
-    material_repo: Annotated[MaterialRepositoryImpl, Depends(get_material_repository)]
-) -> MaterialUseCases:
+async def get_material_use_cases(db: SessionDep) -> MaterialUseCases:
     """Get material use cases."""
-    return MaterialUseCases(material_repo)
+    return MaterialUseCases(MaterialRepositoryImpl(db))
 
 
-def get_category_repository(db: Annotated[AsyncSession, Depends(get_async_db)]) -> CategoryRepositoryImpl:
-    """Get category repository."""
-    return CategoryRepositoryImpl(db)
-
-
-def get_category_use_cases(
-    category_repo: Annotated[CategoryRepositoryImpl, Depends(get_category_repository)]
-) -> CategoryUseCases:
+async def get_category_use_cases(db: SessionDep) -> CategoryUseCases:
     """Get category use cases."""
-    return CategoryUseCases(category_repo)
-
+    return CategoryUseCases(CategoryRepositoryImpl(db))
 
-def get_storage_item_repository(db: Annotated[AsyncSession, Depends(get_async_db)]) -> StorageItemRepositoryImpl:
-    """Get storage item repository."""
-    return StorageItemRepositoryImpl(db)
 
-
-def get_storage_item_use_cases(
-    storage_item_repo: Annotated[StorageItemRepositoryImpl, Depends(get_storage_item_repository)]
-) -> StorageItemUseCases:
+async def get_storage_item_use_cases(db: SessionDep) -> StorageItemUseCases:
     """Get storage item use cases."""
-    return StorageItemUseCases(storage_item_repo)
-
+    return StorageItemUseCases(StorageItemRepositoryImpl(db))
 
-def get_document_analysis_use_cases() -> DocumentAnalysisUseCases:
-    """Get document analysis use cases."""
-    return DocumentAnalysisUseCases()
 
+async def get_document_analysis_use_cases(request: Request) -> DocumentAnalysisUseCases:
+    """Get document analysis use cases (single instance created in the app lifespan)."""
+    document_analysis_use_cases = getattr(request.app.state, "document_analysis_use_cases", None)
+    if document_analysis_use_cases is None:
+        raise ExternalServiceError("OpenAI API key is not configured")
+    return document_analysis_use_cases
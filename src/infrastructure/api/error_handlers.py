@@ -2,19 +2,28 @@
 FastAPI error handlers for Recipe AI Extractor.
 """
 
+import orjson
 from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from src.shared.config import settings
 from src.shared.exceptions import (
     RecipeExtractorException, EntityNotFoundError, 
     ValidationError, BusinessRuleViolationError,
     ExternalServiceError, DatabaseError
 )
 
+# Stała odpowiedź 500 serializowana raz przy imporcie modułu
+_GENERIC_500_BYTES = orjson.dumps({
+    "error": "InternalServerError",
+    "message": "An unexpected error occurred",
+    "details": None
+})
 
-async def recipe_extractor_exception_handler(request: Request, exc: RecipeExtractorException) -> JSONResponse:
+
+async def recipe_extractor_exception_handler(request: Request, exc: RecipeExtractorException) -> Response:
     """Handle Recipe AI Extractor exceptions."""
     status_code = 500
     
@@ -29,7 +38,7 @@ async def recipe_extractor_exception_handler(request: Request, exc: RecipeExtrac
     elif isinstance(exc, DatabaseError):
         status_code = 500
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content={
             "error": exc.__class__.__name__,
@@ -39,9 +48,9 @@ async def recipe_extractor_exception_handler(request: Request, exc: RecipeExtrac
     )
 
 
-async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> Response:
     """Handle Pydantic validation errors."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={
             "error": "ValidationError",
@@ -51,9 +60,9 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 
-async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> Response:
     """Handle HTTP exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": "HTTPException",
@@ -63,13 +72,15 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException)
     )
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> Response:
     """Handle general exceptions."""
-    return JSONResponse(
-        status_code=500,
-        content={
-            "error": "InternalServerError",
-            "message": "An unexpected error occurred",
-            "details": str(exc) if isinstance(exc, Exception) else None
-        }
-    )
+    if settings.debug:
+        return ORJSONResponse(
+            status_code=500,
+            content={
+                "error": "InternalServerError",
+                "message": "An unexpected error occurred",
+                "details": str(exc)
+            }
+        )
+    return Response(content=_GENERIC_500_BYTES, media_type="application/json", status_code=500)
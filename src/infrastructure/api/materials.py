@@ -2,8 +2,10 @@
 Material API endpoints.
 """
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from datetime import datetime
+from functools import partial
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, FastAPI, Depends, status, Query, Request
 from uuid import UUID
 
 from src.application.dtos.material_dto import (
@@ -14,20 +16,40 @@ from src.application.dtos.material_dto import (
     MaterialSearchDTO
 )
 from src.application.use_cases.material_use_cases import MaterialUseCases
+from src.infrastructure.api.cache import invalidate, list_cache, public_cache
 from src.infrastructure.api.dependencies import get_material_use_cases
+from src.infrastructure.api.responses import dto_response, etag_body_response, etag_json_response, json_array_with_etag
 
 router = APIRouter()
 
+_CACHE_NAMESPACE = "materials"
+
+# OFFSET kosztuje O(offset) - głębsze strony publicznej listy są odrzucane
+_PUBLIC_MAX_OFFSET = 10_000
+
+
+async def _load_public_materials(app: FastAPI, limit: int, offset: int) -> Tuple[bytes, str]:
+    """Load a /public page in its own session (also used by background revalidation)."""
+    async with app.state.session_factory() as session:
+        material_use_cases = await get_material_use_cases(session)
+        result = await material_use_cases.list_all_materials(limit=limit, offset=offset)
+    return json_array_with_etag(result.materials)
+
 
 @router.get("/public", response_model=List[MaterialResponseDTO])
 async def list_materials_public(
-    limit: int = 100,
-    offset: int = 0,
-    material_use_cases: MaterialUseCases = Depends(get_material_use_cases)
+    request: Request,
+    limit: int = Query(default=100, ge=1, le=200),
+    offset: int = Query(default=0, ge=0, le=_PUBLIC_MAX_OFFSET)
 ):
     """List all materials (public endpoint for testing)."""
-    result = await material_use_cases.list_all_materials(limit=limit, offset=offset)
-    return result.materials
+    # Cache trzyma gotowe body z ETagiem - powtórne odpytanie bez zmian kończy się 304
+    body, etag = await public_cache.get_or_load(
+        _CACHE_NAMESPACE,
+        (limit, offset),
+        partial(_load_public_materials, request.app, limit, offset)
+    )
+    return etag_body_response(request, body, etag)
 
 
 @router.post("/", response_model=MaterialResponseDTO, status_code=status.HTTP_201_CREATED)
@@ -36,7 +58,9 @@ async def create_material(
     material_use_cases: MaterialUseCases = Depends(get_material_use_cases)
 ):
     """Create a new material."""
-    return await material_use_cases.create_material(material_dto)
+    material = await material_use_cases.create_material(material_dto)
+    invalidate(_CACHE_NAMESPACE)
+    return material
 
 
 @router.post("/bulk", response_model=List[MaterialResponseDTO], status_code=status.HTTP_201_CREATED)
@@ -45,16 +69,61 @@ async def create_materials_bulk(
     material_use_cases: MaterialUseCases = Depends(get_material_use_cases)
 ):
     """Create multiple materials at once."""
-    return await material_use_cases.create_materials_bulk(material_dtos)
+    materials = await material_use_cases.create_materials_bulk(material_dtos)
+    invalidate(_CACHE_NAMESPACE)
+    return materials
+
+
+@router.get("/search", response_model=MaterialListResponseDTO)
+async def search_materials(
+    query: str = Query(..., min_length=1),
+    page: int = Query(default=1, ge=1),
+    size: int = Query(default=20, ge=1, le=100),
+    category_id: Optional[UUID] = Query(None, description="Filter by category ID (UUID)"),
+    material_use_cases: MaterialUseCases = Depends(get_material_use_cases)
+):
+    """Search materials by name and optionally filter by category."""
+    # Wyszukiwanie nie rozróżnia wielkości liter, więc klucz też (autocomplete powtarza zapytania)
+    cache_key = ("search", query.lower(), page, size, category_id)
+    cached = list_cache.get(_CACHE_NAMESPACE, cache_key)
+    if cached is not None:
+        return dto_response(cached)
+    search_dto = MaterialSearchDTO(query=query, page=page, size=size, category_id=category_id)
+    result = await material_use_cases.search_materials(search_dto)
+    list_cache.set(_CACHE_NAMESPACE, cache_key, result)
+    return dto_response(result)
+
+
+@router.get("/after", response_model=List[MaterialResponseDTO])
+async def list_materials_after(
+    after_created_at: Optional[datetime] = Query(None, description="created_at ostatniego materiału z poprzedniej strony"),
+    after_id: Optional[UUID] = Query(None, description="material_id ostatniego materiału z poprzedniej strony"),
+    limit: int = Query(default=20, ge=1, le=100),
+    material_use_cases: MaterialUseCases = Depends(get_material_use_cases)
+):
+    """
+    Lista materiałów od najnowszych, stronicowana kursorem (keyset).
+    
+    Pierwsza strona: bez kursora. Kolejna: created_at i material_id ostatniego
+    elementu poprzedniej strony. Koszt nie rośnie z głębokością strony (brak OFFSET).
+    """
+    result = await material_use_cases.list_materials_after(
+        after_created_at=after_created_at,
+        after_id=after_id,
+        limit=limit
+    )
+    return dto_response(result)
 
 
 @router.get("/{material_id}", response_model=MaterialResponseDTO)
 async def get_material(
     material_id: UUID,
+    request: Request,
     material_use_cases: MaterialUseCases = Depends(get_material_use_cases)
 ):
     """Get material by ID."""
-    return await material_use_cases.get_material_by_id(material_id)
+    material = await material_use_cases.get_material_by_id(material_id)
+    return etag_json_response(request, material)
 
 
 @router.put("/{material_id}", response_model=MaterialResponseDTO)
@@ -64,7 +133,9 @@ async def update_material(
     material_use_cases: MaterialUseCases = Depends(get_material_use_cases)
 ):
     """Update material."""
-    return await material_use_cases.update_material(material_id, material_dto)
+    material = await material_use_cases.update_material(material_id, material_dto)
+    invalidate(_CACHE_NAMESPACE)
+    return material
 
 
 @router.delete("/{material_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -74,6 +145,7 @@ async def delete_material(
 ):
     """Delete material."""
     await material_use_cases.delete_material(material_id)
+    invalidate(_CACHE_NAMESPACE)
 
 
 @router.get("/", response_model=MaterialListResponseDTO)
@@ -83,7 +155,13 @@ async def list_materials(
     material_use_cases: MaterialUseCases = Depends(get_material_use_cases)
 ):
     """List all materials."""
-    return await material_use_cases.list_all_materials(limit=limit, offset=offset)
+    cache_key = ("list", limit, offset)
+    cached = list_cache.get(_CACHE_NAMESPACE, cache_key)
+    if cached is not None:
+        return dto_response(cached)
+    result = await material_use_cases.list_all_materials(limit=limit, offset=offset)
+    list_cache.set(_CACHE_NAMESPACE, cache_key, result)
+    return dto_response(result)
 
 
 @router.get("/category/{category_id}", response_model=MaterialListResponseDTO)
@@ -94,30 +172,13 @@ async def get_materials_by_category(
     material_use_cases: MaterialUseCases = Depends(get_material_use_cases)
 ):
     """Get materials by category ID."""
-    return await material_use_cases.get_materials_by_category(category_id, limit=limit, offset=offset)
-
-
-@router.get("/search", response_model=MaterialListResponseDTO)
-async def search_materials(
-    query: str = Query(..., min_length=1),
-    page: int = Query(default=1, ge=1),
-    size: int = Query(default=20, ge=1, le=100),
-    category_id: str = Query(None, description="Filter by category ID (UUID)"),
-    material_use_cases: MaterialUseCases = Depends(get_material_use_cases)
-):
-    """Search materials by name and optionally filter by category."""
-    category_uuid = None
-    if category_id:
-        try:
-            category_uuid = UUID(category_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid category ID format: {category_id}"
-            )
-    
-    search_dto = MaterialSearchDTO(query=query, page=page, size=size, category_id=category_uuid)
-    return await material_use_cases.search_materials(search_dto)
+    cache_key = ("category", category_id, limit, offset)
+    cached = list_cache.get(_CACHE_NAMESPACE, cache_key)
+    if cached is not None:
+        return dto_response(cached)
+    result = await material_use_cases.get_materials_by_category(category_id, limit=limit, offset=offset)
+    list_cache.set(_CACHE_NAMESPACE, cache_key, result)
+    return dto_response(result)
 
 
 @router.get("/by-construction/{construction_id}", response_model=MaterialListResponseDTO)
@@ -128,5 +189,6 @@ async def get_materials_by_construction(
     material_use_cases: MaterialUseCases = Depends(get_material_use_cases)
 ):
     """Get materials by construction ID."""
-    return await material_use_cases.get_materials_by_construction(construction_id, limit=limit, offset=offset)
+    result = await material_use_cases.get_materials_by_construction(construction_id, limit=limit, offset=offset)
+    return dto_response(result)
 
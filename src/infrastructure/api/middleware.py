@@ -0,0 +1,132 @@
+"""
+ASGI middleware for the API layer.
+"""
+
+from typing import Awaitable, Callable, Tuple
+
+from starlette.exceptions import HTTPException
+from starlette.status import HTTP_413_REQUEST_ENTITY_TOO_LARGE
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.api.cache import invalidate_committed
+from src.infrastructure.database.connection import current_session
+
+_ROLLBACK_CALLBACKS = "rollback_callbacks"
+
+
+def on_rollback(callback: Callable[[], Awaitable[None]]) -> None:
+    """
+    Register cleanup to run if the current request's transaction is rolled back.
+
+    Covers error responses, unhandled exceptions and a failed commit in
+    DBSessionMiddleware. Outside a request session the callback is not registered.
+    """
+    session = current_session.get()
+    if session is not None:
+        session.info.setdefault(_ROLLBACK_CALLBACKS, []).append(callback)
+
+
+async def _rollback(session: AsyncSession) -> None:
+    await session.rollback()
+    for callback in session.info.pop(_ROLLBACK_CALLBACKS, ()):
+        await callback()
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Odrzuca zbyt duże uploady kodem 413, zanim body zostanie wczytane.
+
+    FastAPI parsuje formularz przed wywołaniem endpointu, więc limit musi działać
+    na poziomie ASGI. Zadeklarowany Content-Length jest sprawdzany przed pierwszym
+    odczytem body, a dla żądań bez Content-Length (chunked) liczone są odebrane bajty.
+    Wyjątek rzucany z `receive` trafia do zwykłych exception handlerów.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_size: int, path_suffixes: Tuple[str, ...]):
+        self.app = app
+        self.max_body_size = max_body_size
+        self.path_suffixes = path_suffixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or not scope["path"].endswith(self.path_suffixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        declared_size = 0
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                try:
+                    declared_size = int(value)
+                except ValueError:
+                    pass
+                break
+
+        received_size = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received_size
+            if declared_size > self.max_body_size:
+                self._reject()
+            message = await receive()
+            if message["type"] == "http.request":
+                received_size += len(message.get("body", b""))
+                if received_size > self.max_body_size:
+                    self._reject()
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+    @staticmethod
+    def _reject() -> None:
+        raise HTTPException(
+            status_code=HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="Żądanie jest za duże"
+        )
+
+
+class DBSessionMiddleware:
+    """
+    Otwiera jedną sesję bazy na żądanie HTTP i udostępnia ją przez ContextVar.
+
+    get_async_db zwraca tę sesję, więc wszystkie repozytoria w żądaniu korzystają
+    z jednego połączenia niezależnie od ścieżki, którą zostały utworzone.
+    Middleware jest też granicą transakcji: repozytoria nie robią commitu, a cała
+    praca żądania jest zatwierdzana jednym commitem tuż przed wysłaniem odpowiedzi
+    (status < 400) albo wycofywana. Błąd commitu kończy się więc kodem 500, a nie
+    odpowiedzią o sukcesie, a po wycofaniu uruchamiane są akcje z on_rollback (np.
+    usunięcie zapisanego pliku). Fabryka sesji pochodzi z app.state (ustawiana raz w lifespan).
+    """
+
+    def __init__(self, app: ASGIApp, path_prefix: str):
+        self.app = app
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        async with scope["app"].state.session_factory() as session:
+            token = current_session.set(session)
+
+            async def send_after_commit(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    if message["status"] < 400:
+                        await session.commit()
+                        invalidate_committed(session)
+                    else:
+                        await _rollback(session)
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_after_commit)
+            except Exception:
+                await _rollback(session)
+                raise
+            finally:
+                current_session.reset(token)
@@ -0,0 +1,59 @@
+"""
+Response helpers for the API layer.
+"""
+
+import hashlib
+from typing import Iterable, Sequence, Tuple, Union
+
+import orjson
+from fastapi import Request, status
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel
+
+
+def dto_response(
+    content: Union[BaseModel, Sequence[BaseModel]],
+    status_code: int = status.HTTP_200_OK
+) -> ORJSONResponse:
+    """Serialize DTOs directly, skipping FastAPI's response_model re-validation."""
+    if isinstance(content, BaseModel):
+        return ORJSONResponse(content.model_dump(mode="json"), status_code=status_code)
+    return ORJSONResponse([item.model_dump(mode="json") for item in content], status_code=status_code)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag (weak comparison)."""
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _etag(body: bytes) -> str:
+    """Strong ETag derived from the serialized body."""
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def json_array_with_etag(items: Iterable[BaseModel]) -> Tuple[bytes, str]:
+    """Serialize DTOs into a JSON array body and its ETag (cacheable together)."""
+    body = orjson.dumps([item.model_dump(mode="json") for item in items])
+    return body, _etag(body)
+
+
+def etag_json_response(request: Request, item: BaseModel) -> Response:
+    """Return a DTO as JSON with an ETag, or 304 when the client already has this version."""
+    body = orjson.dumps(item.model_dump(mode="json"))
+    return etag_body_response(request, body, _etag(body))
+
+
+def etag_body_response(request: Request, body: bytes, etag: str) -> Response:
+    """Return a serialized JSON body with its ETag, or 304 when If-None-Match matches."""
+    headers = {"ETag": etag}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
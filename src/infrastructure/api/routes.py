@@ -2,7 +2,9 @@
 FastAPI routes for Recipe AI Extractor.
 """
 
+import orjson
 from fastapi import APIRouter
+from fastapi.responses import Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from .constructions import router as constructions_router
@@ -22,11 +24,14 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 # Create main API router
 api_router = APIRouter()
 
+# Stała odpowiedź health checka (serializowana raz przy imporcie)
+_HEALTH_BYTES = orjson.dumps({"status": "healthy", "service": "Recipe AI Extractor API"})
+
 # Health check endpoint
 @api_router.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy", "service": "Recipe AI Extractor API"}
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 # Include specific route modules
 api_router.include_router(constructions_router, prefix="/constructions", tags=["constructions"])
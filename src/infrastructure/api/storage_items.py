@@ -14,10 +14,14 @@ from src.application.dtos.storage_item_dto import (
     StorageItemMaterialListResponseDTO
 )
 from src.application.use_cases.storage_item_use_cases import StorageItemUseCases
+from src.infrastructure.api.cache import invalidate, list_cache
 from src.infrastructure.api.dependencies import get_storage_item_use_cases
+from src.infrastructure.api.responses import dto_response
 
 router = APIRouter()
 
+_CACHE_NAMESPACE = "storage_items"
+
 
 # More specific endpoints first (with more path segments)
 @router.post("/construction/{construction_id}/bulk", response_model=List[StorageItemResponseDTO], status_code=status.HTTP_201_CREATED)
@@ -31,10 +35,12 @@ async def create_storage_items_bulk_for_construction(
     Validates that all construction_ids in the request match the given construction_id.
     If storage item already exists, adds quantity_value to existing one.
     """
-    return await storage_item_use_cases.create_storage_items_bulk_for_construction(
+    storage_items = await storage_item_use_cases.create_storage_items_bulk_for_construction(
         construction_id=construction_id,
         storage_item_dtos=storage_item_dtos
     )
+    invalidate(_CACHE_NAMESPACE)
+    return dto_response(storage_items, status_code=status.HTTP_201_CREATED)
 
 
 @router.get("/construction/{construction_id}/materials", response_model=StorageItemMaterialListResponseDTO)
@@ -43,7 +49,8 @@ async def get_materials_by_construction(
     storage_item_use_cases: StorageItemUseCases = Depends(get_storage_item_use_cases)
 ):
     """Get list of materials (name, category, description, unit) for each storage item for given construction ID."""
-    return await storage_item_use_cases.get_materials_by_construction_id(construction_id)
+    result = await storage_item_use_cases.get_materials_by_construction_id(construction_id)
+    return dto_response(result)
 
 
 @router.get("/construction/{construction_id}/material/{material_id}", response_model=StorageItemResponseDTO)
@@ -53,7 +60,8 @@ async def get_storage_item(
     storage_item_use_cases: StorageItemUseCases = Depends(get_storage_item_use_cases)
 ):
     """Get storage item by construction ID and material ID."""
-    return await storage_item_use_cases.get_storage_item_by_ids(construction_id, material_id)
+    storage_item = await storage_item_use_cases.get_storage_item_by_ids(construction_id, material_id)
+    return dto_response(storage_item)
 
 
 @router.put("/construction/{construction_id}/material/{material_id}", response_model=StorageItemResponseDTO)
@@ -64,7 +72,9 @@ async def update_storage_item(
     storage_item_use_cases: StorageItemUseCases = Depends(get_storage_item_use_cases)
 ):
     """Update storage item."""
-    return await storage_item_use_cases.update_storage_item(construction_id, material_id, storage_item_dto)
+    storage_item = await storage_item_use_cases.update_storage_item(construction_id, material_id, storage_item_dto)
+    invalidate(_CACHE_NAMESPACE)
+    return dto_response(storage_item)
 
 
 @router.delete("/construction/{construction_id}/material/{material_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -75,6 +85,7 @@ async def delete_storage_item(
 ):
     """Delete storage item."""
     await storage_item_use_cases.delete_storage_item(construction_id, material_id)
+    invalidate(_CACHE_NAMESPACE)
 
 
 # Less specific endpoints (with fewer path segments) - must be after more specific ones
@@ -86,11 +97,17 @@ async def get_storage_items_by_construction(
     storage_item_use_cases: StorageItemUseCases = Depends(get_storage_item_use_cases)
 ):
     """Get storage items by construction ID."""
-    return await storage_item_use_cases.get_storage_items_by_construction_id(
+    cache_key = ("construction", construction_id, limit, offset)
+    cached = list_cache.get(_CACHE_NAMESPACE, cache_key)
+    if cached is not None:
+        return dto_response(cached)
+    result = await storage_item_use_cases.get_storage_items_by_construction_id(
         construction_id=construction_id,
         limit=limit,
         offset=offset
     )
+    list_cache.set(_CACHE_NAMESPACE, cache_key, result)
+    return dto_response(result)
 
 
 @router.get("/material/{material_id}", response_model=StorageItemListResponseDTO)
@@ -101,11 +118,17 @@ async def get_storage_items_by_material(
     storage_item_use_cases: StorageItemUseCases = Depends(get_storage_item_use_cases)
 ):
     """Get storage items by material ID."""
-    return await storage_item_use_cases.get_storage_items_by_material_id(
+    cache_key = ("material", material_id, limit, offset)
+    cached = list_cache.get(_CACHE_NAMESPACE, cache_key)
+    if cached is not None:
+        return dto_response(cached)
+    result = await storage_item_use_cases.get_storage_items_by_material_id(
         material_id=material_id,
         limit=limit,
         offset=offset
     )
+    list_cache.set(_CACHE_NAMESPACE, cache_key, result)
+    return dto_response(result)
 
 
 @router.post("/", response_model=StorageItemResponseDTO, status_code=status.HTTP_201_CREATED)
@@ -114,5 +137,7 @@ async def create_storage_item(
     storage_item_use_cases: StorageItemUseCases = Depends(get_storage_item_use_cases)
 ):
     """Create a new storage item."""
-    return await storage_item_use_cases.create_storage_item(storage_item_dto)
+    storage_item = await storage_item_use_cases.create_storage_item(storage_item_dto)
+    invalidate(_CACHE_NAMESPACE)
+    return dto_response(storage_item, status_code=status.HTTP_201_CREATED)
 
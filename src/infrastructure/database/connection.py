@@ -2,9 +2,15 @@
 Database connection and session management.
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+import asyncio
+from contextvars import ContextVar
+from typing import Optional
+
+from starlette.requests import Request
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 from src.shared.config import settings
 
 # Create base class for models
@@ -17,22 +23,67 @@ engine = create_engine(
     pool_pre_ping=True
 )
 
-# Create async engine for async operations (SQLite only)
-async_engine = create_async_engine(
-    settings.database_url.replace("sqlite://", "sqlite+aiosqlite://"),
-    echo=settings.debug,
-    pool_pre_ping=True
-)
+
+def _async_database_url(url: str) -> str:
+    """Map the configured database URL to its async driver."""
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    if url.startswith(("postgresql://", "postgres://")):
+        return "postgresql+asyncpg://" + url.split("://", 1)[1]
+    return url
+
+
+def _create_async_engine():
+    """Create the async engine (pooled, or NullPool on Lambda)."""
+    url = _async_database_url(settings.database_url)
+    
+    if settings.is_lambda:
+        # Lambda containers can be frozen between invocations, so connections are not kept
+        return create_async_engine(
+            url,
+            echo=settings.debug,
+            poolclass=NullPool,
+            query_cache_size=settings.db_query_cache_size
+        )
+    
+    connect_args = {}
+    if url.startswith("postgresql+asyncpg://"):
+        connect_args = {
+            "server_settings": {"jit": "off"},
+            "statement_cache_size": 1024,
+            "prepared_statement_cache_size": 512
+        }
+    
+    # aiosqlite defaults to NullPool (a new connection and worker thread per session),
+    # so the pool is configured explicitly and sized via DB_POOL_* settings.
+    return create_async_engine(
+        url,
+        echo=settings.debug,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=True,
+        query_cache_size=settings.db_query_cache_size,
+        connect_args=connect_args
+    )
+
+
+# Create async engine for async operations
+async_engine = _create_async_engine()
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-AsyncSessionLocal = sessionmaker(
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
     class_=AsyncSession,
-    autocommit=False,
-    autoflush=False,
-    bind=async_engine
+    autoflush=False
 )
 
+# Request-scoped session set by DBSessionMiddleware (None outside HTTP requests)
+current_session: ContextVar[Optional[AsyncSession]] = ContextVar("current_session", default=None)
+
 
 def get_db():
     """Get database session."""
@@ -43,16 +94,34 @@ def get_db():
         db.close()
 
 
-async def get_async_db():
-    """Get async database session."""
-    async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+async def get_async_db(request: Request):
+    """Get async database session (the request-scoped one when available)."""
+    session = current_session.get()
+    if session is not None:
+        yield session
+        return
+    async with request.app.state.session_factory() as session:
+        yield session
+        # Repositories do not commit; outside the middleware this dependency does
+        await session.commit()
+
+
+async def _ping() -> None:
+    """Open a pooled connection and run a trivial query."""
+    async with async_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
 
 
 async def init_database():
-    """Initialize database tables."""
+    """Initialize database tables and warm up the connection pool."""
     async with async_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    
+    if not settings.is_lambda:
+        # Open pool_size connections up front so the first requests skip the connect handshake
+        await asyncio.gather(*(_ping() for _ in range(settings.db_pool_size)))
+
+
+async def close_database():
+    """Close all pooled connections (aiosqlite keeps a worker thread per connection)."""
+    await async_engine.dispose()
@@ -0,0 +1,51 @@
+"""
+Per-session memo of domain entities loaded by primary key.
+"""
+
+from copy import copy
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_INFO_KEY = "get_by_id_cache"
+
+MemoKey = Tuple[type, Hashable]
+
+
+class EntityMemo:
+    """
+    Entities keyed by (model class, primary key).
+    
+    Entities are mutable, so the memo stores its own copy and hands out a fresh copy
+    on every lookup: a use case changing an entity it got from get_by_id (and then
+    failing before the write) must not change what later reads in the request see.
+    """
+    
+    __slots__ = ("_entities",)
+    
+    def __init__(self):
+        self._entities: Dict[MemoKey, Any] = {}
+    
+    def get(self, key: MemoKey) -> Optional[Any]:
+        entity = self._entities.get(key)
+        return copy(entity) if entity is not None else None
+    
+    def __setitem__(self, key: MemoKey, entity: Any) -> None:
+        self._entities[key] = copy(entity)
+    
+    def pop(self, key: MemoKey, default: Any = None) -> Any:
+        return self._entities.pop(key, default)
+
+
+def session_get_cache(session: AsyncSession) -> EntityMemo:
+    """
+    Return the get_by_id memo kept in session.info.
+
+    The session is request-scoped (DBSessionMiddleware), so the memo lives for one
+    request. Repositories key it by (model class, primary key) and refresh or drop
+    an entry on every write to that row.
+    """
+    memo = session.info.get(_INFO_KEY)
+    if memo is None:
+        memo = session.info[_INFO_KEY] = EntityMemo()
+    return memo
@@ -3,13 +3,34 @@ SQLAlchemy models for Recipe AI Extractor.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, Text, DateTime, Boolean, ForeignKey, DECIMAL
+from sqlalchemy import Column, String, Integer, Text, DateTime, Boolean, ForeignKey, DECIMAL, Index, DDL, event, Enum, CheckConstraint
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
+from src.domain.value_objects.construction_status import ConstructionStatus
+from src.domain.value_objects.unit_enum import UnitEnum
 from src.infrastructure.database.connection import Base
 
+# pg_trgm backs the trigram GIN indexes on name columns (PostgreSQL only)
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
+
+
+def _name_trgm_index(index_name: str, column: Column) -> Index:
+    """GIN trigram index on a `name` column so ILIKE '%...%' can avoid a sequential scan."""
+    return Index(
+        index_name,
+        column,
+        postgresql_using="gin",
+        # Column names are assigned only after the class body runs, so key by the attribute
+        postgresql_ops={"name": "gin_trgm_ops"}
+    ).ddl_if(dialect="postgresql")
+
 class CategoryModel(Base):
     """Category SQLAlchemy model."""
     
@@ -17,10 +38,16 @@ class CategoryModel(Base):
     
     category_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(100), nullable=False, index=True)
-    created_at = Column(DateTime, default=func.now(), nullable=False)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now(), nullable=False)
     
-    # Relationships
-    materials = relationship("MaterialModel", back_populates="category", cascade="all, delete-orphan")
+    # Relationships (lazy="raise": an implicit lazy load would be an N+1 - use selectinload)
+    materials = relationship("MaterialModel", back_populates="category", cascade="all, delete-orphan", lazy="raise")
+
+    __table_args__ = (
+        # Newest-first list pages (list_all / list_with_count)
+        Index("ix_categories_created_at", created_at.desc()),
+        _name_trgm_index("ix_categories_name_trgm", name),
+    )
 
 class ConstructionModel(Base):
     """Construction SQLAlchemy model."""
@@ -32,12 +59,45 @@ class ConstructionModel(Base):
     description = Column(Text, nullable=False, default="")
     address = Column(String(255), nullable=False, default="")
     start_date = Column(DateTime, nullable=True)
-    status = Column(String(20), nullable=False, default="INACTIVE")
+    # Native enum type on PostgreSQL (values as stored by the repository)
+    status = Column(
+        Enum(*(status.value for status in ConstructionStatus), name="construction_status"),
+        nullable=False,
+        default=ConstructionStatus.INACTIVE.value,
+        server_default=ConstructionStatus.INACTIVE.value
+    )
     img_url = Column(String(500), nullable=True)
-    created_at = Column(DateTime, default=func.now(), nullable=False)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now(), nullable=False)
     
     # Relationships
-    storage_items = relationship("StorageItemModel", back_populates="construction", cascade="all, delete-orphan")
+    storage_items = relationship("StorageItemModel", back_populates="construction", cascade="all, delete-orphan", lazy="raise")
+
+    __table_args__ = (
+        # Newest-first list pages (list_all / list_with_count)
+        Index("ix_constructions_created_at", created_at.desc()),
+        _name_trgm_index("ix_constructions_name_trgm", name),
+        # Names are unique case-insensitively; backs exists_by_name / get_by_name lookups
+        Index("ix_constructions_name_lower", func.lower(name), unique=True),
+    )
+
+
+_UNITS_BY_VALUE = {unit.value: unit for unit in UnitEnum}
+
+
+class UnitString(TypeDecorator):
+    """
+    VARCHAR unit column read back as the shared UnitEnum member.
+
+    Every material row would otherwise carry its own copy of one of a handful of
+    unit strings. Values outside UnitEnum (legacy rows) are returned unchanged.
+    """
+
+    impl = String(30)
+    cache_ok = True
+
+    def process_result_value(self, value, dialect):
+        return _UNITS_BY_VALUE.get(value, value)
+
 
 class MaterialModel(Base):
     """Material SQLAlchemy model."""
@@ -49,12 +109,22 @@ class MaterialModel(Base):
 
     name = Column(String(100), nullable=False, index=True)
     description = Column(Text, nullable=False, default="")
-    unit = Column(String(30), nullable=False)
-    created_at = Column(DateTime, default=func.now(), nullable=False)
+    unit = Column(UnitString, nullable=False)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now(), nullable=False)
 
     # Relationships
-    category = relationship("CategoryModel", back_populates="materials")
-    storage_items = relationship("StorageItemModel", back_populates="material")
+    category = relationship("CategoryModel", back_populates="materials", lazy="raise")
+    storage_items = relationship("StorageItemModel", back_populates="material", lazy="raise")
+
+    __table_args__ = (
+        # Materials of a category, newest first (get_by_category_id)
+        Index("ix_materials_category_created", category_id, created_at.desc()),
+        # Newest-first list pages; material_id is the keyset tie-breaker (list_after)
+        Index("ix_materials_created_at", created_at.desc(), material_id.desc()),
+        _name_trgm_index("ix_materials_name_trgm", name),
+        # Names are unique case-insensitively; backs exists_by_name / get_by_name(s) lookups
+        Index("ix_materials_name_lower", func.lower(name), unique=True),
+    )
 
 class StorageItemModel(Base):
     """Storage item SQLAlchemy model."""
@@ -64,8 +134,16 @@ class StorageItemModel(Base):
     construction_id = Column(UUID(as_uuid=True), ForeignKey("constructions.construction_id"), primary_key=True, nullable=False, index=True)
     material_id = Column(UUID(as_uuid=True), ForeignKey("materials.material_id"), primary_key=True, nullable=False)
     quantity_value = Column(DECIMAL(8, 2), nullable=False)
-    created_at = Column(DateTime, default=func.now(), nullable=False)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now(), nullable=False)
 
     # Relationships
-    construction = relationship("ConstructionModel", back_populates="storage_items")
-    material = relationship("MaterialModel", back_populates="storage_items")
+    construction = relationship("ConstructionModel", back_populates="storage_items", lazy="raise")
+    material = relationship("MaterialModel", back_populates="storage_items", lazy="raise")
+
+    __table_args__ = (
+        # Storage items of a construction, newest first (get_by_construction_id)
+        Index("ix_storage_items_construction_created", construction_id, created_at.desc()),
+        # Lookups by material (get_by_material_id); the composite PK leads with construction_id
+        Index("ix_storage_items_material", material_id),
+        CheckConstraint("quantity_value >= 0", name="ck_storage_items_qty_nonneg"),
+    )
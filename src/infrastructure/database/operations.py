@@ -0,0 +1,28 @@
+"""
+Error handling shared by repository methods.
+"""
+
+import functools
+from typing import Any, Awaitable, Callable, TypeVar
+
+from src.shared.exceptions import DatabaseError
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+
+def db_operation(message: str) -> Callable[[F], F]:
+    """
+    Wrap a repository method so any failure surfaces as DatabaseError("<message>: <error>").
+
+    Repositories neither commit nor roll back: the transaction belongs to the caller
+    (DBSessionMiddleware for HTTP requests), so several writes can share one commit.
+    """
+    def decorator(method: F) -> F:
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                return await method(self, *args, **kwargs)
+            except Exception as e:
+                raise DatabaseError(f"{message}: {str(e)}") from e
+        return wrapper
+    return decorator
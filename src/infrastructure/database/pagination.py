@@ -0,0 +1,38 @@
+"""
+Pagination helpers for repository queries.
+"""
+
+from typing import Any, List, Tuple
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def fetch_rows_with_count(
+    session: AsyncSession,
+    query: Select,
+    limit: int,
+    offset: int
+) -> Tuple[List[Tuple[Any, ...]], int]:
+    """
+    Fetch one page of a column select together with the total row count.
+
+    Rows are returned as plain tuples without the window column. The total comes
+    from COUNT(*) OVER() in the same statement. A page past the end returns no rows
+    (and therefore no window value), so only then a separate COUNT over the
+    unpaginated query is issued.
+    """
+    result = await session.execute(
+        query.add_columns(func.count().over().label("total")).limit(limit).offset(offset)
+    )
+    rows = result.all()
+
+    if rows:
+        return [row[:-1] for row in rows], rows[0].total
+    if not offset:
+        return [], 0
+
+    total = await session.scalar(
+        select(func.count()).select_from(query.order_by(None).subquery())
+    )
+    return [], total or 0
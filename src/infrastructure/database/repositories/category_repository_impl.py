@@ -2,133 +2,175 @@
 Category Repository Implementation (Adapter).
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, func
+from sqlalchemy import select, delete, func, bindparam, update, insert
 
 from src.domain.entities.category import Category
 from src.domain.repositories.category_repository import CategoryRepository
 from src.infrastructure.database.models import CategoryModel
+from src.infrastructure.database.identity_cache import session_get_cache
+from src.infrastructure.database.pagination import fetch_rows_with_count
+from src.infrastructure.database.search import LIKE_ESCAPE, contains_pattern
+from src.infrastructure.database.operations import db_operation
 from src.shared.exceptions import DatabaseError
 
+# Columns in Category.__init__ order; list queries select these instead of
+# hydrating ORM instances (no identity map, no per-row attribute access).
+_CATEGORY_COLUMNS = (
+    CategoryModel.category_id,
+    CategoryModel.name,
+    CategoryModel.created_at,
+)
+
+# Statements built once at import time; per-call values are bound parameters,
+# so every call reuses the same construct (and its compiled-cache entry).
+_GET_BY_ID = select(*_CATEGORY_COLUMNS).where(CategoryModel.category_id == bindparam("category_id"))
+# Expanding IN: one cached statement for any number of IDs
+_GET_MANY_BY_IDS = select(*_CATEGORY_COLUMNS).where(CategoryModel.category_id.in_(bindparam("category_ids", expanding=True)))
+_LIST_NEWEST_FIRST = select(*_CATEGORY_COLUMNS).order_by(CategoryModel.created_at.desc())
+_LIST_PAGE = _LIST_NEWEST_FIRST.limit(bindparam("limit")).offset(bindparam("offset"))
+_COUNT_ALL = select(func.count(CategoryModel.category_id))
+# Writes too; WHERE parameters of an UPDATE cannot reuse column names (reserved for SET)
+_UPDATE = (
+    update(CategoryModel)
+    .where(CategoryModel.category_id == bindparam("target_id"))
+    .values(name=bindparam("name"))
+    .returning(*_CATEGORY_COLUMNS)
+    .execution_options(synchronize_session=False)
+)
+_DELETE = delete(CategoryModel).where(CategoryModel.category_id == bindparam("category_id"))
+
 
 class CategoryRepositoryImpl(CategoryRepository):
     """Category repository implementation."""
     
+    __slots__ = ("_session", "_get_cache")
+    
     def __init__(self, session: AsyncSession):
         self._session = session
+        self._get_cache = session_get_cache(session)
     
+    @db_operation("Failed to create category")
     async def create(self, category: Category) -> Category:
         """Create a new category."""
-        try:
-            category_model = CategoryModel(
+        # INSERT ... RETURNING: no unit-of-work flush and no refresh SELECT
+        result = await self._session.execute(
+            insert(CategoryModel)
+            .values(
                 category_id=category.id,
                 name=category.name,
                 created_at=category.created_at
             )
-            
-            self._session.add(category_model)
-            await self._session.commit()
-            await self._session.refresh(category_model)
-            
-            return self._to_domain(category_model)
-        except Exception as e:
-            await self._session.rollback()
-            raise DatabaseError(f"Failed to create category: {str(e)}") from e
+            .returning(*_CATEGORY_COLUMNS)
+        )
+        row = result.one()
+        
+        created = self._get_cache[(CategoryModel, row.category_id)] = Category(*row)
+        return created
     
+    @db_operation("Failed to get category by ID")
     async def get_by_id(self, category_id: UUID) -> Optional[Category]:
         """Get category by ID."""
-        try:
-            result = await self._session.execute(
-                select(CategoryModel).where(CategoryModel.category_id == category_id)
-            )
-            category_model = result.scalar_one_or_none()
-            
-            return self._to_domain(category_model) if category_model else None
-        except Exception as e:
-            raise DatabaseError(f"Failed to get category by ID: {str(e)}") from e
+        cache_key = (CategoryModel, category_id)
+        cached = self._get_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        result = await self._session.execute(_GET_BY_ID, {"category_id": category_id})
+        row = result.one_or_none()
+        
+        if row is None:
+            return None
+        category = self._get_cache[cache_key] = Category(*row)
+        return category
+    
+    @db_operation("Failed to get categories by IDs")
+    async def get_many_by_ids(self, category_ids: List[UUID]) -> Dict[UUID, Category]:
+        """Get categories by IDs in one query; missing IDs are absent from the result."""
+        found: Dict[UUID, Category] = {}
+        missing = []
+        for category_id in set(category_ids):
+            cached = self._get_cache.get((CategoryModel, category_id))
+            if cached is not None:
+                found[category_id] = cached
+            else:
+                missing.append(category_id)
+        if not missing:
+            return found
+        result = await self._session.execute(_GET_MANY_BY_IDS, {"category_ids": missing})
+        
+        for row in result:
+            found[row.category_id] = self._get_cache[(CategoryModel, row.category_id)] = Category(*row)
+        return found
     
     async def update(self, category: Category) -> Category:
         """Update existing category."""
         try:
+            # Single UPDATE ... RETURNING instead of SELECT + flush + refresh
             result = await self._session.execute(
-                select(CategoryModel).where(CategoryModel.category_id == category.id)
+                _UPDATE,
+                {"target_id": category.id, "name": category.name}
             )
-            category_model = result.scalar_one_or_none()
+            row = result.one_or_none()
             
-            if not category_model:
+            if row is None:
                 raise DatabaseError(f"Category with ID {category.id} not found")
             
-            category_model.name = category.name
-            
-            await self._session.commit()
-            await self._session.refresh(category_model)
-            
-            return self._to_domain(category_model)
+            updated = self._get_cache[(CategoryModel, row.category_id)] = Category(*row)
+            return updated
         except Exception as e:
-            await self._session.rollback()
+            # The row state is unknown after a failed write - reload it on the next lookup
+            self._get_cache.pop((CategoryModel, category.id), None)
             raise DatabaseError(f"Failed to update category: {str(e)}") from e
     
+    @db_operation("Failed to delete category")
     async def delete(self, category_id: UUID) -> bool:
         """Delete category by ID."""
-        try:
-            result = await self._session.execute(
-                delete(CategoryModel).where(CategoryModel.category_id == category_id)
-            )
-            await self._session.commit()
-            
-            return result.rowcount > 0
-        except Exception as e:
-            await self._session.rollback()
-            raise DatabaseError(f"Failed to delete category: {str(e)}") from e
+        result = await self._session.execute(_DELETE, {"category_id": category_id})
+        self._get_cache.pop((CategoryModel, category_id), None)
+        
+        return result.rowcount > 0
     
+    @db_operation("Failed to list categories")
     async def list_all(self, limit: int = 100, offset: int = 0) -> List[Category]:
         """List all categories with pagination."""
-        try:
-            result = await self._session.execute(
-                select(CategoryModel)
-                .offset(offset)
-                .limit(limit)
-                .order_by(CategoryModel.created_at.desc())
-            )
-            category_models = result.scalars().all()
-            
-            return [self._to_domain(category_model) for category_model in category_models]
-        except Exception as e:
-            raise DatabaseError(f"Failed to list categories: {str(e)}") from e
+        result = await self._session.execute(_LIST_PAGE, {"limit": limit, "offset": offset})
+        
+        return [Category(*row) for row in result]
+    
+    @db_operation("Failed to list categories")
+    async def list_with_count(self, limit: int = 100, offset: int = 0) -> Tuple[List[Category], int]:
+        """List categories with the total count in one query."""
+        rows, total = await fetch_rows_with_count(
+            self._session,
+            _LIST_NEWEST_FIRST,
+            limit=limit,
+            offset=offset
+        )
+        
+        return [Category(*row) for row in rows], total
     
     async def search_by_name(self, name: str, limit: int = 100, offset: int = 0) -> List[Category]:
         """Search categories by name."""
-        try:
-            result = await self._session.execute(
-                select(CategoryModel)
-                .where(CategoryModel.name.ilike(f"%{name}%"))
-                .offset(offset)
-                .limit(limit)
-                .order_by(CategoryModel.created_at.desc())
-            )
-            category_models = result.scalars().all()
-            
-            return [self._to_domain(category_model) for category_model in category_models]
-        except Exception as e:
-            raise DatabaseError(f"Failed to search categories by name: {str(e)}") from e
+        categories, _ = await self.search_by_name_with_count(name, limit=limit, offset=offset)
+        return categories
+    
+    @db_operation("Failed to search categories by name")
+    async def search_by_name_with_count(self, name: str, limit: int = 100, offset: int = 0) -> Tuple[List[Category], int]:
+        """Search categories by name; total comes from COUNT(*) OVER() in the same query."""
+        rows, total = await fetch_rows_with_count(
+            self._session,
+            select(*_CATEGORY_COLUMNS)
+            .where(CategoryModel.name.ilike(contains_pattern(name), escape=LIKE_ESCAPE))
+            .order_by(CategoryModel.created_at.desc()),
+            limit=limit,
+            offset=offset
+        )
+        
+        return [Category(*row) for row in rows], total
     
+    @db_operation("Failed to count categories")
     async def count_all(self) -> int:
         """Count total number of categories."""
-        try:
-            result = await self._session.execute(
-                select(func.count(CategoryModel.category_id))
-            )
-            return result.scalar() or 0
-        except Exception as e:
-            raise DatabaseError(f"Failed to count categories: {str(e)}") from e
-    
-    def _to_domain(self, category_model: CategoryModel) -> Category:
-        """Convert SQLAlchemy model to domain entity."""
-        return Category(
-            category_id=category_model.category_id,
-            name=category_model.name,
-            created_at=category_model.created_at
-        )
-
+        return (await self._session.scalar(_COUNT_ALL)) or 0
@@ -2,28 +2,86 @@
 Construction Repository Implementation (Adapter).
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, func
+from sqlalchemy import select, delete, func, exists, bindparam, update, insert, cast, BigInteger, Float
 
 from src.domain.entities.construction import Construction
+from src.domain.value_objects.construction_status import ConstructionStatus
 from src.domain.repositories.construction_repository import ConstructionRepository
 from src.infrastructure.database.models import ConstructionModel, StorageItemModel
+from src.infrastructure.database.identity_cache import session_get_cache
+from src.infrastructure.database.pagination import fetch_rows_with_count
+from src.infrastructure.database.search import LIKE_ESCAPE, contains_pattern
+from src.infrastructure.database.operations import db_operation
 from src.shared.exceptions import DatabaseError
 
+# All table columns in Construction.__init__ order; reads select these instead of
+# hydrating ORM instances, and INSERT/UPDATE ... RETURNING returns them.
+_CONSTRUCTION_COLUMNS = (
+    ConstructionModel.construction_id,
+    ConstructionModel.name,
+    ConstructionModel.description,
+    ConstructionModel.address,
+    ConstructionModel.start_date,
+    ConstructionModel.status,
+    ConstructionModel.img_url,
+    ConstructionModel.created_at,
+)
+
+# Statements built once at import time; per-call values are bound parameters,
+# so every call reuses the same construct (and its compiled-cache entry).
+_GET_BY_ID = select(*_CONSTRUCTION_COLUMNS).where(ConstructionModel.construction_id == bindparam("construction_id"))
+# Expanding IN: one cached statement for any number of IDs
+_GET_MANY_BY_IDS = select(*_CONSTRUCTION_COLUMNS).where(ConstructionModel.construction_id.in_(bindparam("construction_ids", expanding=True)))
+_LIST_NEWEST_FIRST = select(*_CONSTRUCTION_COLUMNS).order_by(ConstructionModel.created_at.desc())
+_LIST_PAGE = _LIST_NEWEST_FIRST.limit(bindparam("limit")).offset(bindparam("offset"))
+_COUNT_ALL = select(func.count(ConstructionModel.construction_id))
+# Writes too; WHERE parameters of an UPDATE cannot reuse column names (reserved for SET)
+_UPDATE = (
+    update(ConstructionModel)
+    .where(ConstructionModel.construction_id == bindparam("target_id"))
+    .values(
+        name=bindparam("name"),
+        description=bindparam("description"),
+        address=bindparam("address"),
+        start_date=bindparam("start_date"),
+        status=bindparam("status"),
+        img_url=bindparam("img_url")
+    )
+    .returning(*_CONSTRUCTION_COLUMNS)
+    .execution_options(synchronize_session=False)
+)
+_DELETE = delete(ConstructionModel).where(ConstructionModel.construction_id == bindparam("construction_id"))
+
+
+def _construction_from_row(row) -> Construction:
+    """Convert a row of _CONSTRUCTION_COLUMNS (Construction.__init__ order) to domain entity."""
+    construction_id, name, description, address, start_date, status, img_url, created_at = row
+    return Construction(
+        construction_id, name, description, address, start_date,
+        ConstructionStatus(status), img_url, created_at
+    )
+
 
 class ConstructionRepositoryImpl(ConstructionRepository):
     """Construction repository implementation."""
     
+    __slots__ = ("_session", "_get_cache")
+    
     def __init__(self, session: AsyncSession):
         self._session = session
+        self._get_cache = session_get_cache(session)
     
+    @db_operation("Failed to create construction")
     async def create(self, construction: Construction) -> Construction:
         """Create a new construction."""
-        try:
-            construction_model = ConstructionModel(
+        # INSERT ... RETURNING: no unit-of-work flush and no refresh SELECT
+        result = await self._session.execute(
+            insert(ConstructionModel)
+            .values(
                 construction_id=construction.id,
                 name=construction.name,
                 description=construction.description,
@@ -33,187 +91,205 @@ class ConstructionRepositoryImpl(ConstructionRepository):
                 img_url=construction.img_url,
                 created_at=construction.created_at
             )
-            
-            self._session.add(construction_model)
-            await self._session.commit()
-            await self._session.refresh(construction_model)
-            
-            return self._to_domain(construction_model)
-        except Exception as e:
-            await self._session.rollback()
-            raise DatabaseError(f"Failed to create construction: {str(e)}") from e
+            .returning(*_CONSTRUCTION_COLUMNS)
+        )
+        row = result.one()
+        
+        created = self._get_cache[(ConstructionModel, row.construction_id)] = _construction_from_row(row)
+        return created
     
+    @db_operation("Failed to get construction by ID")
     async def get_by_id(self, construction_id: UUID) -> Optional[Construction]:
         """Get construction by ID."""
-        try:
-            result = await self._session.execute(
-                select(ConstructionModel).where(ConstructionModel.construction_id == construction_id)
-            )
-            construction_model = result.scalar_one_or_none()
-            
-            return self._to_domain(construction_model) if construction_model else None
-        except Exception as e:
-            raise DatabaseError(f"Failed to get construction by ID: {str(e)}") from e
+        cache_key = (ConstructionModel, construction_id)
+        cached = self._get_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        result = await self._session.execute(_GET_BY_ID, {"construction_id": construction_id})
+        row = result.one_or_none()
+        
+        if row is None:
+            return None
+        construction = self._get_cache[cache_key] = _construction_from_row(row)
+        return construction
+    
+    @db_operation("Failed to check construction existence")
+    async def exists(self, construction_id: UUID) -> bool:
+        """Check whether construction with given ID exists."""
+        return bool(await self._session.scalar(
+            select(exists().where(ConstructionModel.construction_id == construction_id))
+        ))
+    
+    @db_operation("Failed to get constructions by IDs")
+    async def get_many_by_ids(self, construction_ids: List[UUID]) -> Dict[UUID, Construction]:
+        """Get constructions by IDs in one query; missing IDs are absent from the result."""
+        found: Dict[UUID, Construction] = {}
+        missing = []
+        for construction_id in set(construction_ids):
+            cached = self._get_cache.get((ConstructionModel, construction_id))
+            if cached is not None:
+                found[construction_id] = cached
+            else:
+                missing.append(construction_id)
+        if not missing:
+            return found
+        result = await self._session.execute(_GET_MANY_BY_IDS, {"construction_ids": missing})
+        
+        for row in result:
+            found[row.construction_id] = self._get_cache[(ConstructionModel, row.construction_id)] = _construction_from_row(row)
+        return found
     
     async def update(self, construction: Construction) -> Construction:
         """Update existing construction."""
         try:
+            # Single UPDATE ... RETURNING instead of SELECT + flush + refresh
             result = await self._session.execute(
-                select(ConstructionModel).where(ConstructionModel.construction_id == construction.id)
+                _UPDATE,
+                {
+                    "target_id": construction.id,
+                    "name": construction.name,
+                    "description": construction.description,
+                    "address": construction.address,
+                    "start_date": construction.start_date,
+                    "status": construction.status,
+                    "img_url": construction.img_url
+                }
             )
-            construction_model = result.scalar_one_or_none()
+            row = result.one_or_none()
             
-            if not construction_model:
+            if row is None:
                 raise DatabaseError(f"Construction with ID {construction.id} not found")
             
-            construction_model.name = construction.name
-            construction_model.description = construction.description
-            construction_model.address = construction.address
-            construction_model.start_date = construction.start_date
-            construction_model.status = construction.status
-            construction_model.img_url = construction.img_url
-            
-            await self._session.commit()
-            await self._session.refresh(construction_model)
-            
-            return self._to_domain(construction_model)
+            updated = self._get_cache[(ConstructionModel, row.construction_id)] = _construction_from_row(row)
+            return updated
         except Exception as e:
-            await self._session.rollback()
+            # The row state is unknown after a failed write - reload it on the next lookup
+            self._get_cache.pop((ConstructionModel, construction.id), None)
             raise DatabaseError(f"Failed to update construction: {str(e)}") from e
     
+    @db_operation("Failed to delete construction")
     async def delete(self, construction_id: UUID) -> bool:
         """Delete construction by ID."""
-        try:
-            result = await self._session.execute(
-                delete(ConstructionModel).where(ConstructionModel.construction_id == construction_id)
-            )
-            await self._session.commit()
-            
-            return result.rowcount > 0
-        except Exception as e:
-            await self._session.rollback()
-            raise DatabaseError(f"Failed to delete construction: {str(e)}") from e
+        result = await self._session.execute(_DELETE, {"construction_id": construction_id})
+        self._get_cache.pop((ConstructionModel, construction_id), None)
+        
+        return result.rowcount > 0
     
+    @db_operation("Failed to list constructions")
     async def list_all(self, limit: int = 100, offset: int = 0) -> List[Construction]:
         """List all constructions with pagination."""
-        try:
-            result = await self._session.execute(
-                select(ConstructionModel)
-                .offset(offset)
-                .limit(limit)
-                .order_by(ConstructionModel.created_at.desc())
-            )
-            construction_models = result.scalars().all()
-            
-            return [self._to_domain(construction_model) for construction_model in construction_models]
-        except Exception as e:
-            raise DatabaseError(f"Failed to list constructions: {str(e)}") from e
+        result = await self._session.execute(_LIST_PAGE, {"limit": limit, "offset": offset})
+        
+        return list(map(_construction_from_row, result))
+    
+    @db_operation("Failed to list constructions")
+    async def list_with_count(self, limit: int = 100, offset: int = 0) -> Tuple[List[Construction], int]:
+        """List constructions with the total count in one query."""
+        rows, total = await fetch_rows_with_count(
+            self._session,
+            _LIST_NEWEST_FIRST,
+            limit=limit,
+            offset=offset
+        )
+        
+        return list(map(_construction_from_row, rows)), total
     
     async def search_by_name(self, name: str, limit: int = 100, offset: int = 0) -> List[Construction]:
         """Search constructions by name."""
-        try:
-            result = await self._session.execute(
-                select(ConstructionModel)
-                .where(ConstructionModel.name.ilike(f"%{name}%"))
-                .offset(offset)
-                .limit(limit)
-                .order_by(ConstructionModel.created_at.desc())
-            )
-            construction_models = result.scalars().all()
-            
-            return [self._to_domain(construction_model) for construction_model in construction_models]
-        except Exception as e:
-            raise DatabaseError(f"Failed to search constructions by name: {str(e)}") from e
+        constructions, _ = await self.search_by_name_with_count(name, limit=limit, offset=offset)
+        return constructions
     
+    @db_operation("Failed to search constructions by name")
+    async def search_by_name_with_count(
+        self,
+        name: str,
+        limit: int = 100,
+        offset: int = 0,
+        status: Optional[ConstructionStatus] = None
+    ) -> Tuple[List[Construction], int]:
+        """Search constructions by name; total comes from COUNT(*) OVER() in the same query."""
+        filters = [ConstructionModel.name.ilike(contains_pattern(name), escape=LIKE_ESCAPE)]
+        if status is not None:
+            filters.append(ConstructionModel.status == status.value)
+        
+        rows, total = await fetch_rows_with_count(
+            self._session,
+            select(*_CONSTRUCTION_COLUMNS)
+            .where(*filters)
+            .order_by(ConstructionModel.created_at.desc()),
+            limit=limit,
+            offset=offset
+        )
+        
+        return list(map(_construction_from_row, rows)), total
+    
+    @db_operation("Failed to check construction name")
+    async def exists_by_name(self, name: str, exclude_id: Optional[UUID] = None) -> bool:
+        """Check whether a construction with given name exists (case-insensitive)."""
+        condition = exists().where(func.lower(ConstructionModel.name) == func.lower(name))
+        if exclude_id is not None:
+            condition = condition.where(ConstructionModel.construction_id != exclude_id)
+        return bool(await self._session.scalar(select(condition)))
+    
+    @db_operation("Failed to get construction by name")
     async def get_by_name(self, name: str) -> Optional[Construction]:
         """Get construction by exact name match (case-insensitive)."""
-        try:
-            result = await self._session.execute(
-                select(ConstructionModel)
-                .where(func.lower(ConstructionModel.name) == func.lower(name))
-                .limit(1)
-            )
-            construction_model = result.scalar_one_or_none()
-            
-            return self._to_domain(construction_model) if construction_model else None
-        except Exception as e:
-            raise DatabaseError(f"Failed to get construction by name: {str(e)}") from e
+        result = await self._session.execute(
+            select(*_CONSTRUCTION_COLUMNS)
+            .where(func.lower(ConstructionModel.name) == func.lower(name))
+        )
+        # At most one row: lower(name) has a unique index
+        row = result.one_or_none()
+        
+        return _construction_from_row(row) if row else None
     
+    @db_operation("Failed to count constructions")
     async def count_all(self) -> int:
         """Count total number of constructions."""
-        try:
-            result = await self._session.execute(
-                select(func.count(ConstructionModel.construction_id))
-            )
-            return result.scalar() or 0
-        except Exception as e:
-            raise DatabaseError(f"Failed to count constructions: {str(e)}") from e
+        return (await self._session.scalar(_COUNT_ALL)) or 0
     
-    async def get_statistics(self, from_date: Optional[datetime] = None) -> List[dict]:
-        """Get statistics for all constructions."""
-        try:
-            now = datetime.now(timezone.utc)
-            
-            # Buduj warunek join - jeśli podano from_date, dodaj go do warunku join
-            join_condition = ConstructionModel.construction_id == StorageItemModel.construction_id
-            if from_date is not None:
-                join_condition = join_condition & (StorageItemModel.created_at >= from_date)
-            
-            query = select(
-                ConstructionModel.construction_id,
-                ConstructionModel.name.label('construction_name'),
-                func.coalesce(
-                    func.count(func.distinct(StorageItemModel.material_id)),
-                    0
-                ).label('total_items'),
-                func.coalesce(func.sum(StorageItemModel.quantity_value), 0.0).label('total_quantity')
-            ).outerjoin(
-                StorageItemModel, 
-                join_condition
-            ).group_by(
-                ConstructionModel.construction_id, 
-                ConstructionModel.name
-            ).order_by(ConstructionModel.name)
-            
-            result = await self._session.execute(query)
-            rows = result.all()
-            
-            statistics = []
-            for row in rows:
-                # Obsługa total_items - count może zwrócić 0 lub None
-                total_items = 0
-                if row.total_items is not None:
-                    total_items = int(row.total_items)
-                
-                # Obsługa total_quantity - sum może zwrócić None lub 0
-                total_quantity = 0.0
-                if row.total_quantity is not None:
-                    total_quantity = float(row.total_quantity)
-                
-                statistics.append({
-                    'construction_id': row.construction_id,
-                    'construction_name': row.construction_name or None,
-                    'total_items': total_items,
-                    'total_quantity': total_quantity,
-                    'measured_at': now,
-                    'last_sync_at': now
-                })
-            
-            return statistics
-        except Exception as e:
-            raise DatabaseError(f"Failed to get construction statistics: {str(e)}") from e
-    
-    def _to_domain(self, construction_model: ConstructionModel) -> Construction:
-        """Convert SQLAlchemy model to domain entity."""
-        from src.domain.value_objects.construction_status import ConstructionStatus
-        return Construction(
-            construction_id=construction_model.construction_id,
-            name=construction_model.name,
-            description=construction_model.description,
-            address=construction_model.address,
-            start_date=construction_model.start_date,
-            status=ConstructionStatus(construction_model.status),
-            img_url=construction_model.img_url,
-            created_at=construction_model.created_at
-        )
-
+    @db_operation("Failed to get construction statistics")
+    async def get_statistics(
+        self,
+        from_date: Optional[datetime] = None,
+        limit: int = 1000,
+        offset: int = 0
+    ) -> List[dict]:
+        """Get statistics for constructions (paginated, ordered by name)."""
+        now = datetime.now(timezone.utc)
+        
+        # Buduj warunek join - jeśli podano from_date, dodaj go do warunku join
+        join_condition = ConstructionModel.construction_id == StorageItemModel.construction_id
+        if from_date is not None:
+            join_condition = join_condition & (StorageItemModel.created_at >= from_date)
+        
+        # Typy i wartości domyślne ustalane w SQL (COUNT nigdy nie zwraca NULL)
+        query = select(
+            ConstructionModel.construction_id,
+            ConstructionModel.name.label('construction_name'),
+            cast(func.count(func.distinct(StorageItemModel.material_id)), BigInteger).label('total_items'),
+            cast(func.coalesce(func.sum(StorageItemModel.quantity_value), 0), Float).label('total_quantity')
+        ).outerjoin(
+            StorageItemModel, 
+            join_condition
+        ).group_by(
+            ConstructionModel.construction_id, 
+            ConstructionModel.name
+        ).order_by(
+            ConstructionModel.name,
+            ConstructionModel.construction_id
+        ).limit(limit).offset(offset)
+        
+        result = await self._session.execute(query)
+        
+        return [
+            {
+                'construction_id': row.construction_id,
+                'construction_name': row.construction_name or None,
+                'total_items': row.total_items,
+                'total_quantity': row.total_quantity,
+                'measured_at': now,
+                'last_sync_at': now
+            }
+            for row in result
+        ]
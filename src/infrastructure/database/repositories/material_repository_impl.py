@@ -2,28 +2,84 @@
 Material Repository Implementation (Adapter).
 """
 
-from typing import List, Optional, Tuple
+import heapq
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
+from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, func
-from rapidfuzz import fuzz
+from sqlalchemy import select, delete, func, exists, bindparam, update, insert, literal, or_, tuple_
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
 
 from src.domain.entities.materials import Materials
 from src.domain.repositories.material_repository import MaterialRepository
 from src.infrastructure.database.models import MaterialModel, StorageItemModel
+from src.infrastructure.database.identity_cache import session_get_cache
+from src.infrastructure.database.pagination import fetch_rows_with_count
+from src.infrastructure.database.operations import db_operation
 from src.shared.exceptions import DatabaseError
 
+# Columns in Materials.__init__ order; reads select these instead of hydrating
+# ORM instances, and INSERT/UPDATE ... RETURNING returns them.
+_MATERIAL_COLUMNS = (
+    MaterialModel.material_id,
+    MaterialModel.category_id,
+    MaterialModel.name,
+    MaterialModel.description,
+    MaterialModel.unit,
+    MaterialModel.created_at,
+)
+
+# Statements built once at import time; per-call values are bound parameters,
+# so every call reuses the same construct (and its compiled-cache entry).
+_GET_BY_ID = select(*_MATERIAL_COLUMNS).where(MaterialModel.material_id == bindparam("material_id"))
+# Expanding IN: one cached statement for any number of IDs
+_GET_MANY_BY_IDS = select(*_MATERIAL_COLUMNS).where(MaterialModel.material_id.in_(bindparam("material_ids", expanding=True)))
+_LIST_NEWEST_FIRST = select(*_MATERIAL_COLUMNS).order_by(MaterialModel.created_at.desc())
+_LIST_PAGE = _LIST_NEWEST_FIRST.limit(bindparam("limit")).offset(bindparam("offset"))
+_LIST_KEYSET = select(*_MATERIAL_COLUMNS).order_by(MaterialModel.created_at.desc(), MaterialModel.material_id.desc())
+_COUNT_ALL = select(func.count(MaterialModel.material_id))
+# Writes too; WHERE parameters of an UPDATE cannot reuse column names (reserved for SET)
+_UPDATE = (
+    update(MaterialModel)
+    .where(MaterialModel.material_id == bindparam("target_id"))
+    .values(
+        category_id=bindparam("category_id"),
+        name=bindparam("name"),
+        description=bindparam("description"),
+        unit=bindparam("unit")
+    )
+    .returning(*_MATERIAL_COLUMNS)
+    .execution_options(synchronize_session=False)
+)
+_DELETE = delete(MaterialModel).where(MaterialModel.material_id == bindparam("material_id"))
+
+# Rows per multi-row INSERT in create_bulk (6 bind parameters per row)
+_BULK_INSERT_CHUNK_SIZE = 1000
+# From this many rows create_bulk loads with COPY on asyncpg (no per-row INSERT parsing)
+_COPY_THRESHOLD = 500
+# Fuzzy search candidates (non-PostgreSQL): at most this many rows, fetched and
+# scored in batches so only one batch plus the requested page are held at a time
+_FUZZY_CANDIDATE_LIMIT = 500
+_FUZZY_BATCH_SIZE = 200
+
 
 class MaterialRepositoryImpl(MaterialRepository):
     """Material repository implementation."""
     
+    __slots__ = ("_session", "_get_cache")
+    
     def __init__(self, session: AsyncSession):
         self._session = session
+        self._get_cache = session_get_cache(session)
     
+    @db_operation("Failed to create material")
     async def create(self, material: Materials) -> Materials:
         """Create a new material."""
-        try:
-            material_model = MaterialModel(
+        # INSERT ... RETURNING: no unit-of-work flush and no refresh SELECT
+        result = await self._session.execute(
+            insert(MaterialModel)
+            .values(
                 material_id=material.id,
                 category_id=material.category_id,
                 name=material.name,
@@ -31,231 +87,362 @@ class MaterialRepositoryImpl(MaterialRepository):
                 unit=material.unit,
                 created_at=material.created_at
             )
-            
-            self._session.add(material_model)
-            await self._session.commit()
-            await self._session.refresh(material_model)
-            
-            return self._to_domain(material_model)
-        except Exception as e:
-            await self._session.rollback()
-            raise DatabaseError(f"Failed to create material: {str(e)}") from e
+            .returning(*_MATERIAL_COLUMNS)
+        )
+        row = result.one()
+        
+        created = self._get_cache[(MaterialModel, row.material_id)] = Materials(*row)
+        return created
     
+    @db_operation("Failed to create materials in bulk")
     async def create_bulk(self, materials: List[Materials]) -> List[Materials]:
         """Create multiple materials at once."""
-        try:
-            material_models = [
-                MaterialModel(
-                    material_id=material.id,
-                    category_id=material.category_id,
-                    name=material.name,
-                    description=material.description,
-                    unit=material.unit,
-                    created_at=material.created_at
-                )
-                for material in materials
-            ]
-            
-            self._session.add_all(material_models)
-            await self._session.commit()
-            
-            # Refresh all models to get database-generated values
-            for material_model in material_models:
-                await self._session.refresh(material_model)
-            
-            return [self._to_domain(material_model) for material_model in material_models]
-        except Exception as e:
-            await self._session.rollback()
-            raise DatabaseError(f"Failed to create materials in bulk: {str(e)}") from e
+        if not materials:
+            return []
+        if len(materials) >= _COPY_THRESHOLD and self._session.get_bind().dialect.driver == "asyncpg":
+            return await self._copy_bulk(materials)
+        # Multi-row INSERT ... RETURNING in chunks (bind parameter limits)
+        created: Dict[UUID, Materials] = {}
+        for start in range(0, len(materials), _BULK_INSERT_CHUNK_SIZE):
+            result = await self._session.execute(
+                insert(MaterialModel)
+                .values([
+                    {
+                        "material_id": material.id,
+                        "category_id": material.category_id,
+                        "name": material.name,
+                        "description": material.description,
+                        "unit": material.unit,
+                        "created_at": material.created_at
+                    }
+                    for material in materials[start:start + _BULK_INSERT_CHUNK_SIZE]
+                ])
+                .returning(*_MATERIAL_COLUMNS)
+            )
+            for row in result:
+                created[row.material_id] = Materials(*row)
+        
+        for material_id, material in created.items():
+            self._get_cache[(MaterialModel, material_id)] = material
+        # RETURNING order is not guaranteed - keep the input order
+        return [created[material.id] for material in materials]
     
+    async def _copy_bulk(self, materials: List[Materials]) -> List[Materials]:
+        """
+        Load a large batch with COPY (asyncpg copy_records_to_table).
+        
+        COPY has no RETURNING, but every column is supplied by the entities, so they
+        are returned as-is.
+        """
+        # The asyncpg adapter begins its transaction lazily, on the first statement.
+        # Run one so the COPY below nests in the request transaction as a savepoint
+        # instead of committing on its own (out of reach of the request rollback).
+        await self._session.execute(select(literal(1)))
+        connection = await self._session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        if not driver_connection.is_in_transaction():
+            raise DatabaseError("COPY must run inside the request transaction")
+        async with driver_connection.transaction():
+            await driver_connection.copy_records_to_table(
+                MaterialModel.__tablename__,
+                columns=[column.name for column in _MATERIAL_COLUMNS],
+                records=[
+                    (
+                        material.id,
+                        material.category_id,
+                        material.name,
+                        material.description,
+                        material.unit,
+                        material.created_at
+                    )
+                    for material in materials
+                ]
+            )
+        
+        for material in materials:
+            self._get_cache[(MaterialModel, material.id)] = material
+        return list(materials)
+    
+    @db_operation("Failed to get material by ID")
     async def get_by_id(self, material_id: UUID) -> Optional[Materials]:
         """Get material by ID."""
-        try:
-            result = await self._session.execute(
-                select(MaterialModel).where(MaterialModel.material_id == material_id)
-            )
-            material_model = result.scalar_one_or_none()
-            
-            return self._to_domain(material_model) if material_model else None
-        except Exception as e:
-            raise DatabaseError(f"Failed to get material by ID: {str(e)}") from e
+        cache_key = (MaterialModel, material_id)
+        cached = self._get_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        result = await self._session.execute(_GET_BY_ID, {"material_id": material_id})
+        row = result.one_or_none()
+        
+        if row is None:
+            return None
+        material = self._get_cache[cache_key] = Materials(*row)
+        return material
+    
+    @db_operation("Failed to get materials by IDs")
+    async def get_many_by_ids(self, material_ids: List[UUID]) -> Dict[UUID, Materials]:
+        """Get materials by IDs in one query; missing IDs are absent from the result."""
+        found: Dict[UUID, Materials] = {}
+        missing = []
+        for material_id in set(material_ids):
+            cached = self._get_cache.get((MaterialModel, material_id))
+            if cached is not None:
+                found[material_id] = cached
+            else:
+                missing.append(material_id)
+        if not missing:
+            return found
+        result = await self._session.execute(_GET_MANY_BY_IDS, {"material_ids": missing})
+        
+        for row in result:
+            found[row.material_id] = self._get_cache[(MaterialModel, row.material_id)] = Materials(*row)
+        return found
     
     async def update(self, material: Materials) -> Materials:
         """Update existing material."""
         try:
+            # Single UPDATE ... RETURNING instead of SELECT + flush + refresh
             result = await self._session.execute(
-                select(MaterialModel).where(MaterialModel.material_id == material.id)
+                _UPDATE,
+                {
+                    "target_id": material.id,
+                    "category_id": material.category_id,
+                    "name": material.name,
+                    "description": material.description,
+                    "unit": material.unit
+                }
             )
-            material_model = result.scalar_one_or_none()
+            row = result.one_or_none()
             
-            if not material_model:
+            if row is None:
                 raise DatabaseError(f"Material with ID {material.id} not found")
             
-            material_model.category_id = material.category_id
-            material_model.name = material.name
-            material_model.description = material.description
-            material_model.unit = material.unit
-            
-            await self._session.commit()
-            await self._session.refresh(material_model)
-            
-            return self._to_domain(material_model)
+            updated = self._get_cache[(MaterialModel, row.material_id)] = Materials(*row)
+            return updated
         except Exception as e:
-            await self._session.rollback()
+            # The row state is unknown after a failed write - reload it on the next lookup
+            self._get_cache.pop((MaterialModel, material.id), None)
             raise DatabaseError(f"Failed to update material: {str(e)}") from e
     
+    @db_operation("Failed to delete material")
     async def delete(self, material_id: UUID) -> bool:
         """Delete material by ID."""
-        try:
-            result = await self._session.execute(
-                delete(MaterialModel).where(MaterialModel.material_id == material_id)
-            )
-            await self._session.commit()
-            
-            return result.rowcount > 0
-        except Exception as e:
-            await self._session.rollback()
-            raise DatabaseError(f"Failed to delete material: {str(e)}") from e
+        result = await self._session.execute(_DELETE, {"material_id": material_id})
+        self._get_cache.pop((MaterialModel, material_id), None)
+        
+        return result.rowcount > 0
     
+    @db_operation("Failed to list materials")
     async def list_all(self, limit: int = 100, offset: int = 0) -> List[Materials]:
         """List all materials with pagination."""
-        try:
-            result = await self._session.execute(
-                select(MaterialModel)
-                .offset(offset)
-                .limit(limit)
-                .order_by(MaterialModel.created_at.desc())
-            )
-            material_models = result.scalars().all()
-            
-            return [self._to_domain(material_model) for material_model in material_models]
-        except Exception as e:
-            raise DatabaseError(f"Failed to list materials: {str(e)}") from e
+        result = await self._session.execute(_LIST_PAGE, {"limit": limit, "offset": offset})
+        
+        return [Materials(*row) for row in result]
+    
+    @db_operation("Failed to list materials")
+    async def list_with_count(self, limit: int = 100, offset: int = 0) -> Tuple[List[Materials], int]:
+        """List materials with the total count in one query."""
+        rows, total = await fetch_rows_with_count(
+            self._session,
+            _LIST_NEWEST_FIRST,
+            limit=limit,
+            offset=offset
+        )
+        
+        return [Materials(*row) for row in rows], total
+    
+    @db_operation("Failed to list materials")
+    async def list_after(self, cursor: Optional[Tuple[datetime, UUID]], limit: int = 100) -> List[Materials]:
+        """List materials newest first, starting after the (created_at, material_id) cursor."""
+        # Keyset pagination: the cursor is a position in ix_materials_created_at, so any
+        # page costs one index seek instead of skipping OFFSET rows
+        query = _LIST_KEYSET
+        if cursor is not None:
+            query = query.where(tuple_(MaterialModel.created_at, MaterialModel.material_id) < tuple_(*cursor))
+        result = await self._session.execute(query.limit(limit))
+        
+        return [Materials(*row) for row in result]
     
+    @db_operation("Failed to get materials by category ID")
     async def get_by_category_id(self, category_id: UUID, limit: int = 100, offset: int = 0) -> List[Materials]:
         """Get materials by category ID."""
-        try:
-            result = await self._session.execute(
-                select(MaterialModel)
-                .where(MaterialModel.category_id == category_id)
-                .offset(offset)
-                .limit(limit)
-                .order_by(MaterialModel.created_at.desc())
-            )
-            material_models = result.scalars().all()
-            
-            return [self._to_domain(material_model) for material_model in material_models]
-        except Exception as e:
-            raise DatabaseError(f"Failed to get materials by category ID: {str(e)}") from e
+        result = await self._session.execute(
+            select(*_MATERIAL_COLUMNS)
+            .where(MaterialModel.category_id == category_id)
+            .offset(offset)
+            .limit(limit)
+            .order_by(MaterialModel.created_at.desc())
+        )
+        
+        return [Materials(*row) for row in result]
+    
+    @db_operation("Failed to get materials by category ID")
+    async def get_by_category_id_with_count(self, category_id: UUID, limit: int = 100, offset: int = 0) -> Tuple[List[Materials], int]:
+        """Get materials by category ID with the total count in one query."""
+        rows, total = await fetch_rows_with_count(
+            self._session,
+            select(*_MATERIAL_COLUMNS)
+            .where(MaterialModel.category_id == category_id)
+            .order_by(MaterialModel.created_at.desc()),
+            limit=limit,
+            offset=offset
+        )
+        
+        return [Materials(*row) for row in rows], total
     
     async def search_by_name(self, name: str, limit: int = 100, offset: int = 0) -> List[Materials]:
         """Search materials by name using fuzzy matching and sort by relevance."""
-        try:
-            # Pobierz wszystkie materiały (lub większy zbiór) do analizy fuzzy matching
-            # Nie używamy ILIKE jako wstępnego filtru, bo może pominąć dobre dopasowania
-            # (np. "Pomadka długotrwała" nie znajdzie "Pomadka" przez ILIKE)
-            result = await self._session.execute(
-                select(MaterialModel)
-                .limit(500)  # Pobierz więcej materiałów do analizy fuzzy
+        materials, _ = await self.search_by_name_with_count(name, limit=limit, offset=offset)
+        return materials
+    
+    @db_operation("Failed to search materials by name")
+    async def search_by_name_with_count(
+        self,
+        name: str,
+        limit: int = 100,
+        offset: int = 0,
+        category_id: Optional[UUID] = None
+    ) -> Tuple[List[Materials], int]:
+        """Fuzzy search by name; returns the requested page and the total number of matches."""
+        if self._session.get_bind().dialect.name == "postgresql":
+            return await self._search_by_trigram(name, limit, offset, category_id)
+        return await self._search_by_rapidfuzz(name, limit, offset, category_id)
+    
+    async def _search_by_trigram(
+        self,
+        name: str,
+        limit: int,
+        offset: int,
+        category_id: Optional[UUID]
+    ) -> Tuple[List[Materials], int]:
+        """PostgreSQL: pg_trgm filter, ranking and pagination in one indexed query."""
+        # `%` (similarity) i `<%` (word_similarity - fraza zawarta w dłuższej nazwie,
+        # np. "Pomadka" w "Pomadka długotrwała 03") korzystają z indeksu ix_materials_name_trgm.
+        # Progi: pg_trgm.similarity_threshold (0.3) i pg_trgm.word_similarity_threshold (0.6)
+        search = literal(name)
+        query = select(*_MATERIAL_COLUMNS).where(
+            or_(MaterialModel.name.op("%")(search), search.op("<%")(MaterialModel.name))
+        )
+        if category_id is not None:
+            query = query.where(MaterialModel.category_id == category_id)
+        score = func.greatest(
+            func.similarity(MaterialModel.name, search),
+            func.word_similarity(search, MaterialModel.name)
+        )
+        
+        rows, total = await fetch_rows_with_count(
+            self._session,
+            query.order_by(score.desc(), MaterialModel.name),
+            limit=limit,
+            offset=offset
+        )
+        
+        return [Materials(*row) for row in rows], total
+    
+    async def _search_by_rapidfuzz(
+        self,
+        name: str,
+        limit: int,
+        offset: int,
+        category_id: Optional[UUID]
+    ) -> Tuple[List[Materials], int]:
+        """Other dialects (SQLite in development): score up to 500 rows with RapidFuzz."""
+        # Pobierz wszystkie materiały (lub większy zbiór) do analizy fuzzy matching
+        # Nie używamy ILIKE jako wstępnego filtru, bo może pominąć dobre dopasowania
+        # (np. "Pomadka długotrwała" nie znajdzie "Pomadka" przez ILIKE)
+        query = select(*_MATERIAL_COLUMNS)
+        if category_id is not None:
+            # Filtr kategorii w SQL, przed paginacją (a nie na już obciętej stronie)
+            query = query.where(MaterialModel.category_id == category_id)
+        result = await self._session.stream(
+            query.limit(_FUZZY_CANDIDATE_LIMIT).execution_options(yield_per=_FUZZY_BATCH_SIZE)
+        )
+        
+        # Min-heap of the offset + limit best matches: (score, -position, row).
+        # -position keeps the earlier row first on equal scores, as process.extract does.
+        keep = offset + limit
+        best: List[Tuple[float, int, Tuple]] = []
+        total = 0
+        position = 0
+        async for rows in result.partitions():
+            # Jedno przejście w C po partii kandydatów: WRatio łączy ratio, partial_ratio
+            # i token_sort/token_set_ratio, default_process normalizuje (małe litery) raz na nazwę.
+            # score >= 30 odrzuca niepasujące
+            matches = process.extract(
+                name,
+                [row.name for row in rows],
+                scorer=fuzz.WRatio,
+                processor=default_process,
+                score_cutoff=30,
+                limit=None
             )
-            material_models = result.scalars().all()
-            
-            if not material_models:
-                return []
-            
-            # Oblicz podobieństwo dla każdego materiału używając fuzzy matching
-            materials_with_scores: List[Tuple[Materials, float]] = []
-            search_name_lower = name.lower()
-            
-            for material_model in material_models:
-                material = self._to_domain(material_model)
-                material_name_lower = material.name.lower()
-                
-                # Oblicz podobieństwo używając różnych metod fuzzy matching
-                # ratio() - porównuje całe stringi
-                ratio_score = fuzz.ratio(search_name_lower, material_name_lower)
-                
-                # partial_ratio() - najlepsze dopasowanie częściowe (lepsze dla dłuższych nazw)
-                # Np. "Pomadka długotrwała 03" vs "Pomadka" - znajdzie "Pomadka"
-                partial_score = fuzz.partial_ratio(search_name_lower, material_name_lower)
-                
-                # token_sort_ratio() - ignoruje kolejność słów
-                token_sort_score = fuzz.token_sort_ratio(search_name_lower, material_name_lower)
-                
-                # token_set_ratio() - najlepsze dla różnej długości stringów
-                token_set_score = fuzz.token_set_ratio(search_name_lower, material_name_lower)
-                
-                # Użyj najwyższego wyniku z wszystkich metod
-                max_score = max(ratio_score, partial_score, token_sort_score, token_set_score)
-                
-                # Filtruj tylko materiały z score >= 30% (aby pominąć całkowicie niepasujące)
-                if max_score >= 30:
-                    materials_with_scores.append((material, max_score))
-            
-            # Sortuj po trafności (similarity score) - najwyższe najpierw
-            materials_with_scores.sort(key=lambda x: x[1], reverse=True)
-            
-            # Zastosuj offset i limit
-            start_idx = offset
-            end_idx = offset + limit
-            
-            # Zwróć tylko materiały (bez score)
-            sorted_materials = [material for material, _ in materials_with_scores[start_idx:end_idx]]
-            
-            return sorted_materials
-        except Exception as e:
-            raise DatabaseError(f"Failed to search materials by name: {str(e)}") from e
+            total += len(matches)
+            for _, score, index in matches:
+                entry = (score, -(position + index), rows[index])
+                if len(best) < keep:
+                    heapq.heappush(best, entry)
+                elif entry[:2] > best[0][:2]:
+                    heapq.heapreplace(best, entry)
+            position += len(rows)
+        
+        # Zwróć stronę materiałów (encje tylko dla niej) i łączną liczbę dopasowań
+        ranked = sorted(best, key=lambda entry: entry[:2], reverse=True)
+        page = [Materials(*row) for _, _, row in ranked[offset:]]
+        
+        return page, total
     
+    @db_operation("Failed to count materials")
     async def count_all(self) -> int:
         """Count total number of materials."""
-        try:
-            result = await self._session.execute(
-                select(func.count(MaterialModel.material_id))
-            )
-            return result.scalar() or 0
-        except Exception as e:
-            raise DatabaseError(f"Failed to count materials: {str(e)}") from e
+        return (await self._session.scalar(_COUNT_ALL)) or 0
     
+    @db_operation("Failed to get materials by construction ID")
     async def get_by_construction_id(self, construction_id: UUID, limit: int = 100, offset: int = 0) -> List[Materials]:
         """Get materials by construction ID."""
-        try:
-            result = await self._session.execute(
-                select(MaterialModel)
-                .join(StorageItemModel, MaterialModel.material_id == StorageItemModel.material_id)
-                .where(StorageItemModel.construction_id == construction_id)
-                .distinct()
-                .offset(offset)
-                .limit(limit)
-                .order_by(MaterialModel.name)
-            )
-            material_models = result.scalars().all()
-            
-            return [self._to_domain(material_model) for material_model in material_models]
-        except Exception as e:
-            raise DatabaseError(f"Failed to get materials by construction ID: {str(e)}") from e
+        # Semi-join (EXISTS) instead of JOIN + DISTINCT: no sort/dedup step, each
+        # material is checked with one probe of the (construction_id, material_id) PK
+        in_construction = exists().where(
+            StorageItemModel.material_id == MaterialModel.material_id,
+            StorageItemModel.construction_id == construction_id
+        )
+        result = await self._session.execute(
+            select(*_MATERIAL_COLUMNS)
+            .where(in_construction)
+            .offset(offset)
+            .limit(limit)
+            .order_by(MaterialModel.name)
+        )
+        
+        return [Materials(*row) for row in result]
+    
+    @db_operation("Failed to check material name")
+    async def exists_by_name(self, name: str, exclude_id: Optional[UUID] = None) -> bool:
+        """Check whether a material with given name exists (case-insensitive)."""
+        condition = exists().where(func.lower(MaterialModel.name) == func.lower(name))
+        if exclude_id is not None:
+            condition = condition.where(MaterialModel.material_id != exclude_id)
+        return bool(await self._session.scalar(select(condition)))
     
+    @db_operation("Failed to get material by name")
     async def get_by_name(self, name: str) -> Optional[Materials]:
         """Get material by exact name match (case-insensitive)."""
-        try:
-            result = await self._session.execute(
-                select(MaterialModel)
-                .where(func.lower(MaterialModel.name) == func.lower(name))
-                .limit(1)
-            )
-            material_model = result.scalar_one_or_none()
-            
-            return self._to_domain(material_model) if material_model else None
-        except Exception as e:
-            raise DatabaseError(f"Failed to get material by name: {str(e)}") from e
+        result = await self._session.execute(
+            select(*_MATERIAL_COLUMNS)
+            .where(func.lower(MaterialModel.name) == func.lower(name))
+        )
+        # At most one row: lower(name) has a unique index
+        row = result.one_or_none()
+        
+        return Materials(*row) if row else None
     
-    def _to_domain(self, material_model: MaterialModel) -> Materials:
-        """Convert SQLAlchemy model to domain entity."""
-        return Materials(
-            material_id=material_model.material_id,
-            category_id=material_model.category_id,
-            name=material_model.name,
-            description=material_model.description,
-            unit=material_model.unit,
-            created_at=material_model.created_at
+    @db_operation("Failed to get materials by names")
+    async def get_by_names(self, names: List[str]) -> List[Materials]:
+        """Get materials matching any of the given names (case-insensitive) in one query."""
+        if not names:
+            return []
+        result = await self._session.execute(
+            select(*_MATERIAL_COLUMNS)
+            .where(func.lower(MaterialModel.name).in_([func.lower(name) for name in set(names)]))
         )
-
+        
+        return [Materials(*row) for row in result]
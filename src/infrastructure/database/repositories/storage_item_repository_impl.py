@@ -2,256 +2,319 @@
 StorageItem Repository Implementation (Adapter).
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, func, and_
+from sqlalchemy import select, delete, func, update, insert, bindparam
+from sqlalchemy.dialects import postgresql, sqlite
 
 from src.domain.entities.storage_item import StorageItem
 from src.domain.repositories.storage_item_repository import StorageItemRepository
 from src.infrastructure.database.models import StorageItemModel, MaterialModel, CategoryModel
+from src.infrastructure.database.pagination import fetch_rows_with_count
+from src.infrastructure.database.operations import db_operation
 from src.shared.exceptions import DatabaseError
 
+# Columns in StorageItem.__init__ order; reads select these instead of hydrating
+# ORM instances, and UPDATE ... RETURNING returns them.
+_STORAGE_ITEM_COLUMNS = (
+    StorageItemModel.construction_id,
+    StorageItemModel.material_id,
+    StorageItemModel.quantity_value,
+    StorageItemModel.created_at,
+)
+
+_GET_BY_IDS = select(*_STORAGE_ITEM_COLUMNS).where(
+    StorageItemModel.construction_id == bindparam("construction_id"),
+    StorageItemModel.material_id == bindparam("material_id")
+)
+# WHERE parameters of an UPDATE cannot reuse column names (reserved for SET)
+_UPDATE = (
+    update(StorageItemModel)
+    .where(
+        StorageItemModel.construction_id == bindparam("target_construction_id"),
+        StorageItemModel.material_id == bindparam("target_material_id")
+    )
+    .values(quantity_value=bindparam("quantity_value"))
+    .returning(*_STORAGE_ITEM_COLUMNS)
+    .execution_options(synchronize_session=False)
+)
+_DELETE = delete(StorageItemModel).where(
+    StorageItemModel.construction_id == bindparam("construction_id"),
+    StorageItemModel.material_id == bindparam("material_id")
+)
+
+# Scale of StorageItemModel.quantity_value (DECIMAL(8, 2))
+_QUANTITY_STEP = Decimal("0.01")
+
+# INSERT constructs with ON CONFLICT support, per dialect
+_UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+# Rows per multi-row INSERT in create_bulk (4 bind parameters per row)
+_BULK_INSERT_CHUNK_SIZE = 1000
+
+# Rows per fetch when a read is streamed instead of materialized
+_STREAM_BATCH_SIZE = 500
+
 
 class StorageItemRepositoryImpl(StorageItemRepository):
     """StorageItem repository implementation."""
     
+    __slots__ = ("_session",)
+    
     def __init__(self, session: AsyncSession):
         self._session = session
     
+    @db_operation("Failed to create storage item")
     async def create(self, storage_item: StorageItem) -> StorageItem:
         """Create a new storage item."""
-        try:
-            storage_item_model = StorageItemModel(
-                construction_id=storage_item.construction_id,
-                material_id=storage_item.material_id,
-                quantity_value=storage_item.quantity_value,
-                created_at=storage_item.created_at
-            )
-            
-            self._session.add(storage_item_model)
-            await self._session.commit()
-            await self._session.refresh(storage_item_model)
-            
-            return self._to_domain(storage_item_model)
-        except Exception as e:
-            await self._session.rollback()
-            raise DatabaseError(f"Failed to create storage item: {str(e)}") from e
+        # Plain INSERT: no ORM instance, identity map or unit-of-work flush
+        await self._session.execute(
+            insert(StorageItemModel).values(self._insert_params(storage_item))
+        )
+        
+        # All columns are supplied by the caller, so no reload is needed
+        return self._stored(storage_item)
     
+    @db_operation("Failed to create storage items in bulk")
     async def create_bulk(self, storage_items: List[StorageItem]) -> List[StorageItem]:
         """Create multiple storage items at once."""
-        try:
-            storage_item_models = [
-                StorageItemModel(
-                    construction_id=storage_item.construction_id,
-                    material_id=storage_item.material_id,
-                    quantity_value=storage_item.quantity_value,
-                    created_at=storage_item.created_at
-                )
-                for storage_item in storage_items
-            ]
-            
-            self._session.add_all(storage_item_models)
-            await self._session.commit()
-            
-            # Refresh all models to get database-generated values
-            for storage_item_model in storage_item_models:
-                await self._session.refresh(storage_item_model)
-            
-            return [self._to_domain(storage_item_model) for storage_item_model in storage_item_models]
-        except Exception as e:
-            await self._session.rollback()
-            raise DatabaseError(f"Failed to create storage items in bulk: {str(e)}") from e
+        if not storage_items:
+            return []
+        # One multi-row INSERT per chunk (bind parameter limits) instead of ORM
+        # objects flushed through the unit of work
+        for start in range(0, len(storage_items), _BULK_INSERT_CHUNK_SIZE):
+            await self._session.execute(
+                insert(StorageItemModel).values([
+                    self._insert_params(storage_item)
+                    for storage_item in storage_items[start:start + _BULK_INSERT_CHUNK_SIZE]
+                ])
+            )
+        
+        # All columns are supplied by the caller, so no per-row reload is needed
+        return [self._stored(storage_item) for storage_item in storage_items]
     
+    @db_operation("Failed to get storage item by IDs")
     async def get_by_ids(self, construction_id: UUID, material_id: UUID) -> Optional[StorageItem]:
         """Get storage item by construction ID and material ID."""
-        try:
-            result = await self._session.execute(
-                select(StorageItemModel).where(
-                    and_(
-                        StorageItemModel.construction_id == construction_id,
-                        StorageItemModel.material_id == material_id
-                    )
-                )
-            )
-            storage_item_model = result.scalar_one_or_none()
-            
-            return self._to_domain(storage_item_model) if storage_item_model else None
-        except Exception as e:
-            raise DatabaseError(f"Failed to get storage item by IDs: {str(e)}") from e
+        result = await self._session.execute(
+            _GET_BY_IDS, {"construction_id": construction_id, "material_id": material_id}
+        )
+        row = result.one_or_none()
+        
+        return StorageItem(*row) if row else None
     
+    @db_operation("Failed to update storage item")
     async def update(self, storage_item: StorageItem) -> StorageItem:
         """Update existing storage item."""
-        try:
-            result = await self._session.execute(
-                select(StorageItemModel).where(
-                    and_(
-                        StorageItemModel.construction_id == storage_item.construction_id,
-                        StorageItemModel.material_id == storage_item.material_id
-                    )
-                )
+        # Single UPDATE ... RETURNING instead of SELECT + dirty tracking + flush
+        result = await self._session.execute(
+            _UPDATE,
+            {
+                "target_construction_id": storage_item.construction_id,
+                "target_material_id": storage_item.material_id,
+                "quantity_value": storage_item.quantity_value
+            }
+        )
+        row = result.one_or_none()
+        
+        if row is None:
+            raise DatabaseError(
+                f"Storage item with construction_id {storage_item.construction_id} "
+                f"and material_id {storage_item.material_id} not found"
             )
-            storage_item_model = result.scalar_one_or_none()
-            
-            if not storage_item_model:
-                raise DatabaseError(
-                    f"Storage item with construction_id {storage_item.construction_id} "
-                    f"and material_id {storage_item.material_id} not found"
-                )
-            
-            storage_item_model.quantity_value = storage_item.quantity_value
-            
-            await self._session.commit()
-            await self._session.refresh(storage_item_model)
-            
-            return self._to_domain(storage_item_model)
-        except Exception as e:
-            await self._session.rollback()
-            raise DatabaseError(f"Failed to update storage item: {str(e)}") from e
+        
+        return StorageItem(*row)
     
+    @db_operation("Failed to delete storage item")
     async def delete(self, construction_id: UUID, material_id: UUID) -> bool:
         """Delete storage item by construction ID and material ID."""
-        try:
-            result = await self._session.execute(
-                delete(StorageItemModel).where(
-                    and_(
-                        StorageItemModel.construction_id == construction_id,
-                        StorageItemModel.material_id == material_id
-                    )
-                )
-            )
-            await self._session.commit()
-            
-            return result.rowcount > 0
-        except Exception as e:
-            await self._session.rollback()
-            raise DatabaseError(f"Failed to delete storage item: {str(e)}") from e
+        result = await self._session.execute(
+            _DELETE, {"construction_id": construction_id, "material_id": material_id}
+        )
+        
+        return result.rowcount > 0
     
+    @db_operation("Failed to get storage items by construction ID")
     async def get_by_construction_id(self, construction_id: UUID, limit: int = 100, offset: int = 0) -> List[StorageItem]:
         """Get storage items by construction ID."""
-        try:
-            result = await self._session.execute(
-                select(StorageItemModel)
-                .where(StorageItemModel.construction_id == construction_id)
-                .offset(offset)
-                .limit(limit)
-                .order_by(StorageItemModel.created_at.desc())
-            )
-            storage_item_models = result.scalars().all()
-            
-            return [self._to_domain(storage_item_model) for storage_item_model in storage_item_models]
-        except Exception as e:
-            raise DatabaseError(f"Failed to get storage items by construction ID: {str(e)}") from e
+        result = await self._session.execute(
+            select(*_STORAGE_ITEM_COLUMNS)
+            .where(StorageItemModel.construction_id == construction_id)
+            .offset(offset)
+            .limit(limit)
+            .order_by(StorageItemModel.created_at.desc())
+        )
+        
+        return [StorageItem(*row) for row in result]
+    
+    @db_operation("Failed to get storage items by construction ID")
+    async def get_by_construction_id_with_count(self, construction_id: UUID, limit: int = 100, offset: int = 0) -> Tuple[List[StorageItem], int]:
+        """Get storage items by construction ID with the total count in one query."""
+        rows, total = await fetch_rows_with_count(
+            self._session,
+            select(*_STORAGE_ITEM_COLUMNS)
+            .where(StorageItemModel.construction_id == construction_id)
+            .order_by(StorageItemModel.created_at.desc()),
+            limit=limit,
+            offset=offset
+        )
+        
+        return [StorageItem(*row) for row in rows], total
     
+    @db_operation("Failed to get storage items by material ID")
     async def get_by_material_id(self, material_id: UUID, limit: int = 100, offset: int = 0) -> List[StorageItem]:
         """Get storage items by material ID."""
-        try:
-            result = await self._session.execute(
-                select(StorageItemModel)
-                .where(StorageItemModel.material_id == material_id)
-                .offset(offset)
-                .limit(limit)
-                .order_by(StorageItemModel.created_at.desc())
-            )
-            storage_item_models = result.scalars().all()
-            
-            return [self._to_domain(storage_item_model) for storage_item_model in storage_item_models]
-        except Exception as e:
-            raise DatabaseError(f"Failed to get storage items by material ID: {str(e)}") from e
+        result = await self._session.execute(
+            select(*_STORAGE_ITEM_COLUMNS)
+            .where(StorageItemModel.material_id == material_id)
+            .offset(offset)
+            .limit(limit)
+            .order_by(StorageItemModel.created_at.desc())
+        )
+        
+        return [StorageItem(*row) for row in result]
+    
+    @db_operation("Failed to get storage items by material ID")
+    async def get_by_material_id_with_count(self, material_id: UUID, limit: int = 100, offset: int = 0) -> Tuple[List[StorageItem], int]:
+        """Get storage items by material ID with the total count in one query."""
+        rows, total = await fetch_rows_with_count(
+            self._session,
+            select(*_STORAGE_ITEM_COLUMNS)
+            .where(StorageItemModel.material_id == material_id)
+            .order_by(StorageItemModel.created_at.desc()),
+            limit=limit,
+            offset=offset
+        )
+        
+        return [StorageItem(*row) for row in rows], total
     
+    @db_operation("Failed to count storage items")
     async def count_all(self) -> int:
         """Count total number of storage items."""
-        try:
-            result = await self._session.execute(
-                select(func.count()).select_from(StorageItemModel)
-            )
-            return result.scalar() or 0
-        except Exception as e:
-            raise DatabaseError(f"Failed to count storage items: {str(e)}") from e
+        return (await self._session.scalar(
+            select(func.count()).select_from(StorageItemModel)
+        )) or 0
     
+    @db_operation("Failed to get materials by construction ID")
     async def get_materials_by_construction_id(self, construction_id: UUID) -> List[dict]:
         """Get materials with details by construction ID."""
-        try:
-            result = await self._session.execute(
-                select(
-                    StorageItemModel.construction_id,
-                    StorageItemModel.material_id,
-                    MaterialModel.name,
-                    CategoryModel.name.label('category_name'),
-                    MaterialModel.description,
-                    MaterialModel.unit,
-                    StorageItemModel.quantity_value,
-                    StorageItemModel.created_at
-                )
-                .join(StorageItemModel, MaterialModel.material_id == StorageItemModel.material_id)
-                .join(CategoryModel, MaterialModel.category_id == CategoryModel.category_id)
-                .where(StorageItemModel.construction_id == construction_id)
-                .order_by(MaterialModel.name)
+        # Unbounded per construction: stream in batches instead of materializing all rows
+        result = await self._session.stream(
+            select(
+                StorageItemModel.construction_id,
+                StorageItemModel.material_id,
+                MaterialModel.name,
+                CategoryModel.name.label('category_name'),
+                MaterialModel.description,
+                MaterialModel.unit,
+                StorageItemModel.quantity_value,
+                StorageItemModel.created_at
             )
-            rows = result.all()
-            
-            return [
-                {
-                    'construction_id': row.construction_id,
-                    'material_id': row.material_id,
-                    'name': row.name,
-                    'category': row.category_name,
-                    'description': row.description,
-                    'unit': row.unit,
-                    'quantity_value': row.quantity_value,
-                    'created_at': row.created_at
-                }
-                for row in rows
-            ]
-        except Exception as e:
-            raise DatabaseError(f"Failed to get materials by construction ID: {str(e)}") from e
+            .join(StorageItemModel, MaterialModel.material_id == StorageItemModel.material_id)
+            .join(CategoryModel, MaterialModel.category_id == CategoryModel.category_id)
+            .where(StorageItemModel.construction_id == construction_id)
+            .order_by(MaterialModel.name)
+            .execution_options(yield_per=_STREAM_BATCH_SIZE)
+        )
+        
+        return [
+            {
+                'construction_id': row.construction_id,
+                'material_id': row.material_id,
+                'name': row.name,
+                'category': row.category_name,
+                'description': row.description,
+                'unit': row.unit,
+                'quantity_value': row.quantity_value,
+                'created_at': row.created_at
+            }
+            async for row in result
+        ]
     
+    @db_operation("Failed to upsert storage item")
     async def upsert(self, storage_item: StorageItem) -> StorageItem:
         """Create or update storage item. If exists, adds quantity_value to existing."""
-        try:
-            existing = await self.get_by_ids(storage_item.construction_id, storage_item.material_id)
-            
-            if existing:
-                # Update: add new quantity to existing
-                new_quantity = existing.quantity_value + storage_item.quantity_value
-                existing.set_quantity_value(new_quantity)
-                return await self.update(existing)
-            else:
-                # Create new
-                return await self.create(storage_item)
-        except Exception as e:
-            raise DatabaseError(f"Failed to upsert storage item: {str(e)}") from e
+        upserted = await self._upsert_rows([storage_item])
+        return upserted[0]
     
+    @db_operation("Failed to upsert storage items in bulk")
     async def upsert_bulk(self, storage_items: List[StorageItem]) -> List[StorageItem]:
         """Create or update multiple storage items. If exists, adds quantity_value to existing."""
-        try:
-            result_items = []
-            
-            for storage_item in storage_items:
-                existing = await self.get_by_ids(storage_item.construction_id, storage_item.material_id)
-                
-                if existing:
-                    # Update: add new quantity to existing
-                    new_quantity = existing.quantity_value + storage_item.quantity_value
-                    existing.set_quantity_value(new_quantity)
-                    updated = await self.update(existing)
-                    result_items.append(updated)
-                else:
-                    # Create new
-                    created = await self.create(storage_item)
-                    result_items.append(created)
-            
-            return result_items
-        except Exception as e:
-            raise DatabaseError(f"Failed to upsert storage items in bulk: {str(e)}") from e
+        if not storage_items:
+            return []
+        return await self._upsert_rows(storage_items)
     
-    def _to_domain(self, storage_item_model: StorageItemModel) -> StorageItem:
-        """Convert SQLAlchemy model to domain entity."""
+    async def _upsert_rows(self, storage_items: List[StorageItem]) -> List[StorageItem]:
+        """
+        Single multi-row INSERT ... ON CONFLICT DO UPDATE ... RETURNING.
+        
+        Items with the same key are merged first - ON CONFLICT cannot update the
+        same row twice within one statement.
+        """
+        rows: Dict[Tuple[UUID, UUID], Dict[str, Any]] = {}
+        for storage_item in storage_items:
+            key = (storage_item.construction_id, storage_item.material_id)
+            row = rows.get(key)
+            if row is None:
+                rows[key] = {
+                    "construction_id": storage_item.construction_id,
+                    "material_id": storage_item.material_id,
+                    "quantity_value": storage_item.quantity_value,
+                    "created_at": storage_item.created_at
+                }
+            else:
+                row["quantity_value"] += storage_item.quantity_value
+        
+        dialect_insert = _UPSERT_INSERTS[self._session.get_bind().dialect.name]
+        insert_stmt = dialect_insert(StorageItemModel).values(list(rows.values()))
+        result = await self._session.execute(
+            insert_stmt.on_conflict_do_update(
+                index_elements=[StorageItemModel.construction_id, StorageItemModel.material_id],
+                set_={"quantity_value": StorageItemModel.quantity_value + insert_stmt.excluded.quantity_value}
+            ).returning(
+                StorageItemModel.construction_id,
+                StorageItemModel.material_id,
+                StorageItemModel.quantity_value,
+                StorageItemModel.created_at
+            )
+        )
+        stored = {(row.construction_id, row.material_id): row for row in result}
+        
+        return [
+            StorageItem(
+                construction_id=row.construction_id,
+                material_id=row.material_id,
+                quantity_value=row.quantity_value,
+                created_at=row.created_at
+            )
+            for row in (stored[key] for key in rows)
+        ]
+    
+    @staticmethod
+    def _insert_params(storage_item: StorageItem) -> Dict[str, Any]:
+        """Column values of a new storage item row."""
+        return {
+            "construction_id": storage_item.construction_id,
+            "material_id": storage_item.material_id,
+            "quantity_value": storage_item.quantity_value,
+            "created_at": storage_item.created_at
+        }
+    
+    @staticmethod
+    def _quantize(quantity_value: Decimal) -> Decimal:
+        """Round a quantity the way the DECIMAL(8, 2) column stores it."""
+        return Decimal(quantity_value).quantize(_QUANTITY_STEP, rounding=ROUND_HALF_UP)
+    
+    def _stored(self, storage_item: StorageItem) -> StorageItem:
+        """Build the entity as persisted, without reloading it from the database."""
         return StorageItem(
-            construction_id=storage_item_model.construction_id,
-            material_id=storage_item_model.material_id,
-            quantity_value=storage_item_model.quantity_value,
-            created_at=storage_item_model.created_at
+            construction_id=storage_item.construction_id,
+            material_id=storage_item.material_id,
+            quantity_value=self._quantize(storage_item.quantity_value),
+            created_at=storage_item.created_at
         )
-
@@ -0,0 +1,16 @@
+"""
+Helpers for name search queries.
+"""
+
+# Escape character passed to ILIKE ... ESCAPE together with contains_pattern()
+LIKE_ESCAPE = "\\"
+
+
+def contains_pattern(text: str) -> str:
+    """ILIKE pattern matching `text` anywhere, with %, _ and the escape char taken literally."""
+    escaped = (
+        text.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", LIKE_ESCAPE + "%")
+        .replace("_", LIKE_ESCAPE + "_")
+    )
+    return f"%{escaped}%"
@@ -0,0 +1,38 @@
+"""
+Prepared-statement warmup for pooled PostgreSQL connections.
+"""
+
+import asyncio
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.infrastructure.database.repositories.category_repository_impl import CategoryRepositoryImpl
+from src.infrastructure.database.repositories.construction_repository_impl import ConstructionRepositoryImpl
+from src.infrastructure.database.repositories.material_repository_impl import MaterialRepositoryImpl
+from src.infrastructure.database.repositories.storage_item_repository_impl import StorageItemRepositoryImpl
+
+
+async def _prepare_hot_statements(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    """Run the most frequent read queries once on one pooled connection."""
+    # Going through the repositories keeps the SQL text identical to what requests
+    # send, which is what the asyncpg adapter keys its prepared statements on.
+    missing_id = uuid4()
+    async with session_factory() as session:
+        await MaterialRepositoryImpl(session).list_with_count(limit=20, offset=0)
+        await MaterialRepositoryImpl(session).get_by_category_id_with_count(missing_id, limit=20, offset=0)
+        await MaterialRepositoryImpl(session).exists_by_name("")
+        await CategoryRepositoryImpl(session).list_with_count(limit=20, offset=0)
+        await ConstructionRepositoryImpl(session).list_with_count(limit=20, offset=0)
+        await StorageItemRepositoryImpl(session).get_by_construction_id_with_count(missing_id, limit=20, offset=0)
+        await StorageItemRepositoryImpl(session).get_by_ids(missing_id, missing_id)
+
+
+async def warm_prepared_statements(session_factory: async_sessionmaker[AsyncSession], connections: int) -> None:
+    """
+    Prepare the hot statements on `connections` pooled connections concurrently.
+
+    The statement cache is per connection, so the sessions are opened at the same
+    time to make each of them check out a different connection.
+    """
+    await asyncio.gather(*(_prepare_hot_statements(session_factory) for _ in range(connections)))
@@ -2,6 +2,7 @@
 Application configuration using Pydantic Settings.
 """
 
+from pathlib import Path
 from pydantic_settings import BaseSettings
 from typing import Optional
 
@@ -19,6 +20,13 @@ class Settings(BaseSettings):
     # Database
     database_url: str = "sqlite:///./construction_manager.db"
     database_url_dev: Optional[str] = None
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 3600
+    # Compiled-statement cache entries per engine (SQLAlchemy default: 500)
+    db_query_cache_size: int = 1200
+    is_lambda: bool = False
     
     # Security
     secret_key: str = "your-secret-key-change-in-production"
@@ -39,6 +47,10 @@ class Settings(BaseSettings):
     # AI Integration
     gemini_api_key: Optional[str] = None
     openai_api_key: Optional[str] = None
+    # Vision API potrafi odpowiadać kilkadziesiąt sekund
+    http_client_timeout_seconds: float = 60.0
+    # Ile stron PDF analizować równolegle (osobne zapytania do Vision API)
+    pdf_page_concurrency: int = 4
     
     # Logging
     log_level: str = "INFO"
@@ -49,6 +61,13 @@ class Settings(BaseSettings):
     constructions_images_dir: str = "./uploads/constructions"
     max_upload_size_mb: int = 10
     
+    # Cache list endpointów
+    list_cache_ttl_seconds: int = 30
+    list_cache_maxsize: int = 256
+    # Endpointy /public: stale-while-revalidate
+    public_cache_min_ttl_seconds: int = 5
+    public_cache_max_stale_seconds: int = 300
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -56,3 +75,6 @@ class Settings(BaseSettings):
 
 # Global settings instance
 settings = Settings()
+
+# Katalog na zdjęcia budów (tworzony przy starcie aplikacji)
+CONSTRUCTIONS_IMAGES_DIR = Path(settings.constructions_images_dir)
@@ -1,30 +1,41 @@
 """
-Pytest configuration and fixtures for Recipe AI Extractor tests.
+Pytest configuration and fixtures for Construction Manager tests.
 """
 
-import pytest
+import os
+
+# The application reads its settings at import time, so the test database
+# has to be configured before anything from main/src is imported.
+TEST_DATABASE_URL = "sqlite:///./test_construction_manager.db"
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+os.environ.setdefault("DB_POOL_SIZE", "2")
+
 import asyncio
+
+import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from fastapi.testclient import TestClient
-from contextlib import asynccontextmanager
 
 from main import app
-from src.infrastructure.database.connection import Base, init_database
-from src.infrastructure.database.models import UserModel, RecipeModel, CatalogItemModel, RecipeItemModel
+from src.infrastructure.api.cache import invalidate
+from src.infrastructure.database.connection import Base
+from src.infrastructure.database.models import CategoryModel, ConstructionModel, MaterialModel, StorageItemModel
 from mock_data.data_loader import MockDataLoader
 
+# Namespaces of the in-process list caches (one per router)
+CACHE_NAMESPACES = ("categories", "constructions", "materials", "storage_items")
 
-# Test database URL
-TEST_DATABASE_URL = "sqlite:///./test_recipe_extractor.db"
 
-
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+@pytest.fixture(autouse=True)
+def clear_list_caches():
+    """Caches are module-level, so entries must not leak between tests."""
+    for namespace in CACHE_NAMESPACES:
+        invalidate(namespace)
+    yield
+    for namespace in CACHE_NAMESPACES:
+        invalidate(namespace)
 
 
 @pytest.fixture(scope="function")
@@ -32,14 +43,15 @@ def test_db():
     """Create test database for each test."""
     # Create test engine
     engine = create_engine(TEST_DATABASE_URL, echo=False)
-    
+
     # Create all tables
     Base.metadata.create_all(bind=engine)
-    
+
     yield engine
-    
+
     # Cleanup: drop all tables
     Base.metadata.drop_all(bind=engine)
+    engine.dispose()
 
 
 @pytest.fixture(scope="function")
@@ -47,13 +59,29 @@ def db_session(test_db):
     """Create database session for tests."""
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_db)
     session = SessionLocal()
-    
+
     try:
         yield session
     finally:
         session.close()
 
 
+@pytest.fixture(scope="function")
+def run_in_session(test_db):
+    """Run `work(session)` on a fresh AsyncSession of the test database and return its result."""
+    def _run(work):
+        async def _main():
+            engine = create_async_engine(TEST_DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1))
+            try:
+                async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+                    return await work(session)
+            finally:
+                # aiosqlite keeps a worker thread per connection
+                await engine.dispose()
+        return asyncio.run(_main())
+    return _run
+
+
 @pytest.fixture(scope="function")
 def mock_data_loaded(db_session):
     """Load mock data into test database."""
@@ -63,9 +91,10 @@ def mock_data_loaded(db_session):
 
 
 @pytest.fixture(scope="function")
-def test_client():
-    """Create test client for FastAPI app."""
-    return TestClient(app)
+def test_client(test_db):
+    """Create test client for FastAPI app (lifespan included - it sets up the session factory)."""
+    with TestClient(app) as client:
+        yield client
 
 
 @pytest.fixture(scope="function")
@@ -76,58 +105,55 @@ def test_client_with_mock_data(test_client, mock_data_loaded):
 
 # Sample data fixtures for individual tests
 @pytest.fixture
-def sample_user():
-    """Sample user data."""
-    return {
-        "email": "test@example.com",
-        "password_hash": "$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewdBPj4J/9Kz8K2K",
-        "is_admin": False
-    }
-
-
-@pytest.fixture
-def sample_recipe():
-    """Sample recipe data."""
-    return {
-        "title": "Test Recipe",
-        "external_url": "https://example.com/recipe",
-        "preparation_steps": "1. Do this\n2. Do that",
-        "prep_time_minutes": 30
-    }
+def sample_category():
+    """Sample category data."""
+    return {"name": "Test Category"}
 
 
 @pytest.fixture
-def sample_catalog_item():
-    """Sample catalog item data."""
+def sample_construction():
+    """Sample construction data."""
     return {
-        "name": "Test Ingredient",
-        "last_used": "2024-03-15T10:30:00Z"
+        "name": "Test Construction",
+        "description": "Construction used in tests",
+        "address": "ul. Testowa 1",
+        "status": "active"
     }
 
 
-# Database query helpers
 @pytest.fixture
-def get_user_by_email(db_session):
-    """Helper to get user by email."""
-    def _get_user(email: str):
-        return db_session.query(UserModel).filter(UserModel.email == email).first()
-    return _get_user
+def create_category(test_client):
+    """Helper to create a category through the API."""
+    def _create(name: str = "Test Category") -> dict:
+        response = test_client.post("/api/v1/categories/", json={"name": name})
+        assert response.status_code == 201, response.text
+        return response.json()
+    return _create
 
 
 @pytest.fixture
-def get_recipe_by_title(db_session):
-    """Helper to get recipe by title."""
-    def _get_recipe(title: str):
-        return db_session.query(RecipeModel).filter(RecipeModel.title == title).first()
-    return _get_recipe
+def create_material(test_client, create_category):
+    """Helper to create a material (in a new category unless one is given)."""
+    def _create(name: str, category_id: str = None, unit: str = "pieces") -> dict:
+        if category_id is None:
+            category_id = create_category(f"Category for {name}")["category_id"]
+        response = test_client.post(
+            "/api/v1/materials/",
+            json={"name": name, "category_id": category_id, "unit": unit, "description": ""}
+        )
+        assert response.status_code == 201, response.text
+        return response.json()
+    return _create
 
 
 @pytest.fixture
-def get_catalog_item_by_name(db_session):
-    """Helper to get catalog item by name."""
-    def _get_item(name: str):
-        return db_session.query(CatalogItemModel).filter(CatalogItemModel.name == name).first()
-    return _get_item
+def create_construction(test_client, sample_construction):
+    """Helper to create a construction through the API."""
+    def _create(name: str = "Test Construction") -> dict:
+        response = test_client.post("/api/v1/constructions/", json={**sample_construction, "name": name})
+        assert response.status_code == 201, response.text
+        return response.json()
+    return _create
 
 
 # Mock data verification helpers
@@ -135,15 +161,10 @@ def get_catalog_item_by_name(db_session):
 def verify_mock_data_loaded(db_session):
     """Verify that mock data is properly loaded."""
     def _verify():
-        user_count = db_session.query(UserModel).count()
-        recipe_count = db_session.query(RecipeModel).count()
-        catalog_count = db_session.query(CatalogItemModel).count()
-        recipe_item_count = db_session.query(RecipeItemModel).count()
-        
         return {
-            "users": user_count,
-            "recipes": recipe_count,
-            "catalog_items": catalog_count,
-            "recipe_items": recipe_item_count
+            "categories": db_session.query(CategoryModel).count(),
+            "constructions": db_session.query(ConstructionModel).count(),
+            "materials": db_session.query(MaterialModel).count(),
+            "storage_items": db_session.query(StorageItemModel).count()
         }
     return _verify
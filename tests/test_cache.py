@@ -0,0 +1,112 @@
+"""
+Unit tests for the in-process list caches.
+"""
+
+import asyncio
+
+import pytest
+
+from src.infrastructure.api.cache import ListCache, StaleWhileRevalidateCache
+from src.shared.exceptions import DatabaseError
+
+
+class CountingLoader:
+    """Loader returning "v1", "v2", ... (or raising once `fail` is set)."""
+
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+
+    async def __call__(self):
+        if self.fail:
+            raise DatabaseError("database is down")
+        self.calls += 1
+        return f"v{self.calls}"
+
+
+async def _settle():
+    """Let background refresh tasks run to completion."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestListCache:
+    def test_clear_drops_only_its_namespace(self):
+        cache = ListCache(maxsize=10, ttl=60)
+        cache.set("materials", "page", 1)
+        cache.set("categories", "page", 2)
+
+        cache.clear("materials")
+
+        assert cache.get("materials", "page") is None
+        assert cache.get("categories", "page") == 2
+
+
+class TestStaleWhileRevalidateCache:
+    def test_fresh_entry_is_served_without_loading(self):
+        cache = StaleWhileRevalidateCache(maxsize=10, min_ttl=60, max_stale=60)
+        loader = CountingLoader()
+
+        async def scenario():
+            first = await cache.get_or_load("ns", "key", loader)
+            second = await cache.get_or_load("ns", "key", loader)
+            return first, second
+
+        assert asyncio.run(scenario()) == ("v1", "v1")
+        assert loader.calls == 1
+
+    def test_stale_entry_is_served_and_refreshed_in_background(self):
+        # min_ttl=0: the entry goes stale right after loading
+        cache = StaleWhileRevalidateCache(maxsize=10, min_ttl=0, max_stale=60)
+        loader = CountingLoader()
+
+        async def scenario():
+            await cache.get_or_load("ns", "key", loader)
+            stale = await cache.get_or_load("ns", "key", loader)
+            await _settle()
+            return stale
+
+        assert asyncio.run(scenario()) == "v1"
+        assert loader.calls == 2
+
+    def test_last_known_value_is_served_when_database_fails(self):
+        cache = StaleWhileRevalidateCache(maxsize=10, min_ttl=0, max_stale=60)
+        loader = CountingLoader()
+
+        async def scenario():
+            await cache.get_or_load("ns", "key", loader)
+            await _settle()
+            loader.fail = True
+            value = await cache.get_or_load("ns", "key", loader)
+            await _settle()
+            return value
+
+        assert asyncio.run(scenario()) == "v1"
+
+    def test_database_error_without_cached_value_is_raised(self):
+        cache = StaleWhileRevalidateCache(maxsize=10, min_ttl=60, max_stale=60)
+        loader = CountingLoader()
+        loader.fail = True
+
+        with pytest.raises(DatabaseError):
+            asyncio.run(cache.get_or_load("ns", "key", loader))
+
+    def test_refresh_started_before_clear_does_not_repopulate(self):
+        cache = StaleWhileRevalidateCache(maxsize=10, min_ttl=60, max_stale=60)
+
+        async def scenario():
+            gate = asyncio.Event()
+
+            async def slow_loader():
+                await gate.wait()
+                return "old"
+
+            load = asyncio.create_task(cache.get_or_load("ns", "key", slow_loader))
+            await asyncio.sleep(0)
+            # A write lands while the old value is still being loaded
+            cache.clear("ns")
+            gate.set()
+            assert await load == "old"
+            return await cache.get_or_load("ns", "key", CountingLoader())
+
+        assert asyncio.run(scenario()) == "v1"
@@ -0,0 +1,89 @@
+"""
+API tests for construction image uploads and the request transaction.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from src.infrastructure.api import constructions
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 32
+
+
+@pytest.fixture
+def images_dir(tmp_path, monkeypatch):
+    """Write construction images to a temporary directory."""
+    monkeypatch.setattr(constructions, "CONSTRUCTIONS_IMAGES_DIR", tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def fail_commits(test_client, monkeypatch):
+    """Return a function that makes the commit of every following request fail (e.g. a lost connection)."""
+    def _fail_commits() -> TestClient:
+        session_factory = app.state.session_factory
+
+        def factory():
+            session = session_factory()
+
+            async def commit():
+                raise RuntimeError("connection lost")
+
+            session.commit = commit
+            return session
+
+        monkeypatch.setattr(app.state, "session_factory", factory)
+        return TestClient(app, raise_server_exceptions=False)
+    return _fail_commits
+
+
+class TestCreateConstructionWithImage:
+    def test_image_is_saved_with_the_construction(self, test_client: TestClient, images_dir):
+        response = test_client.post(
+            "/api/v1/constructions/with-image",
+            data={"name": "Site A", "status": "active"},
+            files={"file": ("photo.png", PNG_BYTES, "image/png")}
+        )
+
+        assert response.status_code == 201
+        saved = list(images_dir.iterdir())
+        assert len(saved) == 1
+        assert response.json()["img_url"].endswith(saved[0].name)
+
+    def test_image_is_removed_when_commit_fails(self, images_dir, fail_commits):
+        client = fail_commits()
+
+        response = client.post(
+            "/api/v1/constructions/with-image",
+            data={"name": "Site B", "status": "active"},
+            files={"file": ("photo.png", PNG_BYTES, "image/png")}
+        )
+
+        assert response.status_code == 500
+        assert list(images_dir.iterdir()) == []
+
+
+class TestUploadConstructionImage:
+    def test_new_image_is_removed_when_commit_fails(self, images_dir, create_construction, fail_commits):
+        construction_id = create_construction()["construction_id"]
+        client = fail_commits()
+
+        response = client.post(
+            f"/api/v1/constructions/{construction_id}/upload-image",
+            files={"file": ("photo.png", PNG_BYTES, "image/png")}
+        )
+
+        assert response.status_code == 500
+        assert list(images_dir.iterdir()) == []
+
+    def test_image_is_kept_when_update_succeeds(self, test_client: TestClient, images_dir, create_construction):
+        construction_id = create_construction()["construction_id"]
+
+        response = test_client.post(
+            f"/api/v1/constructions/{construction_id}/upload-image",
+            files={"file": ("photo.png", PNG_BYTES, "image/png")}
+        )
+
+        assert response.status_code == 200
+        assert [p.name for p in images_dir.iterdir()] == [f"{construction_id}_photo.png"]
@@ -1,30 +1,27 @@
 """
-Basic tests for Recipe AI Extractor API.
+Basic tests for Construction Manager API.
 """
 
 import pytest
 from fastapi.testclient import TestClient
-from main import app
 
-client = TestClient(app)
 
-
-def test_root_endpoint():
+def test_root_endpoint(test_client: TestClient):
     """Test root endpoint."""
-    response = client.get("/")
+    response = test_client.get("/")
     assert response.status_code == 200
-    assert "Recipe AI Extractor API" in response.json()["message"]
+    assert "Construction Manager API" in response.json()["message"]
 
 
-def test_health_check():
+def test_health_check(test_client: TestClient):
     """Test health check endpoint."""
-    response = client.get("/health")
+    response = test_client.get("/health")
     assert response.status_code == 200
     assert response.json()["status"] == "healthy"
 
 
-def test_api_health_check():
+def test_api_health_check(test_client: TestClient):
     """Test API health check endpoint."""
-    response = client.get("/api/v1/health")
+    response = test_client.get("/api/v1/health")
     assert response.status_code == 200
     assert response.json()["status"] == "healthy"
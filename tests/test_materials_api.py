@@ -0,0 +1,117 @@
+"""
+API tests for materials: keyset pagination, ETag handling and name uniqueness.
+"""
+
+from fastapi.testclient import TestClient
+
+
+class TestKeysetPagination:
+    """GET /materials/after - cursor (created_at, material_id) pagination."""
+
+    def test_walks_all_materials_newest_first_without_duplicates(self, test_client: TestClient, create_category):
+        category_id = create_category()["category_id"]
+        response = test_client.post(
+            "/api/v1/materials/bulk",
+            json=[
+                {"name": f"Material {i}", "category_id": category_id, "unit": "pieces", "description": ""}
+                for i in range(5)
+            ]
+        )
+        assert response.status_code == 201
+
+        seen = []
+        params = {"limit": 2}
+        while True:
+            page = test_client.get("/api/v1/materials/after", params=params).json()
+            if not page:
+                break
+            seen.extend(page)
+            last = page[-1]
+            params = {"limit": 2, "after_created_at": last["created_at"], "after_id": last["material_id"]}
+
+        assert len(seen) == 5
+        assert len({m["material_id"] for m in seen}) == 5
+        keys = [(m["created_at"], m["material_id"]) for m in seen]
+        assert keys == sorted(keys, reverse=True)
+
+    def test_cursor_needs_both_fields(self, test_client: TestClient, create_material):
+        material = create_material("Cable")
+
+        response = test_client.get("/api/v1/materials/after", params={"after_id": material["material_id"]})
+
+        assert response.status_code == 400
+
+
+class TestETag:
+    """ETag / If-None-Match on material reads."""
+
+    def test_get_material_returns_304_for_matching_etag(self, test_client: TestClient, create_material):
+        material = create_material("Socket")
+        url = f"/api/v1/materials/{material['material_id']}"
+
+        first = test_client.get(url)
+        etag = first.headers["etag"]
+        second = test_client.get(url, headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.headers["etag"] == etag
+        assert second.content == b""
+
+    def test_etag_changes_after_update(self, test_client: TestClient, create_material):
+        material = create_material("Switch")
+        url = f"/api/v1/materials/{material['material_id']}"
+        etag = test_client.get(url).headers["etag"]
+
+        assert test_client.put(url, json={"name": "Switch 2"}).status_code == 200
+        response = test_client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()["name"] == "Switch 2"
+        assert response.headers["etag"] != etag
+
+    def test_public_list_is_revalidated_after_write(self, test_client: TestClient, create_material):
+        create_material("Fuse")
+        first = test_client.get("/api/v1/materials/public")
+        cached = test_client.get("/api/v1/materials/public", headers={"If-None-Match": first.headers["etag"]})
+
+        create_material("Breaker")
+        refreshed = test_client.get("/api/v1/materials/public", headers={"If-None-Match": first.headers["etag"]})
+
+        assert cached.status_code == 304
+        assert refreshed.status_code == 200
+        assert {m["name"] for m in refreshed.json()} == {"Fuse", "Breaker"}
+
+
+class TestCaseInsensitiveNames:
+    """Material names are unique regardless of case (ix_materials_name_lower)."""
+
+    def test_bulk_rejects_names_differing_only_in_case(self, test_client: TestClient, create_category):
+        category_id = create_category()["category_id"]
+
+        response = test_client.post(
+            "/api/v1/materials/bulk",
+            json=[
+                {"name": name, "category_id": category_id, "unit": "pieces", "description": ""}
+                for name in ("Cement", "cement")
+            ]
+        )
+
+        assert response.status_code == 400
+        assert test_client.get("/api/v1/materials/").json()["total"] == 0
+
+    def test_update_rejects_name_of_another_material_in_different_case(self, test_client: TestClient, create_material):
+        create_material("Cement")
+        sand = create_material("Sand")
+
+        response = test_client.put(f"/api/v1/materials/{sand['material_id']}", json={"name": "CEMENT"})
+
+        assert response.status_code == 400
+
+    def test_update_may_change_case_of_own_name(self, test_client: TestClient, create_material):
+        sand = create_material("Sand")
+
+        response = test_client.put(f"/api/v1/materials/{sand['material_id']}", json={"name": "SAND"})
+
+        assert response.status_code == 200
+        assert response.json()["name"] == "SAND"
@@ -0,0 +1,176 @@
+"""
+Tests for the ASGI middleware: upload size limit and per-request transaction.
+"""
+
+import pytest
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+
+from src.infrastructure.api.cache import invalidate, list_cache
+from src.infrastructure.api.middleware import DBSessionMiddleware, UploadSizeLimitMiddleware
+from src.infrastructure.database.connection import current_session
+
+
+class FakeSession:
+    """Records commit/rollback calls in a shared event log."""
+
+    def __init__(self, events, fail_commit=False):
+        self.events = events
+        self.fail_commit = fail_commit
+        self.info = {}
+
+    async def commit(self):
+        self.events.append("commit")
+        if self.fail_commit:
+            raise RuntimeError("commit failed")
+
+    async def rollback(self):
+        self.events.append("rollback")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.events.append("close")
+
+
+def _session_app(events, fail_commit=False) -> FastAPI:
+    app = FastAPI()
+    app.state.session_factory = lambda: FakeSession(events, fail_commit)
+    app.add_middleware(DBSessionMiddleware, path_prefix="/api/")
+
+    @app.post("/api/ok")
+    async def ok():
+        assert current_session.get() is not None
+        invalidate("test")
+        events.append("handler")
+        return {"ok": True}
+
+    @app.post("/api/rejected")
+    async def rejected():
+        events.append("handler")
+        raise HTTPException(status_code=409, detail="conflict")
+
+    @app.post("/api/crash")
+    async def crash():
+        events.append("handler")
+        raise RuntimeError("boom")
+
+    @app.get("/outside")
+    async def outside():
+        return {"session": current_session.get() is not None}
+
+    return app
+
+
+class TestDBSessionMiddleware:
+    def test_successful_response_commits_before_sending(self):
+        events = []
+        client = TestClient(_session_app(events))
+
+        response = client.post("/api/ok")
+
+        assert response.status_code == 200
+        assert events == ["handler", "commit", "close"]
+
+    def test_error_status_rolls_back(self):
+        events = []
+        client = TestClient(_session_app(events))
+
+        response = client.post("/api/rejected")
+
+        assert response.status_code == 409
+        assert "commit" not in events
+        assert events[:2] == ["handler", "rollback"]
+
+    def test_unhandled_exception_rolls_back(self):
+        events = []
+        client = TestClient(_session_app(events), raise_server_exceptions=False)
+
+        response = client.post("/api/crash")
+
+        assert response.status_code == 500
+        assert "commit" not in events
+        assert "rollback" in events
+
+    def test_failed_commit_is_not_reported_as_success(self):
+        events = []
+        client = TestClient(_session_app(events, fail_commit=True), raise_server_exceptions=False)
+
+        response = client.post("/api/ok")
+
+        assert response.status_code == 500
+        assert events[:3] == ["handler", "commit", "rollback"]
+
+    def test_cache_is_cleared_again_after_commit(self):
+        events = []
+        app = _session_app(events)
+
+        @app.post("/api/refill")
+        async def refill():
+            invalidate("test")
+            # Read between the write and the commit puts old data back in the cache
+            list_cache.set("test", "page", "stale")
+            return {}
+
+        response = TestClient(app).post("/api/refill")
+
+        assert response.status_code == 200
+        assert list_cache.get("test", "page") is None
+
+    def test_paths_outside_prefix_get_no_session(self):
+        events = []
+        client = TestClient(_session_app(events))
+
+        assert client.get("/outside").json() == {"session": False}
+        assert events == []
+
+
+def _upload_app(max_body_size: int) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(UploadSizeLimitMiddleware, max_body_size=max_body_size, path_suffixes=("/upload-image",))
+
+    @app.post("/upload-image")
+    async def upload(request: Request):
+        return {"size": len(await request.body())}
+
+    @app.post("/other")
+    async def other(request: Request):
+        return {"size": len(await request.body())}
+
+    return app
+
+
+class TestUploadSizeLimitMiddleware:
+    def test_body_within_limit_passes(self):
+        client = TestClient(_upload_app(max_body_size=10))
+
+        response = client.post("/upload-image", content=b"x" * 10)
+
+        assert response.status_code == 200
+        assert response.json() == {"size": 10}
+
+    def test_declared_content_length_over_limit_is_rejected(self):
+        client = TestClient(_upload_app(max_body_size=10))
+
+        response = client.post("/upload-image", content=b"x" * 11)
+
+        assert response.status_code == 413
+
+    def test_chunked_body_over_limit_is_rejected(self):
+        client = TestClient(_upload_app(max_body_size=10))
+
+        def chunks():
+            for _ in range(4):
+                yield b"x" * 5
+
+        response = client.post("/upload-image", content=chunks())
+
+        assert response.status_code == 413
+
+    def test_other_paths_are_not_limited(self):
+        client = TestClient(_upload_app(max_body_size=10))
+
+        response = client.post("/other", content=b"x" * 100)
+
+        assert response.status_code == 200
@@ -3,217 +3,106 @@ Integration tests with mock data loaded.
 Tests API endpoints with real mock data from JSON files.
 """
 
+from decimal import Decimal
+from uuid import UUID
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
-from main import app
-from src.infrastructure.database.models import UserModel, RecipeModel, CatalogItemModel, RecipeItemModel
+from src.infrastructure.database.models import StorageItemModel
+
+ELECTRICAL_INSTALLATION_ID = "bb0e8400-e29b-41d4-a716-446655440001"
+CABLE_YDY_ID = "cc0e8400-e29b-41d4-a716-446655440001"
 
 
 class TestMockDataIntegration:
     """Test API endpoints with mock data."""
     
-    def test_users_endpoint_with_mock_data(self, test_client_with_mock_data: TestClient):
-        """Test users endpoint with mock data."""
-        response = test_client_with_mock_data.get("/api/v1/users")
+    def test_categories_endpoint_with_mock_data(self, test_client_with_mock_data: TestClient):
+        """Test categories endpoint with mock data."""
+        response = test_client_with_mock_data.get("/api/v1/categories/", params={"size": 100})
         
         assert response.status_code == 200
-        users = response.json()
-        
-        # Should have 7 users from mock data
-        assert len(users) == 7
+        data = response.json()
         
-        # Check admin user exists
-        admin_user = next((u for u in users if u["is_admin"]), None)
-        assert admin_user is not None
-        assert admin_user["email"] == "admin@example.com"
+        # Should have 8 categories from mock data
+        assert data["total"] == 8
+        names = [c["name"] for c in data["categories"]]
+        assert "Przewody i kable" in names
+        assert "Oświetlenie" in names
         
-        # Check all users have required fields
-        for user in users:
-            assert "id" in user
-            assert "email" in user
-            assert "is_admin" in user
-            assert "created_at" in user
+        for category in data["categories"]:
+            assert "category_id" in category
+            assert "created_at" in category
     
-    def test_recipes_endpoint_with_mock_data(self, test_client_with_mock_data: TestClient):
-        """Test recipes endpoint with mock data."""
-        response = test_client_with_mock_data.get("/api/v1/recipes")
+    def test_constructions_endpoint_with_mock_data(self, test_client_with_mock_data: TestClient):
+        """Test constructions endpoint with mock data."""
+        response = test_client_with_mock_data.get("/api/v1/constructions/", params={"size": 100})
         
         assert response.status_code == 200
-        recipes = response.json()
-        
-        # Should have 8 recipes from mock data
-        assert len(recipes) == 8
-        
-        # Check specific recipes exist
-        recipe_titles = [r["title"] for r in recipes]
-        assert "Klasyczne naleśniki" in recipe_titles
-        assert "Spaghetti Carbonara" in recipe_titles
-        assert "Zupa pomidorowa" in recipe_titles
+        data = response.json()
         
-        # Check all recipes have required fields
-        for recipe in recipes:
-            assert "id" in recipe
-            assert "user_id" in recipe
-            assert "title" in recipe
-            assert "preparation_steps" in recipe
-            assert "prep_time_minutes" in recipe
-            assert "created_at" in recipe
+        # Should have 6 constructions from mock data
+        assert data["total"] == 6
+        statuses = {c["status"] for c in data["constructions"]}
+        assert statuses == {"in_progress", "active", "inactive", "archived"}
     
-    def test_catalog_items_endpoint_with_mock_data(self, test_client_with_mock_data: TestClient):
-        """Test catalog items endpoint with mock data."""
-        response = test_client_with_mock_data.get("/api/v1/catalog-items")
+    def test_materials_endpoint_with_mock_data(self, test_client_with_mock_data: TestClient):
+        """Test materials endpoint with mock data."""
+        response = test_client_with_mock_data.get("/api/v1/materials/", params={"size": 100})
         
         assert response.status_code == 200
         data = response.json()
         
-        # Check response structure
-        assert "items" in data
-        assert "total" in data
-        assert "page" in data
-        assert "size" in data
-        
-        items = data["items"]
-        
-        # Should have 10 catalog items from mock data
-        assert len(items) == 10
-        
-        # Check specific ingredients exist
-        item_names = [i["name"] for i in items]
-        assert "Mąka pszenna" in item_names
-        assert "Jajka" in item_names
-        assert "Mleko" in item_names
-        assert "Masło" in item_names
-        
-        # Check all items have required fields
-        for item in items:
-            assert "item_id" in item
-            assert "name" in item
-            assert "last_used" in item
+        # Should have 27 materials from mock data
+        assert data["total"] == 27
+        for material in data["materials"]:
+            assert material["unit"] in ("meters", "pieces")
+            assert "category_id" in material
     
-    def test_recipe_items_relationships(self, db_session: Session, mock_data_loaded):
-        """Test that recipe items relationships are properly loaded."""
-        # Get a recipe with items
-        recipe = db_session.query(RecipeModel).filter(
-            RecipeModel.title == "Klasyczne naleśniki"
-        ).first()
-        
-        assert recipe is not None
-        
-        # Check recipe has items
-        recipe_items = db_session.query(RecipeItemModel).filter(
-            RecipeItemModel.recipe_id == recipe.recipe_id
-        ).all()
+    def test_material_search_with_mock_data(self, test_client_with_mock_data: TestClient):
+        """Fuzzy search finds a material by part of its name."""
+        response = test_client_with_mock_data.get("/api/v1/materials/search", params={"query": "YDY"})
         
-        assert len(recipe_items) > 0
-        
-        # Check each recipe item has valid relationships
-        for item in recipe_items:
-            assert item.recipe_id == recipe.recipe_id
-            assert item.item_id is not None
-            assert item.quantity_value is not None
-            assert item.quantity_unit is not None
+        assert response.status_code == 200
+        names = [m["name"] for m in response.json()["materials"]]
+        assert "Przewód YDY 3x2.5mm²" in names
     
-    def test_user_recipe_relationships(self, db_session: Session, mock_data_loaded):
-        """Test that user-recipe relationships are properly loaded."""
-        # Get a user with recipes
-        user = db_session.query(UserModel).filter(
-            UserModel.email == "anna.kowalski@example.com"
-        ).first()
+    def test_storage_items_merged_per_construction(self, db_session: Session, mock_data_loaded):
+        """Storage items from several storages of one construction are summed per material."""
+        item = db_session.get(StorageItemModel, (UUID(ELECTRICAL_INSTALLATION_ID), UUID(CABLE_YDY_ID)))
         
-        assert user is not None
-        
-        # Check user has recipes
-        user_recipes = db_session.query(RecipeModel).filter(
-            RecipeModel.user_id == user.user_id
-        ).all()
-        
-        assert len(user_recipes) > 0
-        
-        # Check all recipes belong to this user
-        for recipe in user_recipes:
-            assert recipe.user_id == user.user_id
+        assert item is not None
+        assert item.quantity_value == Decimal("700.00")
     
-    def test_catalog_item_usage(self, db_session: Session, mock_data_loaded):
-        """Test that catalog items are used in recipes."""
-        # Get a catalog item
-        flour = db_session.query(CatalogItemModel).filter(
-            CatalogItemModel.name == "Mąka pszenna"
-        ).first()
-        
-        assert flour is not None
-        
-        # Check flour is used in recipes
-        flour_usage = db_session.query(RecipeItemModel).filter(
-            RecipeItemModel.item_id == flour.item_id
-        ).all()
+    def test_storage_items_by_construction_endpoint(self, test_client_with_mock_data: TestClient):
+        """Test storage items of a construction."""
+        response = test_client_with_mock_data.get(
+            f"/api/v1/storage-items/construction/{ELECTRICAL_INSTALLATION_ID}",
+            params={"limit": 100}
+        )
         
-        assert len(flour_usage) > 0
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 14
+        assert all(i["construction_id"] == ELECTRICAL_INSTALLATION_ID for i in data["storage_items"])
+    
+    def test_construction_statistics_with_mock_data(self, test_client_with_mock_data: TestClient):
+        """Statistics report the number of materials and their total quantity per construction."""
+        response = test_client_with_mock_data.get("/api/v1/constructions/statistics")
         
-        # Check usage has valid quantities
-        for usage in flour_usage:
-            assert usage.quantity_value > 0
-            assert usage.quantity_unit in ["g", "kg", "szt", "łyżki", "łyżeczki"]
+        assert response.status_code == 200
+        stats = {s["construction_id"]: s for s in response.json()}
+        assert stats[ELECTRICAL_INSTALLATION_ID]["total_items"] == 14
+        assert stats[ELECTRICAL_INSTALLATION_ID]["total_quantity"] > 0
     
-    def test_mock_data_statistics(self, verify_mock_data_loaded):
+    def test_mock_data_statistics(self, verify_mock_data_loaded, mock_data_loaded):
         """Test that mock data statistics are correct."""
         stats = verify_mock_data_loaded()
         
         # Expected counts from mock data
-        assert stats["users"] == 7
-        assert stats["recipes"] == 8
-        assert stats["catalog_items"] == 10
-        assert stats["recipe_items"] == 33
-    
-    def test_recipe_with_external_url(self, test_client_with_mock_data: TestClient):
-        """Test recipe with external URL."""
-        response = test_client_with_mock_data.get("/api/v1/recipes")
-        recipes = response.json()
-        
-        # Find recipe with external URL
-        recipe_with_url = next(
-            (r for r in recipes if r["external_url"] is not None), 
-            None
-        )
-        
-        assert recipe_with_url is not None
-        assert recipe_with_url["external_url"].startswith("https://")
-    
-    def test_recipe_without_external_url(self, test_client_with_mock_data: TestClient):
-        """Test recipe without external URL."""
-        response = test_client_with_mock_data.get("/api/v1/recipes")
-        recipes = response.json()
-        
-        # Find recipe without external URL
-        recipe_without_url = next(
-            (r for r in recipes if r["external_url"] is None), 
-            None
-        )
-        
-        assert recipe_without_url is not None
-        assert recipe_without_url["external_url"] is None
-    
-    def test_quantity_units_diversity(self, db_session: Session, mock_data_loaded):
-        """Test that mock data has diverse quantity units."""
-        units = db_session.query(RecipeItemModel.quantity_unit).distinct().all()
-        unit_names = [unit[0] for unit in units]
-        
-        # Should have various units
-        expected_units = ["g", "ml", "szt", "łyżki", "łyżeczki", "szczypta"]
-        for unit in expected_units:
-            assert unit in unit_names
-    
-    def test_preparation_time_range(self, test_client_with_mock_data: TestClient):
-        """Test that recipes have realistic preparation times."""
-        response = test_client_with_mock_data.get("/api/v1/recipes")
-        recipes = response.json()
-        
-        prep_times = [r["prep_time_minutes"] for r in recipes]
-        
-        # All times should be positive
-        assert all(time > 0 for time in prep_times)
-        
-        # Should have variety in preparation times
-        assert min(prep_times) >= 15  # At least 15 minutes
-        assert max(prep_times) <= 150  # At most 2.5 hours
+        assert stats["categories"] == 8
+        assert stats["constructions"] == 6
+        assert stats["materials"] == 27
+        assert stats["storage_items"] == 50
@@ -0,0 +1,202 @@
+"""
+Repository tests against the SQLite test database.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from src.domain.entities.category import Category
+from src.domain.entities.materials import Materials
+from src.domain.entities.storage_item import StorageItem
+from src.infrastructure.database.repositories.category_repository_impl import CategoryRepositoryImpl
+from src.infrastructure.database.repositories.material_repository_impl import MaterialRepositoryImpl
+from src.infrastructure.database.repositories.storage_item_repository_impl import StorageItemRepositoryImpl
+from src.shared.exceptions import DatabaseError
+
+
+class TestStorageItemUpsert:
+    def test_upsert_adds_quantity_to_existing_item(self, run_in_session):
+        construction_id, material_id = uuid4(), uuid4()
+
+        async def work(session):
+            repository = StorageItemRepositoryImpl(session)
+            await repository.upsert(StorageItem(construction_id, material_id, Decimal("2.50")))
+            updated = await repository.upsert(StorageItem(construction_id, material_id, Decimal("1.25")))
+            stored = await repository.get_by_ids(construction_id, material_id)
+            return updated, stored
+
+        updated, stored = run_in_session(work)
+
+        assert updated.quantity_value == Decimal("3.75")
+        assert stored.quantity_value == Decimal("3.75")
+
+    def test_upsert_bulk_merges_duplicate_keys(self, run_in_session):
+        construction_id, cable, socket = uuid4(), uuid4(), uuid4()
+
+        async def work(session):
+            repository = StorageItemRepositoryImpl(session)
+            await repository.create(StorageItem(construction_id, cable, Decimal("10")))
+            result = await repository.upsert_bulk([
+                StorageItem(construction_id, cable, Decimal("1")),
+                StorageItem(construction_id, cable, Decimal("2")),
+                StorageItem(construction_id, socket, Decimal("5")),
+            ])
+            items, total = await repository.get_by_construction_id_with_count(construction_id)
+            return result, items, total
+
+        result, items, total = run_in_session(work)
+
+        assert {(item.material_id, item.quantity_value) for item in result} == {
+            (cable, Decimal("13.00")),
+            (socket, Decimal("5.00")),
+        }
+        assert total == 2
+        assert {item.material_id: item.quantity_value for item in items}[cable] == Decimal("13.00")
+
+
+class TestGetByIdMemo:
+    def test_second_lookup_in_session_skips_the_query(self, run_in_session):
+        async def work(session):
+            repository = CategoryRepositoryImpl(session)
+            category = await repository.create(Category(name="Cables"))
+            session.info.clear()
+
+            statements = []
+            listener = lambda *args: statements.append(args[2])
+            engine = session.bind.sync_engine
+            event.listen(engine, "before_cursor_execute", listener)
+            try:
+                first = await repository.get_by_id(category.id)
+                second = await CategoryRepositoryImpl(session).get_by_id(category.id)
+            finally:
+                event.remove(engine, "before_cursor_execute", listener)
+            return first, second, statements
+
+        first, second, statements = run_in_session(work)
+
+        assert first.name == second.name == "Cables"
+        assert len(statements) == 1
+
+    def test_memo_is_per_session(self, run_in_session):
+        async def work(session):
+            category = await CategoryRepositoryImpl(session).create(Category(name="Sockets"))
+            await session.commit()
+            return category.id
+
+        category_id = run_in_session(work)
+
+        async def rename(session):
+            repository = CategoryRepositoryImpl(session)
+            category = await repository.get_by_id(category_id)
+            category.set_name("Sockets 230V")
+            await repository.update(category)
+            await session.commit()
+
+        async def read(session):
+            return await CategoryRepositoryImpl(session).get_by_id(category_id)
+
+        run_in_session(rename)
+
+        assert run_in_session(read).name == "Sockets 230V"
+
+    def test_unsaved_changes_are_not_visible_to_later_lookups(self, run_in_session):
+        async def work(session):
+            repository = CategoryRepositoryImpl(session)
+            created = await repository.create(Category(name="Pipes"))
+            created.set_name("Pipes (created)")
+
+            category = await repository.get_by_id(created.id)
+            # The use case changes the entity, then fails before calling update()
+            category.set_name("Pipes (unsaved)")
+
+            return await repository.get_by_id(created.id)
+
+        assert run_in_session(work).name == "Pipes"
+
+
+class FakeAsyncpgSession:
+    """
+    AsyncSession stand-in on an asyncpg connection; like SQLAlchemy's asyncpg
+    adapter, the transaction begins with the first executed statement.
+    """
+
+    def __init__(self, begins_on_execute=True):
+        self.events = []
+        self.info = {}
+        self.in_transaction = False
+        self.begins_on_execute = begins_on_execute
+        self.copied = []
+        driver_connection = SimpleNamespace(
+            is_in_transaction=lambda: self.in_transaction,
+            transaction=self._savepoint,
+            copy_records_to_table=self._copy_records_to_table
+        )
+        self._connection = SimpleNamespace(get_raw_connection=self._raw_connection)
+        self._raw = SimpleNamespace(driver_connection=driver_connection)
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(driver="asyncpg"))
+
+    async def execute(self, statement):
+        self.events.append("execute")
+        if self.begins_on_execute:
+            self.in_transaction = True
+
+    async def connection(self):
+        return self._connection
+
+    async def _raw_connection(self):
+        return self._raw
+
+    @asynccontextmanager
+    async def _savepoint(self):
+        self.events.append("savepoint" if self.in_transaction else "begin")
+        yield
+
+    async def _copy_records_to_table(self, table_name, columns, records):
+        self.events.append("copy")
+        self.copied.extend(records)
+
+
+def _materials(count):
+    category_id = uuid4()
+    return [Materials(category_id=category_id, name=f"Material {i}") for i in range(count)]
+
+
+class TestMaterialCreateBulk:
+    def test_large_batch_is_copied_inside_the_request_transaction(self):
+        session = FakeAsyncpgSession()
+        materials = _materials(500)
+
+        created = asyncio.run(MaterialRepositoryImpl(session).create_bulk(materials))
+
+        assert created == materials
+        assert len(session.copied) == 500
+        assert session.events == ["execute", "savepoint", "copy"]
+
+    def test_copy_refuses_to_run_outside_a_transaction(self):
+        session = FakeAsyncpgSession(begins_on_execute=False)
+
+        with pytest.raises(DatabaseError):
+            asyncio.run(MaterialRepositoryImpl(session).create_bulk(_materials(500)))
+
+        assert "copy" not in session.events
+
+    def test_large_batch_without_asyncpg_uses_insert(self, run_in_session):
+        materials = _materials(600)
+
+        async def work(session):
+            repository = MaterialRepositoryImpl(session)
+            created = await repository.create_bulk(materials)
+            return created, await repository.count_all()
+
+        created, total = run_in_session(work)
+
+        assert [material.id for material in created] == [material.id for material in materials]
+        assert total == 600
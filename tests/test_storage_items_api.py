@@ -0,0 +1,88 @@
+"""
+API tests for storage items: list cache invalidation around the request commit.
+"""
+
+from uuid import UUID
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from src.infrastructure.api import storage_items
+from src.infrastructure.api.dependencies import get_storage_item_use_cases
+
+
+@pytest.fixture
+def read_before_commit(test_client, monkeypatch):
+    """
+    Arm a read of a construction's storage item list that runs in another
+    session right before the next request commits - like a concurrent GET
+    landing between the write and the commit.
+    """
+    session_factory = app.state.session_factory
+    armed = {}
+
+    def factory():
+        session = session_factory()
+        construction_id = armed.pop("construction_id", None)
+        if construction_id is not None:
+            commit = session.commit
+
+            async def commit_after_concurrent_read():
+                async with session_factory() as other:
+                    await storage_items.get_storage_items_by_construction(
+                        UUID(construction_id),
+                        limit=20,
+                        offset=0,
+                        storage_item_use_cases=await get_storage_item_use_cases(other)
+                    )
+                await commit()
+
+            session.commit = commit_after_concurrent_read
+        return session
+
+    monkeypatch.setattr(app.state, "session_factory", factory)
+
+    def _arm(construction_id: str) -> None:
+        armed["construction_id"] = construction_id
+    return _arm
+
+
+class TestStorageItemListCache:
+    def test_read_between_write_and_commit_does_not_leave_stale_list(
+        self,
+        test_client: TestClient,
+        create_construction,
+        create_material,
+        read_before_commit
+    ):
+        construction_id = create_construction()["construction_id"]
+        material_id = create_material("Cable")["material_id"]
+        list_url = f"/api/v1/storage-items/construction/{construction_id}"
+        assert test_client.get(list_url).json()["total"] == 0
+
+        read_before_commit(construction_id)
+        response = test_client.post(
+            "/api/v1/storage-items/",
+            json={"construction_id": construction_id, "material_id": material_id, "quantity_value": "5"}
+        )
+
+        assert response.status_code == 201
+        assert test_client.get(list_url).json()["total"] == 1
+
+    def test_update_is_visible_in_cached_list(self, test_client: TestClient, create_construction, create_material):
+        construction_id = create_construction()["construction_id"]
+        material_id = create_material("Socket")["material_id"]
+        test_client.post(
+            "/api/v1/storage-items/",
+            json={"construction_id": construction_id, "material_id": material_id, "quantity_value": "5"}
+        )
+        list_url = f"/api/v1/storage-items/construction/{construction_id}"
+        assert test_client.get(list_url).json()["storage_items"][0]["quantity_value"] == "5.00"
+
+        test_client.put(
+            f"/api/v1/storage-items/construction/{construction_id}/material/{material_id}",
+            json={"quantity_value": "7"}
+        )
+
+        assert test_client.get(list_url).json()["storage_items"][0]["quantity_value"] == "7.00"